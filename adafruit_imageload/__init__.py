@@ -30,15 +30,44 @@ try:
 except ImportError:
     pass
 
+from collections import namedtuple
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(
+ImageInfo = namedtuple("ImageInfo", ("format", "width", "height", "depth", "colors", "frames"))
+"""The properties of an image, as returned by `info`.
+
+``format`` is one of ``"bmp"``, ``"gif"``, ``"jpeg"``, ``"pbm"``, ``"pgm"``, ``"png"`` or
+``"ppm"``. ``width`` and ``height`` are in pixels. ``depth`` is the number of bits used for a
+pixel in the file. ``colors`` is the number of colors in the palette of the image, 0 for images
+without one. Those are loaded as RGB565 with a `displayio.ColorConverter`, except for ppm images
+which get a palette when they have few enough colors and 16 bit bmp images which are loaded in
+the colorspace they are stored in. ``frames`` is the number of frames,
+only animated gifs have more than one."""
+
+Band = namedtuple("Band", ("y", "height", "bitmap", "palette"))
+"""A band of rows of an image, as yielded by `bands`.
+
+``y`` is the first row of the image in the band and ``height`` the number of rows of the
+image in it, fewer than the height of ``bitmap`` for the last band. ``bitmap`` holds the
+rows, starting at its top, and is reused for every band. ``palette`` is the palette or
+`displayio.ColorConverter` for the whole image."""
+
+
+def load(  # noqa: PLR0913, PLR0912, Too many arguments in function definition, Too many branches
     file_or_filename: Union[str, BufferedReader],
     *,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    x: int = 0,
+    y: int = 0,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    scale: int = 1,
+    gray_palette: bool = False,
+    transparency: bool = False,
 ) -> Tuple[Bitmap, Optional[Union[Palette, ColorConverter]]]:
     """Load pixel values (indices or colors) into a bitmap and colors into a palette.
 
@@ -47,7 +76,156 @@ def load(
 
     palette is the desired palette type. The constructor should take the number of colors and
     support assignment to indices via [].
+
+    Netpbm files are read from start to end, so they can be loaded from a stream that can't
+    seek, except for a part or a scaled down copy of a binary one. The other formats need a
+    file that can seek.
+
+    x, y, width and height select the part of the image to load, by default all of it. The
+    bitmap is only as big as that part. A width or height of None goes to the edge of the
+    image. BMP and binary netpbm files seek past the rest of the image, the other formats
+    decode it but don't store it. Not supported for JPG files.
+
+    scale shrinks the image while it is loaded, to a half, a quarter or an eighth of its size
+    with a scale of 2, 4 or 8. Every scale-th pixel of every scale-th row is kept, so the
+    bitmap is only allocated at the reduced size. JPG files are scaled by the decoder.
+
+    gray_palette loads 8 and 16 bit grayscale PNG files as indices into a palette of 256 gray
+    levels, instead of as RGB565 colors. That takes half of the memory.
+
+    transparency makes the pixels of PNG files with an alpha channel, and of 32 bit BMP files
+    with an alpha mask, transparent when they are less than half opaque. Without an alpha mask
+    the fourth byte of a 32 bit BMP pixel is padding. Transparent pixels are loaded as a key
+    value that the returned palette or ColorConverter treats as transparent, so the bitmap can
+    be shown over a background with no blending when it is drawn.
     """
+    crop = None
+    if x or y or width is not None or height is not None:
+        crop = (x, y, width, height)
+    bitmap, palette = _default_types(bitmap, palette)
+
+    file, header = _open(file_or_filename)
+    with file:
+        if header.startswith(b"BM"):
+            from . import bmp
+
+            return bmp.load(
+                file,
+                bitmap=bitmap,
+                palette=palette,
+                crop=crop,
+                scale=scale,
+                transparency=transparency,
+            )
+        if header.startswith(b"P"):
+            from . import pnm
+
+            return pnm.load(file, header, bitmap=bitmap, palette=palette, crop=crop, scale=scale)
+        if header.startswith(b"GIF"):
+            if not bitmap:
+                raise RuntimeError("bitmap argument required")
+
+            from . import gif
+
+            return gif.load(file, bitmap=bitmap, palette=palette, crop=crop, scale=scale)
+        if header.startswith(b"\x89PN"):
+            if not bitmap:
+                raise RuntimeError("bitmap argument required")
+            from . import png
+
+            return png.load(
+                file,
+                bitmap=bitmap,
+                palette=palette,
+                crop=crop,
+                scale=scale,
+                gray_palette=gray_palette,
+                transparency=transparency,
+            )
+        if header.startswith(b"\xff\xd8"):
+            if not bitmap:
+                raise RuntimeError("bitmap argument required")
+            if crop:
+                raise NotImplementedError("Loading part of a JPG is not supported")
+            from . import jpg
+
+            return jpg.load(file, bitmap=bitmap, scale=scale)
+        raise RuntimeError("Unsupported image format")
+
+
+def bands(
+    file_or_filename: Union[str, BufferedReader],
+    rows: int = 16,
+    *,
+    bitmap: Optional[BitmapConstructor] = None,
+    palette: Optional[PaletteConstructor] = None,
+    gray_palette: bool = False,
+) -> Iterator[Band]:
+    """Load an image a band of ``rows`` rows at a time, yielding each band as a `Band`.
+
+    Only a bitmap of ``rows`` rows is allocated and it is reused for every band, so images
+    bigger than the free memory can be sent to a display in pieces. A band must be shown
+    (or copied) before the next one is requested. Bands are yielded in the order the rows
+    are stored, which is from the bottom up for compressed BMP files.
+
+    .. code-block:: python
+
+        for band in adafruit_imageload.bands("/big.bmp", 16):
+            send_to_display(band.bitmap, band.palette, 0, band.y, band.height)
+
+    Supported for BMP, netpbm and non-interlaced PNG files. Netpbm color images are always
+    loaded as RGB565, as their palette is not known until the whole image has been read.
+    gray_palette is the same as for `load`.
+    """
+    bitmap, palette = _default_types(bitmap, palette)
+    if not bitmap:
+        raise RuntimeError("bitmap argument required")
+
+    file, header = _open(file_or_filename)
+    with file:
+        if header.startswith(b"BM"):
+            from . import bmp
+
+            yield from bmp.bands(file, rows, bitmap=bitmap, palette=palette)
+        elif header.startswith(b"P"):
+            from . import pnm
+
+            yield from pnm.bands(file, header, rows, bitmap=bitmap, palette=palette)
+        elif header.startswith(b"\x89PN"):
+            from . import png
+
+            yield from png.bands(
+                file, rows, bitmap=bitmap, palette=palette, gray_palette=gray_palette
+            )
+        elif header.startswith((b"GIF", b"\xff\xd8")):
+            raise NotImplementedError("Loading GIF or JPG files in bands is not supported")
+        else:
+            raise RuntimeError("Unsupported image format")
+
+
+def _open(file_or_filename: Union[str, BufferedReader]) -> Tuple[BufferedReader, bytes]:
+    """Open ``file_or_filename`` if it is a filename, and read the first bytes of the image,
+    which tell its format. Returns the file, moved back to its start for all formats but
+    netpbm, and the bytes."""
+    if isinstance(file_or_filename, str):
+        file = open(file_or_filename, "rb")
+    else:
+        file = file_or_filename
+    try:
+        header = file.read(3)
+        # netpbm files are read on from the header, so they don't have to be seekable
+        if not header.startswith(b"P"):
+            file.seek(0)
+    except Exception:
+        file.close()
+        raise
+    return file, header
+
+
+def _default_types(
+    bitmap: Optional[BitmapConstructor], palette: Optional[PaletteConstructor]
+) -> Tuple[Optional[BitmapConstructor], Optional[PaletteConstructor]]:
+    """Fill in the displayio types for a ``bitmap`` or ``palette`` that was not given."""
     if not bitmap or not palette:
         try:
             # use displayio if available
@@ -60,38 +238,36 @@ def load(
         except ModuleNotFoundError:
             # meh, we tried
             pass
+    return bitmap, palette
 
-    if isinstance(file_or_filename, str):
-        open_file = open(file_or_filename, "rb")
-    else:
-        open_file = file_or_filename
 
-    with open_file as file:
-        header = file.read(3)
-        file.seek(0)
+def info(file_or_filename: Union[str, BufferedReader]) -> ImageInfo:
+    """Read the size and other properties of an image, returned as an `ImageInfo`.
+
+    Only the headers of the image are read, no bitmap or palette is created, so this is
+    much faster than `load` and uses very little memory. For gifs the frames are counted
+    by skipping over their data without decoding it.
+    """
+    file, header = _open(file_or_filename)
+    with file:
         if header.startswith(b"BM"):
             from . import bmp
 
-            return bmp.load(file, bitmap=bitmap, palette=palette)
+            return bmp.info(file)
         if header.startswith(b"P"):
             from . import pnm
 
-            return pnm.load(file, header, bitmap=bitmap, palette=palette)
+            return pnm.info(file, header)
         if header.startswith(b"GIF"):
-            if not bitmap:
-                raise RuntimeError("bitmap argument required")
-
             from . import gif
 
-            return gif.load(file, bitmap=bitmap, palette=palette)
+            return gif.info(file)
         if header.startswith(b"\x89PN"):
-            if not bitmap:
-                raise RuntimeError("bitmap argument required")
             from . import png
 
-            return png.load(file, bitmap=bitmap, palette=palette)
+            return png.info(file)
         if header.startswith(b"\xff\xd8"):
             from . import jpg
 
-            return jpg.load(file, bitmap=bitmap)
+            return jpg.info(file)
         raise RuntimeError("Unsupported image format")
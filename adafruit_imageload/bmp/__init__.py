@@ -15,7 +15,7 @@ Load pixel values (indices or colors) into a bitmap and colors into a palette fr
 
 try:
     from io import BufferedReader
-    from typing import List, Optional, Set, Tuple, Union
+    from typing import Iterator, List, Optional, Set, Tuple, Union
 
     from displayio import Bitmap, ColorConverter, Palette
 
@@ -23,15 +23,22 @@ try:
 except ImportError:
     pass
 
+import sys
+
+from .. import Band, ImageInfo
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(
+def load(  # noqa: PLR0913 Too many arguments in function definition
     file: BufferedReader,
     *,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+    transparency: bool = False,
 ) -> Tuple[Optional[Bitmap], Optional[Union[Palette, ColorConverter]]]:
     """Loads a bmp image from the open ``file``.
 
@@ -42,27 +49,182 @@ def load(
       with the data of a BMP file.
     :param object bitmap: Type to store bitmap data. Must have API similar to `displayio.Bitmap`.
       Will be skipped if None
+    :param object palette: Type to store the palette. Must have API similar to
+      `displayio.Palette`. Will be skipped if None
+    :param tuple crop: The x, y, width and height of the part of the image to load, the
+      whole image if None. Only the rows and bytes of uncompressed images that are needed
+      are read.
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller, keeping every scale-th
+      pixel of every scale-th row
+    :param bool transparency: Make the pixels of 32 bit images with an alpha mask that are
+      less than half opaque transparent, see `adafruit_imageload.bmp.truecolor.load`"""
+    (
+        data_start,
+        bmp_header_length,
+        _width,
+        _height,
+        top_down,
+        color_depth,
+        compression,
+        colors,
+    ) = _read_header(file)
+    bitfield_masks = _read_bitfield_masks(file, bmp_header_length, color_depth, compression)
+
+    if colors == 0 and color_depth >= 16:
+        from . import truecolor
+
+        return truecolor.load(
+            file,
+            _width,
+            _height,
+            data_start,
+            color_depth,
+            bitfield_masks,
+            bitmap=bitmap,
+            crop=crop,
+            scale=scale,
+            transparency=transparency,
+            top_down=top_down,
+        )
+    if colors == 0:
+        colors = 2**color_depth
+    from . import indexed
+
+    return indexed.load(
+        file,
+        _width,
+        _height,
+        data_start,
+        colors,
+        color_depth,
+        compression,
+        bitmap=bitmap,
+        palette=palette,
+        crop=crop,
+        scale=scale,
+        top_down=top_down,
+    )
+
+
+def bands(
+    file: BufferedReader,
+    rows: int = 16,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+) -> Iterator[Band]:
+    """Loads a bmp image from the open ``file`` a band of ``rows`` rows at a time, see
+    `adafruit_imageload.bands`.
+
+    :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
+      with the data of a BMP file.
+    :param int rows: The height of each band
+    :param object bitmap: Type to store bitmap data. Must have API similar to `displayio.Bitmap`.
     :param object palette: Type to store the palette. Must have API similar to
       `displayio.Palette`. Will be skipped if None"""
+    (
+        data_start,
+        bmp_header_length,
+        width,
+        height,
+        top_down,
+        color_depth,
+        compression,
+        colors,
+    ) = _read_header(file)
+    bitfield_masks = _read_bitfield_masks(file, bmp_header_length, color_depth, compression)
+    if colors == 0 and color_depth >= 16:
+        from . import truecolor
+
+        yield from truecolor.bands(
+            file,
+            width,
+            height,
+            data_start,
+            color_depth,
+            bitfield_masks,
+            rows,
+            bitmap=bitmap,
+            top_down=top_down,
+        )
+        return
+    if colors == 0:
+        colors = 2**color_depth
+    from . import indexed
+
+    yield from indexed.bands(
+        file,
+        width,
+        height,
+        data_start,
+        colors,
+        color_depth,
+        compression,
+        rows,
+        bitmap=bitmap,
+        palette=palette,
+        top_down=top_down,
+    )
+
+
+def info(file: BufferedReader) -> ImageInfo:
+    """Read the size and color depth of the bmp image in the open ``file``,
+    without loading any pixels.
+
+    :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
+      with the data of a BMP file."""
+    _, _, width, height, _, color_depth, _, colors = _read_header(file)
+    if colors == 0 and color_depth < 16:
+        colors = 2**color_depth
+    return ImageInfo("bmp", width, height, color_depth, colors, 1)
+
+
+def _read_header(file: BufferedReader) -> Tuple[int, int, int, int, bool, int, int, int]:
+    """Read the data start, header length, width, height, bits per pixel, compression
+    and number of palette colors from the header. The height is returned as a number of
+    rows, followed by whether they are stored from the top down, which is what a negative
+    height means."""
     file.seek(10)
     data_start = int.from_bytes(file.read(4), "little")
     file.seek(14)
     bmp_header_length = int.from_bytes(file.read(4), "little")
-    # print(bmp_header_length)
     file.seek(0x12)  # Width of the bitmap in pixels
-    _width = int.from_bytes(file.read(4), "little")
+    width = int.from_bytes(file.read(4), "little")
     try:
-        _height = int.from_bytes(file.read(4), "little")
+        height = int.from_bytes(file.read(4), "little")
     except OverflowError as error:
         raise NotImplementedError(
             "Negative height BMP files are not supported on builds without longint"
         ) from error
+    if sys.maxsize > 1073741823:
+        from .negative_height_check import negative_height_check
+
+        # convert unsigned int to signed int when height is negative
+        height = negative_height_check(height)
+    top_down = height < 0
     file.seek(0x1C)  # Number of bits per pixel
     color_depth = int.from_bytes(file.read(2), "little")
     file.seek(0x1E)  # Compression type
     compression = int.from_bytes(file.read(2), "little")
     file.seek(0x2E)  # Number of colors in the color palette
     colors = int.from_bytes(file.read(4), "little")
+    return (
+        data_start,
+        bmp_header_length,
+        width,
+        abs(height),
+        top_down,
+        color_depth,
+        compression,
+        colors,
+    )
+
+
+def _read_bitfield_masks(
+    file: BufferedReader, bmp_header_length: int, color_depth: int, compression: int
+) -> Optional[dict]:
+    """Read the red, green, blue and alpha masks of bitfield compressed images, None for
+    the rest. Raises NotImplementedError for compression types that are not supported."""
     bitfield_masks = None
     if compression == 3 and bmp_header_length >= 56:
         bitfield_masks = {}
@@ -73,34 +235,9 @@ def load(
         bitfield_masks["green"] = int.from_bytes(file.read(4), endianess)
         file.seek(0x3E)
         bitfield_masks["blue"] = int.from_bytes(file.read(4), endianess)
+        file.seek(0x42)
+        bitfield_masks["alpha"] = int.from_bytes(file.read(4), endianess)
 
     if compression > 3:
         raise NotImplementedError("bitmask compression unsupported")
-
-    if colors == 0 and color_depth >= 16:
-        from . import truecolor
-
-        return truecolor.load(
-            file,
-            _width,
-            _height,
-            data_start,
-            color_depth,
-            bitfield_masks,
-            bitmap=bitmap,
-        )
-    if colors == 0:
-        colors = 2**color_depth
-    from . import indexed
-
-    return indexed.load(
-        file,
-        _width,
-        _height,
-        data_start,
-        colors,
-        color_depth,
-        compression,
-        bitmap=bitmap,
-        palette=palette,
-    )
+    return bitfield_masks
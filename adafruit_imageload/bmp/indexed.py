@@ -13,11 +13,9 @@ Load pixel values (indices or colors) into a bitmap and colors into a palette fr
 
 """
 
-import sys
-
 try:
     from io import BufferedReader
-    from typing import Optional, Tuple
+    from typing import Iterable, Iterator, Optional, Tuple
 
     from displayio import Bitmap, Palette
 
@@ -30,12 +28,22 @@ try:
 except ImportError:
     _bitmap_readinto = None
 
+from .. import Band
+from ..row_writer import (
+    RowWriter,
+    crop_window,
+    kept_rows,
+    scaled_size,
+    unpack,
+    unpack_table,
+    write_bands,
+)
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(  # noqa:  PLR0913, PLR0912, Too many arguments in function definition, Too many branches
+def load(  # noqa: PLR0913, PLR0912, Too many arguments in function definition, Too many branches
     file: BufferedReader,
     width: int,
     height: int,
@@ -46,6 +54,9 @@ def load(  # noqa:  PLR0913, PLR0912, Too many arguments in function definition,
     *,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+    top_down: bool = False,
 ) -> Tuple[Optional[Bitmap], Optional[Palette]]:
     """Loads indexed bitmap data into bitmap and palette objects.
 
@@ -58,90 +69,175 @@ def load(  # noqa:  PLR0913, PLR0912, Too many arguments in function definition,
     :param int compression: 0 - none, 1 - 8bit RLE, 2 - 4bit RLE
     :param BitmapConstructor bitmap: a function that returns a displayio.Bitmap
     :param PaletteConstructor palette: a function that returns a displayio.Palette
+    :param tuple crop: The x, y, width and height of the part of the image to load, the
+      whole image if None
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller, only the rows that are
+      kept are read from uncompressed images
+    :param bool top_down: Whether the rows are stored from the top down, as they are when
+      the height in the header is negative, instead of from the bottom up
     """
-    palette_obj = None
-    if palette:
-        palette_obj = palette(colors)
-
-        file.seek(data_start - colors * 4)
-        for value in range(colors):
-            c_bytes = file.read(4)
-            # Need to swap red & blue bytes (bytes 0 and 2)
-            palette_obj[value] = bytes(
-                b"".join([c_bytes[2:3], c_bytes[1:2], c_bytes[0:1], c_bytes[3:1]])
-            )
+    palette_obj = _read_palette(file, data_start, colors, palette)
 
     bitmap_obj = None
     if bitmap:
-        minimum_color_depth = 1
-        while colors > 2**minimum_color_depth:
-            minimum_color_depth *= 2
-
-        if sys.maxsize > 1073741823:
-            from .negative_height_check import negative_height_check
-
-            # convert unsigned int to signed int when height is negative
-            height = negative_height_check(height)
-        bitmap_obj = bitmap(width, abs(height), colors)
+        left, top, crop_width, crop_height = crop_window(crop, width, height)
+        bitmap_obj = bitmap(scaled_size(crop_width, scale), scaled_size(crop_height, scale), colors)
         file.seek(data_start)
-        line_size = width // (8 // color_depth)
-        if width % (8 // color_depth) != 0:
-            line_size += 1
-        if line_size % 4 != 0:
-            line_size += 4 - line_size % 4
-
-        mask = (1 << minimum_color_depth) - 1
-        if height > 0:
-            range1 = height - 1
-            range2 = -1
-            range3 = -1
-        else:
-            range1 = 0
-            range2 = abs(height)
-            range3 = 1
 
         if compression == 0:
-            if _bitmap_readinto:
+            if _bitmap_readinto and crop is None and scale == 1:
                 _bitmap_readinto(
                     bitmap_obj,
                     file,
                     bits_per_pixel=color_depth,
                     element_size=4,
                     reverse_pixels_in_element=True,
-                    reverse_rows=True,
+                    reverse_rows=not top_down,
                 )
 
-            else:  # use the standard file.readinto
-                chunk = bytearray(line_size)
-                for y in range(range1, range2, range3):
-                    file.readinto(chunk)
-                    pixels_per_byte = 8 // color_depth
-                    offset = y * width
-
-                    for x in range(width):
-                        i = x // pixels_per_byte
-                        pixel = (chunk[i] >> (8 - color_depth * (x % pixels_per_byte + 1))) & mask
-                        bitmap_obj[offset + x] = pixel
+            else:  # use the standard file.readinto, for just the bytes in the crop
+                rows = kept_rows(top, crop_height, scale, not top_down)
+                writer = RowWriter(bitmap_obj, colors, left, top, scale=scale)
+                for _ in _read_rows(
+                    file, writer, rows, width, height, top_down, data_start, colors, color_depth
+                ):
+                    pass
         elif compression in (1, 2):
-            decode_rle(
-                bitmap=bitmap_obj,
+            # decoding starts from the first row in the file and stops past the crop
+            if not top_down:
+                y_range = (height - 1, top - 1, -1)
+            else:
+                y_range = (0, top + crop_height, 1)
+            for _ in decode_rle(
+                writer=RowWriter(bitmap_obj, colors, left, top, width, scale),
                 file=file,
                 compression=compression,
-                y_range=(range1, range2, range3),
+                y_range=y_range,
                 width=width,
-            )
+            ):
+                pass
 
     return bitmap_obj, palette_obj
 
 
-def decode_rle(  # noqa: PLR0912 Too many branches
-    bitmap: Bitmap,
+def bands(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    width: int,
+    height: int,
+    data_start: int,
+    colors: int,
+    color_depth: int,
+    compression: int,
+    rows: int = 16,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+    top_down: bool = False,
+) -> Iterator[Band]:
+    """Loads indexed bitmap data a band of ``rows`` rows at a time, see
+    `adafruit_imageload.bands`. Uncompressed images are read from the top down, whichever
+    way up they are stored, RLE compressed images in the order they are stored.
+
+    The other parameters are the same as for `load`.
+    """
+    palette_obj = _read_palette(file, data_start, colors, palette)
+    bitmap_obj = bitmap(width, min(rows, height), colors)
+    writer = RowWriter(bitmap_obj, colors, row_width=width)
+    if compression in (1, 2):
+        file.seek(data_start)
+        y_range = (0, height, 1) if top_down else (height - 1, -1, -1)
+        decoder = decode_rle(writer, file, compression, y_range, width)
+    else:
+        decoder = _read_rows(
+            file, writer, range(height), width, height, top_down, data_start, colors, color_depth
+        )
+    yield from write_bands(decoder, writer, height, palette_obj)
+
+
+def _read_palette(
+    file: BufferedReader, data_start: int, colors: int, palette: Optional[PaletteConstructor]
+) -> Optional[Palette]:
+    """Read the color table, just before the pixel data. Returns None without a ``palette``."""
+    palette_obj = None
+    if palette:
+        palette_obj = palette(colors)
+
+        file.seek(data_start - colors * 4)
+        for value in range(colors):
+            c_bytes = file.read(4)
+            # Need to swap red & blue bytes (bytes 0 and 2)
+            palette_obj[value] = bytes(
+                b"".join([c_bytes[2:3], c_bytes[1:2], c_bytes[0:1], c_bytes[3:1]])
+            )
+    return palette_obj
+
+
+def _read_rows(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    writer: RowWriter,
+    rows: Iterable[int],
+    width: int,
+    height: int,
+    top_down: bool,
+    data_start: int,
+    colors: int,
+    color_depth: int,
+) -> Iterator[int]:
+    """
+    Generator to read ``rows`` of an uncompressed image into ``writer``, seeking to each
+    in turn, and yielding the number of each row before it is written. Only the bytes of
+    the columns of the bitmap of the writer are read. They are unpacked a whole byte at a
+    time with a table, unless they are 8 bit values that are written as they are, and the
+    writer drops the pixels it does not keep.
+    """
+    line_size = width // (8 // color_depth)
+    if width % (8 // color_depth) != 0:
+        line_size += 1
+    if line_size % 4 != 0:
+        line_size += 4 - line_size % 4
+
+    left = writer.x
+    scale = writer.scale
+    count = writer.width
+    minimum_color_depth = 1
+    while colors > 2**minimum_color_depth:
+        minimum_color_depth *= 2
+    mask = (1 << minimum_color_depth) - 1
+    pixels_per_byte = 8 // color_depth
+    first_byte = left // pixels_per_byte
+    chunk = bytearray((left + (count - 1) * scale) // pixels_per_byte + 1 - first_byte)
+    pixels = chunk
+    table = None
+    # values that don't fit the colors of the bitmap are masked, as they are unpacked
+    if color_depth < 8 or mask < 0xFF:
+        table = unpack_table(color_depth, mask)
+        pixels = bytearray(len(chunk) * pixels_per_byte)
+    length = len(chunk) * pixels_per_byte
+    for y in rows:
+        stored_row = y if top_down else height - 1 - y
+        file.seek(data_start + stored_row * line_size + first_byte)
+        file.readinto(chunk)
+        yield y
+
+        if table is not None:
+            unpack(chunk, pixels, length, table)
+        writer.flush(y, first_byte * pixels_per_byte, length, pixels)
+
+
+def decode_rle(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
+    writer: RowWriter,
     file: BufferedReader,
     compression: int,
     y_range: Tuple[int, int, int],
     width: int,
-) -> None:
-    """Helper to decode RLE images"""
+) -> Iterator[int]:
+    """Generator to decode RLE images, writing each run into the bitmap of ``writer``.
+    Yields the number of the first row, and of each row it moves on to, before writing to it.
+
+    Runs and literals are expanded into the row of the writer, which is flushed once for
+    each stretch of a scan line that they cover, and the same buffers are used for the
+    whole image.
+    """
 
     # RLE algorithm, either 8-bit (1) or 4-bit (2)
     #
@@ -159,6 +255,10 @@ def decode_rle(  # noqa: PLR0912 Too many branches
     # up to an even byte count, so we need space for 256 in the case of
     # 8-bit.) 4-bit images can get away with half that.
     literal_buf = bytearray(128 if is_4bit else 256)
+    # We use memoryviews to artificially limit the length of literal_buf so
+    # that readinto only reads the amount that we want.
+    literal_mem = memoryview(literal_buf)
+    nibbles: Tuple[bytes, ...] = unpack_table(4) if is_4bit else ()
 
     # We iterate with numbers rather than a range because the "delta"
     # command can cause us to jump forward arbitrarily in the output
@@ -169,10 +269,14 @@ def decode_rle(  # noqa: PLR0912 Too many branches
     (range1, range2, range3) = y_range
     y = range1
     x = 0
+    row_mem = memoryview(writer.row)
+    # the first column of the stretch of the current scan line in the row
+    start = 0
+    yield y
+    # after the yield, which may move the writer on to the band of the row
+    keep = writer.keeps(y)
 
     while y * range3 < range2 * range3:
-        offset = y * width + x
-
         # We keep track of how much space is left in our row so that we
         # can avoid writing extra data outside of the Bitmap. While the
         # reference above seems to say that the "end run" command is
@@ -184,25 +288,31 @@ def decode_rle(  # noqa: PLR0912 Too many branches
         # file is 15px wide but has data for 16px.
         width_remaining = width - x
 
-        file.readinto(run_buf)
+        if file.readinto(run_buf) < 2:
+            break
 
         if run_buf[0] == 0:
             # A repeat length of "0" is a special command. The next byte
             # tells us what needs to happen.
-            if run_buf[1] == 0:
-                # end of the current scan line
-                y = y + range3
-                x = 0
-            elif run_buf[1] == 1:
+            if run_buf[1] == 1:
                 # end of image
                 break
-            elif run_buf[1] == 2:
-                # delta command jumps us ahead in the bitmap output by
-                # the x, y amounts stored in the next 2 bytes.
-                file.readinto(run_buf)
-
-                x = x + run_buf[0]
-                y = y + run_buf[1] * range3
+            if run_buf[1] in {0, 2}:
+                if keep and start < x:
+                    writer.flush(y, start, min(x, width) - start, row_mem[start:])
+                if run_buf[1] == 0:
+                    # end of the current scan line
+                    y = y + range3
+                    x = 0
+                else:
+                    # delta command jumps us ahead in the bitmap output by
+                    # the x, y amounts stored in the next 2 bytes.
+                    file.readinto(run_buf)
+                    x = x + run_buf[0]
+                    y = y + run_buf[1] * range3
+                start = x
+                yield y
+                keep = writer.keeps(y)
             else:
                 # command values of 3 or more indicate that many pixels
                 # of literal (uncompressed) image data. For 8-bit mode,
@@ -220,46 +330,52 @@ def decode_rle(  # noqa: PLR0912 Too many branches
                 if read_length_bytes % 2 == 1:
                     read_length_bytes += 1
 
-                # We use memoryview to artificially limit the length of
-                # literal_buf so that readinto only reads the amount
-                # that we want.
-                literal_buf_mem = memoryview(literal_buf)
-                file.readinto(literal_buf_mem[0:read_length_bytes])
+                file.readinto(literal_mem[0:read_length_bytes])
 
-                if is_4bit:
-                    for i in range(0, min(literal_length_px, width_remaining)):
-                        # Expanding the two nibbles of the 4-bit data
-                        # into two bytes for our output bitmap.
-                        if i % 2 == 0:
-                            bitmap[offset + i] = literal_buf[i // 2] >> 4
-                        else:
-                            bitmap[offset + i] = literal_buf[i // 2] & 0x0F
-                else:
-                    # 8-bit values are just a raw copy (limited by
-                    # what’s left in the row so we don’t overflow out of
-                    # the buffer)
-                    for i in range(0, min(literal_length_px, width_remaining)):
-                        bitmap[offset + i] = literal_buf[i]
+                count = min(literal_length_px, width_remaining)
+                if keep and count > 0:
+                    if is_4bit:
+                        # Expanding the two nibbles of each byte of the 4-bit
+                        # data into two bytes for our output bitmap.
+                        unpack(literal_mem, row_mem[x:], count, nibbles)
+                    else:
+                        # 8-bit values are just a raw copy (limited by
+                        # what’s left in the row so we don’t overflow out of
+                        # the buffer)
+                        row_mem[x : x + count] = literal_mem[0:count]
 
                 x = x + literal_length_px
         else:
             # first byte was not 0, which means it tells us how much to
             # repeat the next byte into the output
             run_length_px = run_buf[0]
-
-            if is_4bit:
-                # In 4 bit mode, we repeat the *two* values that are
-                # packed into the next byte. The repeat amount is based
-                # on pixels, not bytes, though, so if we were to repeat
-                # 0xab 3 times, the output pixel values would be: 0x0a
-                # 0x0b 0x0a (notice how it ends at 0x0a) rather than
-                # 0x0a 0x0b 0x0a 0x0b 0x0a 0x0b
-                run_values = [run_buf[1] >> 4, run_buf[1] & 0x0F]
-                for i in range(0, min(run_length_px, width_remaining)):
-                    bitmap[offset + i] = run_values[i % 2]
-            else:
-                run_value = run_buf[1]
-                for i in range(0, min(run_length_px, width_remaining)):
-                    bitmap[offset + i] = run_value
+            count = min(run_length_px, width_remaining)
+            if keep and count > 0:
+                if is_4bit:
+                    # In 4 bit mode, we repeat the *two* values that are
+                    # packed into the next byte. The repeat amount is based
+                    # on pixels, not bytes, though, so if we were to repeat
+                    # 0xab 3 times, the output pixel values would be: 0x0a
+                    # 0x0b 0x0a (notice how it ends at 0x0a) rather than
+                    # 0x0a 0x0b 0x0a 0x0b 0x0a 0x0b
+                    _fill_span(row_mem, x, count, run_buf[1] >> 4, run_buf[1] & 0x0F)
+                else:
+                    _fill_span(row_mem, x, count, run_buf[1], run_buf[1])
 
             x = x + run_length_px
+
+    if keep and start < x:
+        writer.flush(y, start, min(x, width) - start, row_mem[start:])
+
+
+def _fill_span(row: memoryview, x: int, count: int, first: int, second: int) -> None:
+    """Fill ``count`` values of ``row`` from ``x`` on with ``first`` and ``second`` in
+    turn, doubling the filled part with each copy rather than setting every value."""
+    row[x] = first
+    if count > 1:
+        row[x + 1] = second
+    filled = 2
+    while filled < count:
+        size = min(filled, count - filled)
+        row[x + filled : x + filled + size] = row[x : x + size]
+        filled += size
@@ -16,15 +16,31 @@ Load pixel colors into a bitmap from an truecolor BMP and return the correct col
 import sys
 
 try:
+    from array import array
     from io import BufferedReader
-    from typing import Optional, Tuple, Union
+    from typing import Iterable, Iterator, Optional, Tuple, Union
 
     from ..displayio_types import BitmapConstructor
 except ImportError:
     pass
 
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None
+
 from displayio import Bitmap, ColorConverter, Colorspace
 
+from .. import Band
+from ..row_writer import (
+    TRANSPARENT_KEY,
+    RowWriter,
+    crop_window,
+    kept_rows,
+    scaled_size,
+    write_bands,
+)
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
@@ -53,6 +69,22 @@ def bitfield_format(bitfield_mask):
     return None
 
 
+def _check_bitfield_masks(bitfield_masks: Union[dict, None]) -> None:
+    """Raise NotImplementedError for bitfield masks that the pixels can't be loaded with."""
+    if bitfield_masks is not None and bitfield_format(bitfield_masks) is None:
+        raise NotImplementedError("Bitfield mask not supported")
+
+
+def _bitmap_colorspace(color_depth: int, bitfield_masks: Union[dict, None]) -> Colorspace:
+    """The colorspace of the values loaded into the bitmap. 16 bit pixels are copied as they
+    are stored, as RGB555 or RGB565, and the rest are converted to RGB565."""
+    if color_depth == 16:
+        if bitfield_masks is None:
+            return Colorspace.RGB555
+        return bitfield_format(bitfield_masks) or Colorspace.RGB565
+    return Colorspace.RGB565
+
+
 def load(  # noqa: PLR0912, PLR0913, Too many branches, Too many arguments in function definition
     file: BufferedReader,
     width: int,
@@ -62,9 +94,15 @@ def load(  # noqa: PLR0912, PLR0913, Too many branches, Too many arguments in fu
     bitfield_masks: Union[dict, None],
     *,
     bitmap: Optional[BitmapConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+    transparency: bool = False,
+    top_down: bool = False,
 ) -> Tuple[Optional[Bitmap], Optional[ColorConverter]]:
     """Loads truecolor bitmap data into bitmap and palette objects. Due to the 16-bit limit
     that the bitmap object can hold, colors will be converted to 16-bit RGB565 values.
+    16-bit pixels are loaded as they are, without any conversion, and the returned
+    `displayio.ColorConverter` is set to their colorspace instead.
 
     :param file file: The open bmp file
     :param int width: Image width in pixels
@@ -73,59 +111,172 @@ def load(  # noqa: PLR0912, PLR0913, Too many branches, Too many arguments in fu
     :param int color_depth: Number of bits used to store a value
     :param dict bitfield_masks: The bitfield masks for each color if using bitfield compression
     :param BitmapConstructor bitmap: a function that returns a displayio.Bitmap
+    :param tuple crop: The x, y, width and height of the part of the image to load, the
+      whole image if None. Only the bytes of the pixels in the crop are read.
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller, only the rows that are
+      kept are read and only the pixels that are kept are converted. Whole 16-bit images
+      are read with `bitmaptools.readinto` when it is available.
+    :param bool transparency: Use the fourth byte of each pixel of 32 bit images as its
+      alpha, when the bitfield masks include an alpha mask. Pixels that are less than half
+      opaque are loaded as a key color that the returned `displayio.ColorConverter` is
+      made to treat as transparent, as they are converted. Without an alpha mask the
+      fourth byte is padding and the image is loaded opaque.
+    :param bool top_down: Whether the rows are stored from the top down, as they are when
+      the height in the header is negative, instead of from the bottom up
     """
-    converter_obj = None
+    keyed = (
+        transparency
+        and color_depth == 32
+        and bitfield_masks is not None
+        and bitfield_masks.get("alpha", 0) != 0
+    )
     bitmap_obj = None
     if bitmap:
-        # Set up a ColorConverter object and set appropriate colorspace
-        # to convert from based on the color depth
-        input_colorspace = Colorspace.RGB888
-        if bitfield_masks is not None:
-            colorspace = bitfield_format(bitfield_masks)
-            if colorspace is not None:
-                input_colorspace = colorspace
-            else:
-                raise NotImplementedError("Bitfield mask not supported")
-        elif color_depth == 16:
-            input_colorspace = Colorspace.RGB555
-        converter_obj = ColorConverter(input_colorspace=input_colorspace)
-        if sys.maxsize > 1073741823:
-            from .negative_height_check import negative_height_check
-
-            # convert unsigned int to signed int when height is negative
-            height = negative_height_check(height)
-        bitmap_obj = bitmap(width, abs(height), 65535)
-        file.seek(data_start)
-        line_size = width * (color_depth // 8)
-        # Set the seek direction based on whether the height value is negative or positive
-        if height > 0:
-            range1 = height - 1
-            range2 = -1
-            range3 = -1
+        left, top, crop_width, crop_height = crop_window(crop, width, height)
+        bitmap_obj = bitmap(scaled_size(crop_width, scale), scaled_size(crop_height, scale), 65535)
+        _check_bitfield_masks(bitfield_masks)
+        if _bitmap_readinto and color_depth == 16 and crop is None and scale == 1:
+            # the pixels are copied as they are, rows are padded to 4 bytes
+            file.seek(data_start)
+            _bitmap_readinto(
+                bitmap_obj,
+                file,
+                bits_per_pixel=16,
+                element_size=4,
+                reverse_rows=not top_down,
+            )
+            return bitmap_obj, ColorConverter(
+                input_colorspace=_bitmap_colorspace(color_depth, bitfield_masks)
+            )
+        rows = kept_rows(top, crop_height, scale, not top_down)
+        writer = RowWriter(bitmap_obj, 65535, left, top, scale=scale)
+        for _ in _read_rows(
+            file,
+            writer,
+            rows,
+            width,
+            height,
+            top_down,
+            data_start,
+            color_depth,
+            bitfield_masks,
+            keyed,
+        ):
+            pass
+
+    converter = ColorConverter(input_colorspace=_bitmap_colorspace(color_depth, bitfield_masks))
+    if keyed:
+        converter.make_transparent(TRANSPARENT_KEY)
+    return bitmap_obj, converter
+
+
+def bands(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    width: int,
+    height: int,
+    data_start: int,
+    color_depth: int,
+    bitfield_masks: Union[dict, None],
+    rows: int = 16,
+    *,
+    bitmap: BitmapConstructor,
+    top_down: bool = False,
+) -> Iterator[Band]:
+    """Loads truecolor bitmap data a band of ``rows`` rows at a time, see
+    `adafruit_imageload.bands`. Rows are read from the top down, whichever way up they
+    are stored.
+
+    The other parameters are the same as for `load`.
+    """
+    writer = RowWriter(bitmap(width, min(rows, height), 65535), 65535)
+    yield from write_bands(
+        _read_rows(
+            file,
+            writer,
+            range(height),
+            width,
+            height,
+            top_down,
+            data_start,
+            color_depth,
+            bitfield_masks,
+        ),
+        writer,
+        height,
+        ColorConverter(input_colorspace=_bitmap_colorspace(color_depth, bitfield_masks)),
+    )
+
+
+def _read_rows(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    writer: RowWriter,
+    rows: Iterable[int],
+    width: int,
+    height: int,
+    top_down: bool,
+    data_start: int,
+    color_depth: int,
+    bitfield_masks: Union[dict, None],
+    keyed: bool = False,
+) -> Iterator[int]:
+    """
+    Generator to read ``rows`` of the image into ``writer``, seeking to each in
+    turn, and yielding the number of each row before it is written. Only the bytes of the
+    columns of the bitmap of the writer are read and only the pixels it keeps are converted,
+    a whole row at a time by a conversion picked once for the pixel format. With ``keyed``
+    32 bit pixels that are less than half opaque are converted to ``TRANSPARENT_KEY``.
+    """
+    _check_bitfield_masks(bitfield_masks)
+    convert_row = _copy_rgb16 if color_depth == 16 else _convert_rgb888
+    if keyed:
+        convert_row = _convert_rgba8888
+    bytes_per_pixel = color_depth // 8
+    # rows are padded to a multiple of 4 bytes
+    line_size = (width * bytes_per_pixel + 3) // 4 * 4
+    row = writer.row
+    assert isinstance(row, array)  # the bitmap holds RGB565 values
+    left = writer.x
+    scale = writer.scale
+    count = writer.width
+    # 16 bit rows are already bitmap values, read straight into the row when they are whole
+    # and stored in the byte order of the row
+    direct = color_depth == 16 and scale == 1 and sys.byteorder == "little"
+    chunk = bytearray(0 if direct else ((count - 1) * scale + 1) * bytes_per_pixel)
+    for y in rows:
+        stored_row = y if top_down else height - 1 - y
+        file.seek(data_start + stored_row * line_size + left * bytes_per_pixel)
+        file.readinto(row if direct else chunk)
+        yield y
+        if not direct:
+            convert_row(chunk, row, count, scale * bytes_per_pixel)
+        writer.flush(y, left, count, step=scale)
+
+
+def _convert_rgb888(chunk: bytearray, row: array, count: int, step: int) -> None:
+    """Pack ``count`` BGR pixels, ``step`` bytes apart, into RGB565. The fourth byte
+    of 32 bit pixels is ignored."""
+    i = 0
+    for x in range(count):
+        row[x] = (chunk[i + 2] & 0xF8) << 8 | (chunk[i + 1] & 0xFC) << 3 | chunk[i] >> 3
+        i += step
+
+
+def _convert_rgba8888(chunk: bytearray, row: array, count: int, step: int) -> None:
+    """Pack ``count`` BGRA pixels, ``step`` bytes apart, into RGB565, keying out the ones
+    that are less than half opaque."""
+    i = 0
+    for x in range(count):
+        if chunk[i + 3] < 0x80:
+            row[x] = TRANSPARENT_KEY
         else:
-            range1 = 0
-            range2 = abs(height)
-            range3 = 1
-        chunk = bytearray(line_size)
-        for y in range(range1, range2, range3):
-            file.readinto(chunk)
-            bytes_per_pixel = color_depth // 8
-            offset = y * width
-
-            for x in range(width):
-                i = x * bytes_per_pixel
-                if bitfield_masks is not None:
-                    color = 0
-                    for byte in range(bytes_per_pixel):
-                        color |= chunk[i + byte] << (8 * byte)
-                    mask = bitfield_masks["red"] | bitfield_masks["green"] | bitfield_masks["blue"]
-                    if color_depth in (24, 32):
-                        mask = mask >> 8
-                    pixel = color & mask
-                elif color_depth == 16:
-                    pixel = chunk[i] | chunk[i + 1] << 8
-                else:
-                    pixel = chunk[i + 2] << 16 | chunk[i + 1] << 8 | chunk[i]
-                bitmap_obj[offset + x] = converter_obj.convert(pixel)
-
-    return bitmap_obj, ColorConverter(input_colorspace=Colorspace.RGB565)
+            value = (chunk[i + 2] & 0xF8) << 8 | (chunk[i + 1] & 0xFC) << 3 | chunk[i] >> 3
+            row[x] = 0 if value == TRANSPARENT_KEY else value
+        i += step
+
+
+def _copy_rgb16(chunk: bytearray, row: array, count: int, step: int) -> None:
+    """Copy ``count`` little endian 16 bit pixels, ``step`` bytes apart."""
+    i = 0
+    for x in range(count):
+        row[x] = chunk[i] | chunk[i + 1] << 8
+        i += step
@@ -15,10 +15,12 @@ from a GIF file.
 """
 
 import struct
+from array import array
+from collections import namedtuple
 
 try:
     from io import BufferedReader
-    from typing import Iterator, List, Optional, Tuple
+    from typing import Iterator, Optional, Tuple, Union
 
     from displayio import Bitmap, Palette
 
@@ -26,144 +28,426 @@ try:
 except ImportError:
     pass
 
+try:
+    from bitmaptools import fill_region as _fill_region
+except ImportError:
+    _fill_region = None
+
+from . import ImageInfo
+from .row_writer import RowWriter, crop_window, scaled_size
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
+# LZW codes are at most 12 bits long
+_MAX_CODES = 4096
+
+
+Frame = namedtuple("Frame", ("bitmap", "palette", "delay", "disposal", "transparent_index"))
+"""A frame of a GIF, as yielded by `frames`.
+
+``bitmap`` is the canvas, shared by every frame. ``palette`` is the local palette of the
+frame when it has one, else the global palette. ``delay`` is how long to show the frame,
+in seconds. ``disposal`` is one of the ``DISPOSAL_`` values. ``transparent_index`` is the
+palette index not drawn by this frame, or None. It is made transparent in ``palette`` while
+the frame is shown, so the canvas cleared to it shows what is behind it."""
+
+DISPOSAL_UNSPECIFIED = 0
+"""The encoder did not say what to do with the frame, it is left in place"""
+DISPOSAL_NONE = 1
+"""The frame is left in place for the next frame to draw over"""
+DISPOSAL_BACKGROUND = 2
+"""The area of the frame is cleared before the next frame is drawn"""
+DISPOSAL_PREVIOUS = 3
+"""The area of the frame is restored to what it was before the frame was drawn"""
+
 
 def load(
-    file: BufferedReader, *, bitmap: BitmapConstructor, palette: Optional[PaletteConstructor] = None
+    file: BufferedReader,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Bitmap, Optional[Palette]]:
     """Loads a GIF image from the open ``file``.
 
-    Returns tuple of bitmap object and palette object.
+    Returns tuple of bitmap object and palette object. Only the first frame of an
+    animated GIF is loaded, use `frames` to play the animation.
 
     :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
       with the data of a GIF file.
     :param object bitmap: Type to store bitmap data. Must have API similar to `displayio.Bitmap`.
     :param object palette: Type to store the palette. Must have API similar to
       `displayio.Palette`. Will be skipped if None.
+    :param tuple crop: The x, y, width and height of the part of the image to load, the
+      whole image if None. The rest of each frame is decoded but not stored.
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller, keeping every scale-th
+      pixel of every scale-th row.
     """
+    writer, palette_obj, background = _read_header(file, bitmap, palette, crop, scale)
+    for frame in _read_frames(file, writer, palette_obj, background, palette):
+        return frame.bitmap, frame.palette
+    return writer.bitmap, palette_obj
+
+
+def frames(
+    file: BufferedReader,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+) -> Iterator[Frame]:
+    """Yields the frames of a GIF image from the open ``file`` one at a time, as `Frame`.
+
+    Every frame is drawn into the same canvas bitmap, so memory use does not depend on the
+    number of frames. The canvas must be shown (or copied) before the next frame is requested,
+    as that applies the disposal of the previous frame and draws the next one over it.
+    When a frame has its own local palette, parts of the canvas left by earlier frames are
+    shown with that palette too.
+
+    .. code-block:: python
+
+        with open("/animation.gif", "rb") as file:
+            for frame in adafruit_imageload.gif.frames(
+                file, bitmap=displayio.Bitmap, palette=displayio.Palette
+            ):
+                tile_grid.pixel_shader = frame.palette
+                time.sleep(frame.delay)
+
+    :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
+      with the data of a GIF file, which must stay open while the frames are read.
+    :param object bitmap: Type to store bitmap data. Must have API similar to `displayio.Bitmap`.
+    :param object palette: Type to store the palette. Must have API similar to
+      `displayio.Palette`. Will be skipped if None.
+    :param tuple crop: The x, y, width and height of the part of the image to load, the
+      whole image if None. The rest of each frame is decoded but not stored.
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller, keeping every scale-th
+      pixel of every scale-th row.
+    """
+    writer, palette_obj, background = _read_header(file, bitmap, palette, crop, scale)
+    yield from _read_frames(file, writer, palette_obj, background, palette)
+
+
+def info(file: BufferedReader) -> ImageInfo:
+    """Read the size and palette size of the GIF image in the open ``file``, and count
+    its frames by skipping over their data without decoding it.
+
+    :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
+      with the data of a GIF file.
+    """
+    width, height, flags, _ = _read_screen(file)
+    depth = 8
+    colors = 0
+    if (flags & 0x80) != 0:
+        depth = (flags & 0x07) + 1
+        colors = 1 << depth
+        file.seek(3 * colors, 1)
+    frame_count = 0
+    while True:
+        block_type = file.read(1)
+        if not block_type or block_type[0] == 0x3B:  # terminator
+            break
+        if block_type[0] == 0x2C:  # frame
+            frame_count += 1
+            flags = file.read(9)[8]
+            if (flags & 0x80) != 0:
+                file.seek(3 << ((flags & 0x07) + 1), 1)
+            file.seek(1, 1)  # minimum code size
+        elif block_type[0] == 0x21:  # extension
+            file.seek(1, 1)  # label
+        else:
+            raise ValueError("Bad block type")
+        _skip_blockstream(file)
+    return ImageInfo("gif", width, height, depth, colors, frame_count)
+
+
+def _read_screen(file: BufferedReader) -> Tuple[int, int, int, int]:
+    """Check the signature and read the width, height, flags and background color index
+    from the logical screen descriptor."""
     header = file.read(6)
     if header not in {b"GIF87a", b"GIF89a"}:
         raise ValueError("Not a GIF file")
-    width, height, flags, _, _ = struct.unpack("<HHBBB", file.read(7))
+    width, height, flags, background, _ = struct.unpack("<HHBBB", file.read(7))
+    return width, height, flags, background
+
+
+def _read_header(
+    file: BufferedReader,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor],
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+) -> Tuple[RowWriter, Optional[Palette], int]:
+    """Read the logical screen and global palette, and create the canvas bitmap, covering
+    the ``crop`` window of the screen reduced by ``scale``, with a `RowWriter` to draw into
+    it. Also returns the background color index, used to clear frames."""
+    width, height, flags, background = _read_screen(file)
+    palette_size = 0
     if (flags & 0x80) != 0:
         if not palette:
             raise RuntimeError("palette argument required")
         palette_size = 1 << ((flags & 0x07) + 1)
-        palette_obj = palette(palette_size)
-        for i in range(palette_size):
-            palette_obj[i] = file.read(3)
+        palette_obj = _read_palette(file, palette, palette_size)
     else:
         palette_obj = None
+        background = 0
     color_bits = ((flags & 0x70) >> 4) + 1
-    bitmap_obj = bitmap(width, height, (1 << color_bits) - 1)
+    colors = max((1 << color_bits) - 1, palette_size)
+    x, y, width, height = crop_window(crop, width, height)
+    bitmap_obj = bitmap(scaled_size(width, scale), scaled_size(height, scale), colors)
+    return RowWriter(bitmap_obj, colors, x, y, scale=scale), palette_obj, background
+
+
+def _read_palette(file: BufferedReader, palette: PaletteConstructor, palette_size: int) -> Palette:
+    """Read a global or local color table."""
+    palette_obj = palette(palette_size)
+    for i in range(palette_size):
+        palette_obj[i] = file.read(3)
+    return palette_obj
+
+
+def _read_frames(  # noqa: PLR0913, PLR0915 Too many arguments in function definition, Too many statements
+    file: BufferedReader,
+    writer: RowWriter,
+    palette_obj: Optional[Palette],
+    background: int,
+    palette: Optional[PaletteConstructor],
+) -> Iterator[Frame]:
+    """Read the blocks following the header, drawing and yielding each frame in turn."""
+    bitmap = writer.bitmap
+    delay, disposal, transparent_index = 0, DISPOSAL_UNSPECIFIED, None
     while True:
         block_type = file.read(1)[0]
         if block_type == 0x2C:  # frame
-            _read_frame(file, bitmap_obj)
+            ddx, ddy, width, height, flags = struct.unpack("<HHHHB", file.read(9))
+            frame_palette = palette_obj
+            if (flags & 0x80) != 0:
+                palette_size = 1 << ((flags & 0x07) + 1)
+                if palette:
+                    frame_palette = _read_palette(file, palette, palette_size)
+                else:
+                    file.seek(3 * palette_size, 1)
+            # the part of the frame that is on the canvas, in canvas coordinates
+            x1, y1, x2, y2 = writer.area(ddx, ddy, width, height)
+            visible = x1 < x2 and y1 < y2
+            saved = None
+            if disposal == DISPOSAL_PREVIOUS and visible:
+                saved = bytearray((x2 - x1) * (y2 - y1))
+                i = 0
+                for y in range(y1, y2):
+                    for x in range(x1, x2):
+                        saved[i] = bitmap[x, y]
+                        i += 1
+            _read_frame(file, writer, ddx, ddy, width, height, flags, transparent_index)
+            keyed = None
+            if frame_palette is not None and transparent_index is not None:
+                if transparent_index < len(frame_palette):
+                    keyed = frame_palette
+                    keyed.make_transparent(transparent_index)
+            yield Frame(bitmap, frame_palette, delay / 100, disposal, transparent_index)
+            if keyed is not None:
+                # the next frame may draw this index, or use the palette without one
+                keyed.make_opaque(transparent_index)
+            if disposal == DISPOSAL_BACKGROUND and visible:
+                clear = background if transparent_index is None else transparent_index
+                _fill(writer, x1, y1, x2, y2, clear)
+            elif saved:
+                saved_view = memoryview(saved)
+                scale = writer.scale
+                for y in range(y1, y2):
+                    start = (y - y1) * (x2 - x1)
+                    writer.flush(
+                        writer.y + y * scale,
+                        writer.x + x1 * scale,
+                        x2 - x1,
+                        saved_view[start:],
+                        step=scale,
+                    )
+            delay, disposal, transparent_index = 0, DISPOSAL_UNSPECIFIED, None
         elif block_type == 0x21:  # extension
-            _ = file.read(1)[0]
-            # 0x01 = label, 0xfe = comment
-            _ = bytes(_read_blockstream(file))
+            label = file.read(1)[0]
+            if label == 0xF9:  # graphic control, applies to the next frame
+                data = file.read(file.read(1)[0])
+                flags, delay, transparent = struct.unpack("<BHB", data[:4])
+                disposal = (flags >> 2) & 0x07
+                transparent_index = transparent if flags & 0x01 else None
+            # 0x01 = label, 0xfe = comment, 0xff = application
+            _skip_blockstream(file)
         elif block_type == 0x3B:  # terminator
-            break
+            return
         else:
             raise ValueError("Bad block type")
-    return bitmap_obj, palette_obj
 
 
-def _read_frame(file: BufferedReader, bitmap: Bitmap) -> None:
-    """Read a single frame and apply it to the bitmap."""
-    ddx, ddy, width, _, flags = struct.unpack("<HHHHB", file.read(9))
-    if (flags & 0x40) != 0:
-        raise NotImplementedError("Interlacing not supported")
-    if (flags & 0x80) != 0:
-        palette_size = 1 << ((flags & 0x07) + 1)
-        for _ in range(palette_size):
-            _ = file.read(3)
+def _fill(writer: RowWriter, x1: int, y1: int, x2: int, y2: int, value: int) -> None:  # noqa: PLR0913 Too many arguments in function definition
+    """Fill a rectangle of the bitmap with a single value. The corners are in bitmap
+    coordinates, not those of the image."""
+    if _fill_region:
+        _fill_region(writer.bitmap, x1, y1, x2, y2, value)
+        return
+    row = writer.row
+    for x in range(x2 - x1):
+        row[x] = value
+    scale = writer.scale
+    for y in range(y1, y2):
+        writer.flush(writer.y + y * scale, writer.x + x1 * scale, x2 - x1, step=scale)
+
+
+def _read_frame(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    writer: RowWriter,
+    ddx: int,
+    ddy: int,
+    width: int,
+    height: int,
+    flags: int,
+    transparent_index: Optional[int] = None,
+) -> None:
+    """Read the image data of a single frame and apply it to the bitmap.
+
+    Pixels with ``transparent_index`` leave the bitmap unchanged, as do the parts
+    of the frame that are outside of the bitmap. Interlaced rows are drawn straight
+    to their place in the bitmap as they are decoded.
+    """
+    interlaced = (flags & 0x40) != 0
+    rows = _interlaced_rows(height) if interlaced else range(height)
+    bottom = writer.y + writer.height * writer.scale
     min_code_size = file.read(1)[0]
-    x = 0
-    y = 0
-    for decoded in lzw_decode(_read_blockstream(file), min_code_size):
-        for byte in decoded:
-            bitmap[ddx + x, ddy + y] = byte
-            x += 1
-            if x >= width:
-                x = 0
-                y += 1
-
-
-def _read_blockstream(file: BufferedReader) -> Iterator[int]:
-    """Read a block from a file."""
-    while True:
-        size = file.read(1)[0]
-        if size == 0:
-            break
-        for _ in range(size):
-            yield file.read(1)[0]
-
-
-class EndOfData(Exception):
-    """Signified end of compressed data."""
-
-
-class LZWDict:
-    """A dictionary of LZW codes."""
-
-    def __init__(self, code_size: int) -> None:
-        self.code_size = code_size
-        self.clear_code = 1 << code_size
-        self.end_code = self.clear_code + 1
-        self.codes = []  # type: List[bytes]
-        self.last = b""
-        self.clear()
-
-    def clear(self) -> None:
-        """Reset the dictionary to default codes."""
-        self.last = b""
-        self.code_len = self.code_size + 1
-        self.codes[:] = []
-
-    def decode(self, code: int) -> bytes:
-        """Decode a code."""
-        if code == self.clear_code:
-            self.clear()
-            return b""
-        if code == self.end_code:
-            raise EndOfData()
-        if code < self.clear_code:
-            value = bytes([code])
-        elif code <= len(self.codes) + self.end_code:
-            value = self.codes[code - self.end_code - 1]
-        else:
-            value = self.last + self.last[0:1]
-        if self.last:
-            self.codes.append(self.last + value[0:1])
-        if len(self.codes) + self.end_code + 1 >= 1 << self.code_len and self.code_len < 12:
-            self.code_len += 1
-        self.last = value
-        return value
-
-
-def lzw_decode(data: Iterator[int], code_size: int) -> Iterator[bytes]:
-    """Decode LZW-compressed data."""
-    dictionary = LZWDict(code_size)
-    bit = 0
-    try:
-        byte = next(data)
-        try:
-            while True:
-                code = 0
-                for i in range(dictionary.code_len):
-                    code |= ((byte >> bit) & 0x01) << i
-                    bit += 1
-                    if bit >= 8:
-                        bit = 0
-                        byte = next(data)
-                yield dictionary.decode(code)
-        except EndOfData:
-            while True:
-                next(data)
-    except StopIteration:
+    data = _read_blockstream(file)
+    for y, row in zip(rows, lzw_decode(data, min_code_size, width)):
+        if not interlaced and ddy + y >= bottom:
+            break  # the rest of the frame is below the canvas
+        writer.flush(ddy + y, ddx, len(row), row, skip=transparent_index)
+    # consume whatever is left of the image data, so the file is at the next block
+    for _ in data:
         pass
+
+
+def _interlaced_rows(height: int) -> Iterator[int]:
+    """Yield the row numbers of an interlaced image, in the order they are stored."""
+    for start, step in ((0, 8), (4, 8), (2, 4), (1, 2)):
+        yield from range(start, height, step)
+
+
+def _read_blockstream(file: BufferedReader) -> Iterator[memoryview]:
+    """
+    Read the sub-blocks of a block from a file, one ``readinto`` per sub-block.
+    Each sub-block is read together with the size of the next one, into a single
+    reusable buffer, so a yielded sub-block is only valid until the next one.
+    """
+    buffer = bytearray(256)
+    view = memoryview(buffer)
+    size = file.read(1)[0]
+    while size:
+        count = file.readinto(view[: size + 1])
+        if count <= size:  # truncated file
+            yield view[:count]
+            return
+        yield view[:size]
+        size = buffer[size]
+
+
+def _skip_blockstream(file: BufferedReader) -> None:
+    """Seek past the sub-blocks of a block without reading them."""
+    size = file.read(1)[0]
+    while size:
+        file.seek(size, 1)
+        size = file.read(1)[0]
+
+
+def lzw_decode(  # noqa: PLR0912, PLR0915 Too many branches, Too many statements
+    data: Iterator[Union[bytes, memoryview]], code_size: int, width: int
+) -> Iterator[bytearray]:
+    """
+    Decode LZW-compressed data, one row of ``width`` pixel values at a time.
+
+    The code table is kept in preallocated prefix, suffix and length arrays,
+    and each code is decoded by walking its prefix chain into a fixed buffer,
+    so nothing is allocated per code. The yielded row is reused, so it is only
+    valid until the next row is requested. A final partial row is yielded if
+    the data ends early.
+
+    :param Iterator[bytes|memoryview] data: The compressed bytes, a block at a time
+    :param int code_size: The minimum code size from the image data
+    :param int width: Number of pixels in a row
+    """
+    clear_code = 1 << code_size
+    end_code = clear_code + 1
+    prefix = array("H", bytes(2 * _MAX_CODES))
+    suffix = bytearray(_MAX_CODES)
+    length = array("H", bytes(2 * _MAX_CODES))
+    for code in range(clear_code):
+        suffix[code] = code
+        length[code] = 1
+    stack = bytearray(_MAX_CODES + 1)
+    stack_view = memoryview(stack)
+    row = bytearray(width)
+    pos = 0
+
+    next_code = end_code + 1
+    code_len = code_size + 1
+    mask = (1 << code_len) - 1
+    prev = -1
+    bits = 0
+    bit_count = 0
+    for block in data:
+        for byte in block:
+            bits |= byte << bit_count
+            bit_count += 8
+            while bit_count >= code_len:
+                code = bits & mask
+                bits >>= code_len
+                bit_count -= code_len
+                if code == clear_code:
+                    next_code = end_code + 1
+                    code_len = code_size + 1
+                    mask = (1 << code_len) - 1
+                    prev = -1
+                    continue
+                if code == end_code:
+                    if pos:
+                        yield row[:pos]
+                    return
+                if code < clear_code:
+                    # a single pixel, the most common case
+                    first = code
+                    row[pos] = code
+                    pos += 1
+                    if pos == width:
+                        yield row
+                        pos = 0
+                else:
+                    # unwind the prefix chain into the stack, last pixel first
+                    current = code if code < next_code else prev
+                    count = length[current]
+                    i = count
+                    while i:
+                        i -= 1
+                        stack[i] = suffix[current]
+                        current = prefix[current]
+                    first = stack[0]
+                    if code >= next_code:
+                        stack[count] = first
+                        count += 1
+                    start = 0
+                    while start < count:
+                        copied = min(width - pos, count - start)
+                        row[pos : pos + copied] = stack_view[start : start + copied]
+                        pos += copied
+                        start += copied
+                        if pos == width:
+                            yield row
+                            pos = 0
+                if prev >= 0 and next_code < _MAX_CODES:
+                    prefix[next_code] = prev
+                    suffix[next_code] = first
+                    length[next_code] = length[prev] + 1
+                    next_code += 1
+                if next_code >= 1 << code_len and code_len < 12:
+                    code_len += 1
+                    mask = (1 << code_len) - 1
+                prev = code
+    if pos:
+        yield row[:pos]
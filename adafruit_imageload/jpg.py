@@ -29,6 +29,9 @@ except ImportError:
 
 from displayio import Bitmap, ColorConverter, Colorspace
 
+from . import ImageInfo
+from .row_writer import scaled_size
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
@@ -37,6 +40,7 @@ def load(
     file: BufferedReader,
     *,
     bitmap: BitmapConstructor,
+    scale: int = 1,
 ) -> Tuple[Bitmap, Optional[ColorConverter]]:
     """
     Loads a JPG image from the open ''file''.
@@ -48,10 +52,24 @@ def load(
     :param object bitmap: Type to store bitmap data.
      Must have API similar to 'displayio.Bitmap'. Will be skipped if None.
      Will be skipped if None.
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller, scaled by the decoder itself
     """
     decoder = JpegDecoder()
     width, height = decoder.open(file)
-    bitmap_obj = bitmap(width, height, 65535)
-    decoder.decode(bitmap_obj)
+    bitmap_obj = bitmap(scaled_size(width, scale), scaled_size(height, scale), 65535)
+    # jpegio takes the scale as a power of two
+    decoder.decode(bitmap_obj, scale=scale.bit_length() - 1)
 
     return bitmap_obj, ColorConverter(input_colorspace=Colorspace.RGB565_SWAPPED)
+
+
+def info(file: BufferedReader) -> ImageInfo:
+    """
+    Read the size of the JPG image in the open ''file'' from its header, using jpegio
+    without decoding the image.
+
+    :param io.BufferedReader file: Open file handle or compatible (like 'io.BytesIO')
+    """
+    decoder = JpegDecoder()
+    width, height = decoder.open(file)
+    return ImageInfo("jpeg", width, height, 24, 0, 1)
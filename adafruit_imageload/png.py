@@ -16,28 +16,67 @@ from a PNG file.
 """
 
 try:
+    from array import array
     from io import BufferedReader
-    from typing import Optional, Tuple
+    from typing import Callable, Iterator, List, Optional, Tuple, Union
 
-    from displayio import Bitmap, Palette
+    from displayio import Bitmap, ColorConverter, Palette
 
     from .displayio_types import BitmapConstructor, PaletteConstructor
 except ImportError:
     pass
 
 import struct
+import sys
 import zlib
 
+from . import Band, ImageInfo
+from .row_writer import (
+    TRANSPARENT_KEY,
+    RowWriter,
+    crop_window,
+    scaled_size,
+    unpack,
+    unpack_table,
+    write_bands,
+)
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
+# Compressed image data is read from the file in pieces of at most this many bytes
+_IDAT_READ_SIZE = 1024
+
+# The bit depths allowed for each color mode: grayscale, RGB, indexed, grayscale with
+# alpha and RGB with alpha
+_DEPTHS = {0: (1, 2, 4, 8, 16), 2: (8, 16), 3: (1, 2, 4, 8), 4: (8, 16), 6: (8, 16)}
+
+# x, y, x step and y step of each Adam7 pass, then the size of the block each pixel
+# stands for until later passes fill it in
+_ADAM7 = (
+    (0, 0, 8, 8, 8, 8),
+    (4, 0, 8, 8, 4, 8),
+    (0, 4, 4, 8, 4, 4),
+    (2, 0, 4, 4, 2, 4),
+    (0, 2, 2, 4, 2, 2),
+    (1, 0, 2, 2, 1, 2),
+    (0, 1, 1, 2, 1, 1),
+)
 
-def load(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
-    file: BufferedReader, *, bitmap: BitmapConstructor, palette: Optional[PaletteConstructor] = None
-) -> Tuple[Bitmap, Optional[Palette]]:
+
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+    pass_callback: Optional[Callable[[Bitmap, Optional[Palette], int], None]] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+    gray_palette: bool = False,
+    transparency: bool = False,
+) -> Tuple[Bitmap, Optional[Union[Palette, ColorConverter]]]:
     """
     Loads a PNG image from the open ``file``.
-    Only supports indexed color images.
 
     Returns tuple of bitmap object and palette object.
 
@@ -47,14 +86,126 @@ def load(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
       `displayio.Bitmap`.
     :param object palette: Type to store the palette. Must have API similar to
       `displayio.Palette`. Will be skipped if None.
+    :param pass_callback: For Adam7 interlaced images, called after each of the 7 passes
+      with the bitmap, the palette and the pass number (1 to 7). These are the objects that
+      will be returned, so the first call can be used to put the image on the display
+      while the rest is still loading. When a callback is given, each pixel of the early
+      passes is drawn as a block covering the pixels later passes will fill in, so every
+      pass shows the whole image at increasing resolution.
+    :param tuple crop: The x, y, width and height of the part of the image to load, the
+      whole image if None. The rest of the image is decoded but not stored, and nothing
+      below the crop is decompressed unless the image is interlaced.
+    :param int scale: Load the image 1, 2, 4 or 8 times smaller. Every row is decompressed
+      but only every scale-th one is converted, and only every scale-th pixel of it is kept.
+    :param bool gray_palette: Load 8 and 16 bit grayscale images as indices into a palette
+      of 256 gray levels instead of as RGB565 colors, which takes half of the memory.
+      Grayscale images of less than 8 bits always get a palette of their gray levels.
+    :param bool transparency: Make the pixels of images with an alpha channel that are less
+      than half opaque transparent. They are loaded as a key value that the returned palette
+      or `displayio.ColorConverter` is made to treat as transparent, as they are converted.
+    """
+    width, height, depth, mode, interlaced, pal, colors, size = _read_header(
+        file, palette, gray_palette
+    )
+    keyed = transparency and mode in {4, 6}
+    if keyed and pal is not None:
+        pal.make_transparent(TRANSPARENT_KEY)
+    left, top, crop_width, crop_height = crop_window(crop, width, height)
+    bmp = bitmap(scaled_size(crop_width, scale), scaled_size(crop_height, scale), colors)
+    writer = RowWriter(bmp, colors, left, top, width, scale)
+    bottom = top + crop_height
+    for y in _write_rows(
+        file, size, writer, width, height, depth, mode, interlaced, pass_callback, pal, keyed
+    ):
+        if not interlaced and y >= bottom:
+            break  # nothing below the crop is needed
+    return bmp, pal
+
+
+def bands(
+    file: BufferedReader,
+    rows: int = 16,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+    gray_palette: bool = False,
+) -> Iterator[Band]:
+    """
+    Loads a PNG image from the open ``file`` a band of ``rows`` rows at a time, see
+    `adafruit_imageload.bands`. Interlaced images are not supported, as none of their
+    rows is complete until the last pass.
+
+    :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
+      with the data of a PNG file.
+    :param int rows: The height of each band
+    :param object bitmap: Type to store bitmap data. Must have API similar to
+      `displayio.Bitmap`.
+    :param object palette: Type to store the palette. Must have API similar to
+      `displayio.Palette`. Will be skipped if None.
+    :param bool gray_palette: Load grayscale images with a palette, as for `load`
+    """
+    width, height, depth, mode, interlaced, pal, colors, size = _read_header(
+        file, palette, gray_palette
+    )
+    if interlaced:
+        raise NotImplementedError("Interlaced PNGs can't be loaded in bands")
+    writer = RowWriter(bitmap(width, min(rows, height), colors), colors, 0, 0, width)
+    yield from write_bands(
+        _write_rows(file, size, writer, width, height, depth, mode, interlaced),
+        writer,
+        height,
+        pal,
+    )
+
+
+def info(file: BufferedReader) -> ImageInfo:
+    """
+    Read the size and color depth of the PNG image in the open ``file``, without
+    decompressing any image data. Chunks are skipped until the first IDAT chunk.
+
+    :param io.BufferedReader file: Open file handle or compatible (like `io.BytesIO`)
+      with the data of a PNG file.
+    """
+    if file.read(8) != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("Not a PNG file")
+    width = height = depth = mode = colors = 0
+    while True:
+        size, chunk = struct.unpack(">I4s", file.read(8))
+        if chunk == b"IHDR":
+            width, height, depth, mode = struct.unpack(">IIBB", file.read(10))
+            size -= 10
+        elif chunk == b"PLTE":
+            colors = size // 3
+        elif chunk in {b"IDAT", b"IEND"}:
+            break
+        file.seek(size + 4, 1)  # skip the rest of the chunk and the CRC
+    if mode == 0 and depth < 8:  # loaded with a palette of gray levels
+        colors = 1 << depth
+    elif mode != 3:  # a suggested palette for a truecolor image is not used
+        colors = 0
+    elif not colors:
+        colors = 1 << depth
+    return ImageInfo("png", width, height, depth * (1, 0, 3, 1, 2, 0, 4)[mode], colors, 1)
+
+
+def _read_header(  # noqa: PLR0915 Too many statements
+    file: BufferedReader, palette: Optional[PaletteConstructor], gray_palette: bool = False
+) -> Tuple[int, int, int, int, int, Optional[Union[Palette, ColorConverter]], int, int]:
+    """
+    Read the chunks up to the first IDAT chunk. Returns the width, height, bit depth,
+    color mode and interlace method of the image, the palette for indexed images or a
+    ColorConverter for the rest, the number of values in the bitmap and the size of the
+    IDAT chunk, whose header was just read.
+
+    Grayscale images of less than 8 bits are given a palette of their gray levels, so
+    they are loaded like indexed images, as are deeper ones when ``gray_palette`` is set.
     """
     header = file.read(8)
     if header != b"\x89PNG\r\n\x1a\n":
         raise ValueError("Not a PNG file")
     del header
-    data = bytearray()
     pal = None
-    mode = None
+    mode = -1  # until the IHDR chunk is read
     depth = 0
     width = 0
     height = 0
@@ -70,11 +221,15 @@ def load(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
                 filters,
                 interlaced,
             ) = struct.unpack(">IIBBBBB", file.read(13))
-            if interlaced:
-                raise NotImplementedError("Interlaced images unsupported")
             # compression and filters must be 0 with current spec
             assert compression == 0
             assert filters == 0
+            if mode not in _DEPTHS:
+                raise ValueError("Unsupported color mode.")
+            if depth not in _DEPTHS[mode]:
+                raise ValueError("Unsupported bit depth.")
+            if mode in {0, 4} and (depth < 8 or gray_palette) and palette is not None:
+                pal = _gray_palette(palette, 1 << min(depth, 8))
         elif chunk == b"PLTE":
             if palette is None:
                 file.seek(size, 1)
@@ -85,7 +240,15 @@ def load(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
                 pal = palette(pal_size)
                 for i in range(pal_size):
                     pal[i] = file.read(3)
-        elif chunk == b"tRNS":
+        elif chunk == b"tRNS" and mode == 0:
+            if pal is not None and depth <= 8:
+                # the gray level that is transparent, when the image has a palette
+                level = struct.unpack(">H", file.read(2))[0]
+                size -= 2
+                if level < len(pal):
+                    pal.make_transparent(level)
+            file.seek(size, 1)
+        elif chunk == b"tRNS" and mode == 3 and pal is not None:
             if size > len(pal):
                 raise ValueError("More transparency entries than palette entries")
             trns_data = file.read(size)
@@ -94,132 +257,335 @@ def load(  # noqa: PLR0912, PLR0915, Too many branches, Too many statements
                     pal.make_transparent(i)
             del trns_data
         elif chunk == b"IDAT":
-            data.extend(file.read(size))
-        elif chunk == b"IEND":
+            # the image data is decoded as it is read, the remaining chunks are not needed
             break
+        elif chunk == b"IEND":
+            raise ValueError("No image data")
         else:
             file.seek(size, 1)  # skip unknown chunks
         file.seek(4, 1)  # skip CRC
-    data_bytes = zlib.decompress(data)
+    if mode == 3 or depth < 8:  # indexed or gray levels
+        colors = 1 << depth
+    elif pal is not None:  # 256 gray levels
+        colors = 256
+    else:  # RGB, RGBA or Grayscale
+        import displayio
+
+        colors = 65536
+        pal = displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565)
+    return width, height, depth, mode, interlaced, pal, colors, size
+
+
+def _gray_palette(palette: PaletteConstructor, levels: int) -> Palette:
+    """A palette of ``levels`` gray levels evenly spread from black to white."""
+    pal = palette(levels)
+    for i in range(levels):
+        gray = i * 255 // (levels - 1)
+        pal[i] = gray << 16 | gray << 8 | gray
+    return pal
+
+
+def _write_rows(  # noqa: PLR0913 Too many arguments in function definition
+    file: BufferedReader,
+    size: int,
+    writer: RowWriter,
+    width: int,
+    height: int,
+    depth: int,
+    mode: int,
+    interlaced: int,
+    pass_callback: Optional[Callable[[Bitmap, Optional[Palette], int], None]] = None,
+    pal: Optional[Union[Palette, ColorConverter]] = None,
+    keyed: bool = False,
+) -> Iterator[int]:
+    """
+    Generator to decode the image data and write it to ``writer``, yielding the number
+    of each row of the image before it is written, so the caller can stop early or move
+    the bitmap of the writer. See `load` for ``pass_callback``, which is called with
+    the bitmap of the writer and ``pal``.
+
+    Indexed scanlines already hold the palette indices once they are unfiltered. 8 bit
+    ones are written to the bitmap as they are, as are 8 bit grayscale ones loaded with a
+    palette, and packed ones are unpacked a whole byte at a time, as are grayscale ones of
+    less than 8 bits. 16 bit samples are reduced to their high byte as they are converted,
+    straight from the unfiltered scanline. With ``keyed``, pixels that are less than half
+    opaque are converted to ``TRANSPARENT_KEY``.
+    """
     unit = (1, 0, 3, 1, 2, 0, 4)[mode]
-    scanline = (width * depth * unit + 7) // 8
-    if mode == 3:  # indexed
-        bmp = bitmap(width, height, 1 << depth)
-        pixels_per_byte = 8 // depth
-        src = 0
-        pixmask = (1 << depth) - 1
-        line = bytearray(scanline)
-        prev = bytearray(scanline)
-        for y in range(height):
-            filter_ = data_bytes[src]
-            src_b = src + 1
-            for x in range(0, width, pixels_per_byte):
-                # relative position on the line
-                pos = x // pixels_per_byte
-                byte = data_bytes[src_b]
-                if filter_ == 0:
-                    pass
-                elif filter_ == 1:  # sub
-                    prev_b = line[pos - unit] if pos >= unit else 0
-                    byte = (byte + prev_b) & 0xFF
-                elif filter_ == 2:  # up
-                    byte = (byte + prev[pos]) & 0xFF
-                elif filter_ == 3:  # average
-                    prev_b = line[pos - unit] if pos >= unit else 0
-                    byte = (byte + (prev_b + prev[pos]) // 2) & 0xFF
-                elif filter_ == 4:  # paeth
-                    a = line[pos - unit] if pos >= unit else 0
-                    if y > 0:
-                        b = prev[pos]
-                        c = prev[pos - unit] if pos >= unit else 0
-                    else:
-                        b = c = 0
-                    p = a + b - c
-                    pa = abs(p - a)
-                    pb = abs(p - b)
-                    pc = abs(p - c)
-                    if pa <= pb and pa <= pc:
-                        p = a
-                    elif pb <= pc:
-                        p = b
-                    else:
-                        p = c
-                    byte = (byte + p) & 0xFF
-                else:
-                    raise ValueError("Wrong filter.")
-                line[pos] = byte
-                for pixel in range(pixels_per_byte):
-                    if x + pixel < width:
-                        bmp[x + pixel, y] = (
-                            byte >> ((pixels_per_byte - pixel - 1) * depth)
-                        ) & pixmask
-                src_b += 1
-            src += scanline + 1
-            prev, line = line, prev
-        return bmp, pal
-    # RGB, RGBA or Grayscale
-    import displayio
-
-    if depth != 8:
-        raise ValueError("Must be 8bit depth.")
-    pal = displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB888)
-    bmp = bitmap(width, height, 65536)
-    prev = bytearray(scanline)
-    line = bytearray(scanline)
-    for y in range(height):
-        src = y * (scanline + 1)
-        filter_ = data_bytes[src]
-        src += 1
-        if filter_ == 0:
-            line[0:scanline] = data_bytes[src : src + scanline]
-        elif filter_ == 1:  # sub
-            for i in range(scanline):
-                a = line[i - unit] if i >= unit else 0
-                line[i] = (data_bytes[src] + a) & 0xFF
-                src += 1
-        elif filter_ == 2:  # up
-            for i in range(scanline):
-                b = prev[i]
-                line[i] = (data_bytes[src] + b) & 0xFF
-                src += 1
-        elif filter_ == 3:  # average
-            for i in range(scanline):
-                a = line[i - unit] if i >= unit else 0
-                b = prev[i]
-                line[i] = (data_bytes[src] + ((a + b) >> 1)) & 0xFF
-                src += 1
-        elif filter_ == 4:  # paeth
-            for i in range(scanline):
-                a = line[i - unit] if i >= unit else 0
-                b = prev[i]
-                c = prev[i - unit] if i >= unit else 0
-                p = a + b - c
-                pa = abs(p - a)
-                pb = abs(p - b)
-                pc = abs(p - c)
-                if pa <= pb and pa <= pc:
-                    p = a
-                elif pb <= pc:
-                    p = b
-                else:
-                    p = c
-                line[i] = (data_bytes[src] + p) & 0xFF
-                src += 1
-        else:
-            raise ValueError("Wrong filter.")
-        if mode in (0, 4):  # grayscale
-            for x in range(width):
-                c = line[x * unit]
-                bmp[x, y] = pal.convert((c << 16) | (c << 8) | c)
-        elif mode in {2, 6}:  # rgb
-            for x in range(width):
-                bmp[x, y] = pal.convert(
-                    (line[x * unit + 0] << 16) | (line[x * unit + 1] << 8) | line[x * unit + 2]
-                )
+    values = writer.row
+    table = unpack_table(depth) if depth < 8 else None
+    sample = max(1, depth // 8)
+    # a row of bytes holds palette indices, that 8 bit scanlines hold already
+    direct = isinstance(values, bytearray) and depth * unit == 8
+    passes = _ADAM7 if interlaced else ((0, 0, 1, 1, 1, 1),)
+    sizes = []
+    for x0, y0, dx, dy, _, _ in passes:
+        columns = max(0, (width - x0 + dx - 1) // dx)
+        rows = max(0, (height - y0 + dy - 1) // dy) if columns else 0
+        sizes.append(((columns * depth * unit + 7) // 8, rows))
+    lines = _read_scanlines(file, size, sizes, max(1, depth * unit // 8))
+    for number, (x0, y0, dx, dy, block_width, block_height) in enumerate(passes):
+        scanline, rows = sizes[number]
+        columns = (width - x0 + dx - 1) // dx
+        for row in range(rows):
+            line = next(lines)
+            y = y0 + row * dy
+            yield y
+            if pass_callback and (block_width > 1 or block_height > 1):
+                # fill the area that later passes will refine, for a blocky preview
+                converted = direct
+                data = line if direct else values
+                for block_y in range(y, y + block_height):
+                    if not writer.keeps(block_y):
+                        continue
+                    if not converted:
+                        _convert_row(
+                            line, values, columns, mode, unit * sample, sample, table, keyed
+                        )
+                        converted = True
+                    for block_x in range(x0, x0 + block_width):
+                        writer.flush(block_y, block_x, columns, data, step=dx)
+            elif writer.keeps(y):
+                if not direct:
+                    _convert_row(line, values, columns, mode, unit * sample, sample, table, keyed)
+                writer.flush(y, x0, columns, line if direct else values, step=dx)
+        if pass_callback and interlaced:
+            pass_callback(writer.bitmap, pal, number + 1)
+
+
+def _convert_row(  # noqa: PLR0913 Too many arguments in function definition
+    line: Union[bytearray, memoryview],
+    values: Union[bytearray, array],
+    columns: int,
+    mode: int,
+    unit: int,
+    sample: int,
+    table: Optional[Tuple[bytes, ...]] = None,
+    keyed: bool = False,
+) -> None:
+    """Convert the first ``columns`` pixels of an unfiltered scanline into bitmap values,
+    palette indices for indexed images, gray levels for grayscale images loaded with a
+    palette and RGB565 colors for everything else. Pixels are
+    ``unit`` bytes apart, with ``sample`` bytes per sample of which only the first, most
+    significant one is used. Pixels packed into less than a byte are indices, or gray
+    levels, and are unpacked with ``table``, from `unpack_table`. With ``keyed`` the last
+    sample of each pixel is its alpha, see `_convert_keyed`."""
+    if keyed:
+        _convert_keyed(line, values, columns, mode, unit, sample)
+    elif table is not None and isinstance(values, bytearray):  # indexed or gray levels
+        unpack(line, values, columns, table)
+    elif mode in {0, 4} and isinstance(values, bytearray):  # gray levels
+        for x in range(columns):
+            values[x] = line[x * unit]
+    elif mode in {0, 4}:  # grayscale
+        for x in range(columns):
+            c = line[x * unit]
+            values[x] = (c & 0xF8) << 8 | (c & 0xFC) << 3 | c >> 3
+    else:  # rgb
+        green = sample
+        blue = 2 * sample
+        for x in range(columns):
+            i = x * unit
+            values[x] = (line[i] & 0xF8) << 8 | (line[i + green] & 0xFC) << 3 | line[i + blue] >> 3
+
+
+def _convert_keyed(  # noqa: PLR0913 Too many arguments in function definition
+    line: Union[bytearray, memoryview],
+    values: Union[bytearray, array],
+    columns: int,
+    mode: int,
+    unit: int,
+    sample: int,
+) -> None:
+    """Convert the pixels of a scanline with an alpha channel like `_convert_row`, in the
+    same pass loading the ones that are less than half opaque as ``TRANSPARENT_KEY``, and
+    opaque ones of that value as 0 instead."""
+    alpha = unit - sample
+    levels = isinstance(values, bytearray)
+    green = sample
+    blue = 2 * sample
+    for x in range(columns):
+        i = x * unit
+        if line[i + alpha] < 0x80:
+            values[x] = TRANSPARENT_KEY
+            continue
+        if mode == 6:
+            value = (line[i] & 0xF8) << 8 | (line[i + green] & 0xFC) << 3 | line[i + blue] >> 3
+        elif levels:
+            value = line[i]
         else:
-            raise ValueError("Unsupported color mode.")
+            c = line[i]
+            value = (c & 0xF8) << 8 | (c & 0xFC) << 3 | c >> 3
+        values[x] = 0 if value == TRANSPARENT_KEY else value
 
-        prev, line = line, prev
 
-    pal = displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565)
-    return bmp, pal
+def _read_idat(file: BufferedReader, size: int) -> Iterator[bytes]:
+    """
+    Generator to read the compressed data of consecutive IDAT chunks in small pieces,
+    starting with the data of an IDAT chunk of ``size`` bytes whose header was just read.
+    """
+    while True:
+        while size:
+            data = file.read(min(size, _IDAT_READ_SIZE))
+            if not data:
+                return
+            size -= len(data)
+            yield data
+        file.seek(4, 1)  # skip CRC
+        header = file.read(8)
+        if len(header) < 8:
+            return
+        size, chunk = struct.unpack(">I4s", header)
+        if chunk != b"IDAT":
+            return
+
+
+def _decompress(file: BufferedReader, size: int, max_length: int) -> Iterator[bytes]:
+    """
+    Generator to decompress the IDAT data as it is read, a piece of at most
+    ``max_length`` bytes at a time. That only happens where there is
+    `zlib.decompressobj`, on hosts. On CircuitPython all of the compressed data has to
+    be read before it is decompressed in one go, and yielded as a single piece. The
+    compressed data is freed before the piece is yielded, so it isn't kept while the
+    image is decoded.
+    """
+    if not hasattr(zlib, "decompressobj"):
+        compressed = bytearray()
+        for piece in _read_idat(file, size):
+            compressed.extend(piece)
+        decompressed = zlib.decompress(compressed)
+        del compressed
+        yield decompressed
+        return
+    decompressor = zlib.decompressobj()
+    for piece in _read_idat(file, size):
+        data = piece
+        while data:
+            yield decompressor.decompress(data, max_length)
+            data = decompressor.unconsumed_tail
+
+
+def _read_scanlines(
+    file: BufferedReader, size: int, passes: List[Tuple[int, int]], unit: int
+) -> Iterator[memoryview]:
+    """
+    Generator to decompress and unfilter the image data one scanline at a time.
+
+    Only two scanline buffers are used, so each yielded scanline is only valid
+    until the next one is requested.
+
+    :param io.BufferedReader file: The PNG file, just past the header of the first IDAT chunk
+    :param int size: Size of the first IDAT chunk
+    :param list passes: The number of bytes in a scanline, not counting the filter type byte,
+      and the number of scanlines, for each pass of the image. Non-interlaced images have a
+      single pass, empty passes are skipped.
+    :param int unit: Number of bytes per complete pixel, at least 1
+    """
+    max_scanline = max(scanline for scanline, _ in passes)
+    buffers = (memoryview(bytearray(max_scanline)), memoryview(bytearray(max_scanline)))
+    data = _decompress(file, size, max_scanline + 1)
+    view = memoryview(b"")
+    start = end = 0
+    for scanline, rows in passes:
+        if not scanline or not rows:
+            continue
+        line = buffers[0][:scanline]
+        prev = buffers[1][:scanline]
+        prev[0:scanline] = bytes(scanline)  # each pass starts over with a blank previous line
+        up_masks = _up_masks(scanline)
+        for _ in range(rows):
+            filter_ = -1
+            pos = 0
+            while pos < scanline:
+                if start == end:
+                    chunk = next(data, None)
+                    if chunk is None:
+                        return
+                    view = memoryview(chunk)
+                    start = 0
+                    end = len(chunk)
+                    continue
+                if filter_ < 0:
+                    filter_ = view[start]
+                    start += 1
+                    continue
+                count = min(scanline - pos, end - start)
+                line[pos : pos + count] = view[start : start + count]
+                pos += count
+                start += count
+            _unfilter(filter_, line, prev, unit, up_masks)
+            yield line
+            prev, line = line, prev
+
+
+def _up_masks(scanline: int) -> Optional[Tuple[int, int]]:
+    """Masks used to add two whole scanlines bytewise as integers, if longints are available."""
+    if sys.maxsize > 1073741823:
+        return (
+            int.from_bytes(b"\x7f" * scanline, "little"),
+            int.from_bytes(b"\x80" * scanline, "little"),
+        )
+    return None
+
+
+def _unfilter(  # noqa: PLR0912 Too many branches
+    filter_: int,
+    line: Union[bytearray, memoryview],
+    prev: Union[bytearray, memoryview],
+    unit: int,
+    up_masks: Optional[Tuple[int, int]] = None,
+) -> None:
+    """
+    Reverse the filter applied to a whole scanline, in place.
+
+    :param int filter_: The filter type byte that preceded the scanline
+    :param bytearray|memoryview line: The filtered scanline, replaced by the unfiltered bytes
+    :param bytearray|memoryview prev: The previous unfiltered scanline, all zeros for the first one
+    :param int unit: Number of bytes per complete pixel, at least 1
+    :param up_masks: The result of `_up_masks` for this scanline length
+    """
+    scanline = len(line)
+    if filter_ == 0:  # none
+        pass
+    elif filter_ == 1:  # sub
+        for i in range(unit, scanline):
+            line[i] = (line[i] + line[i - unit]) & 0xFF
+    elif filter_ == 2:  # up
+        if up_masks:
+            # add every byte at once, keeping carries from crossing byte boundaries
+            low, high = up_masks
+            a = int.from_bytes(line, "little")
+            b = int.from_bytes(prev, "little")
+            line[0:scanline] = (((a & low) + (b & low)) ^ ((a ^ b) & high)).to_bytes(
+                scanline, "little"
+            )
+        else:
+            for i in range(scanline):
+                line[i] = (line[i] + prev[i]) & 0xFF
+    elif filter_ == 3:  # average
+        for i in range(unit):
+            line[i] = (line[i] + (prev[i] >> 1)) & 0xFF
+        for i in range(unit, scanline):
+            line[i] = (line[i] + ((line[i - unit] + prev[i]) >> 1)) & 0xFF
+    elif filter_ == 4:  # paeth
+        # with no pixel to the left, the predictor is always the byte above
+        for i in range(unit):
+            line[i] = (line[i] + prev[i]) & 0xFF
+        for i in range(unit, scanline):
+            a = line[i - unit]
+            b = prev[i]
+            c = prev[i - unit]
+            pa = b - c
+            pb = a - c
+            pc = abs(pa + pb)
+            pa = abs(pa)
+            pb = abs(pb)
+            if pa <= pb and pa <= pc:
+                p = a
+            elif pb <= pc:
+                p = b
+            else:
+                p = c
+            line[i] = (line[i] + p) & 0xFF
+    else:
+        raise ValueError("Wrong filter.")
@@ -33,106 +33,239 @@ try:
 except ImportError:
     pass
 
+from .. import Band, ImageInfo
+from ..row_writer import RowWriter, crop_window, scaled_size, write_bands
+from .tokenizer import Tokenizer
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(  # noqa: PLR0912 Too many branches
+def load(  # noqa: PLR0913 Too many arguments in function definition
     file: BufferedReader,
     header: bytes,
     *,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Optional[Bitmap], Optional[Palette]]:
     """
     Scan for netpbm format info, skip over comments, and delegate to a submodule
     to do the actual data loading.
     Formats P1, P4 have two space padded pieces of information: width and height.
     All other formats have three: width, height, and max color value.
-    This load function will move the file stream pointer to the start of data in all cases.
+
+    ``header`` is the first bytes of the file. When the file has been read past more than
+    the magic number it is read on from there, so a stream that can't seek can be loaded,
+    unless a ``crop`` or ``scale`` of a binary image is loaded. Otherwise the file
+    is moved to just after the magic number.
+
+    ``crop`` is the x, y, width and height of the part of the image to load, the whole
+    image if None. The binary formats seek to the rows and bytes that are needed, the
+    ascii formats read the rest of the image without storing it.
+    ``scale`` loads the image 1, 2, 4 or 8 times smaller, keeping every scale-th pixel
+    of every scale-th row.
     """
     magic_number = header[:2]
-    file.seek(2)
-    pnm_header = []  # type: List[int]
-    next_value = bytearray()
-    while True:
-        # We have all we need at length 3 for formats P2, P3, P5, P6
-        if len(pnm_header) == 3:
-            if magic_number in [b"P2", b"P5"]:
-                from . import pgm
-
-                return pgm.load(
-                    file,
-                    magic_number,
-                    pnm_header,
-                    bitmap=bitmap,
-                    palette=palette,
-                )
-
-            if magic_number == b"P3":
-                from . import ppm_ascii
-
-                return ppm_ascii.load(
-                    file,
-                    pnm_header[0],
-                    pnm_header[1],
-                    bitmap=bitmap,
-                    palette=palette,
-                )
-
-            if magic_number == b"P6":
-                from . import ppm_binary
-
-                return ppm_binary.load(
-                    file,
-                    pnm_header[0],
-                    pnm_header[1],
-                    bitmap=bitmap,
-                    palette=palette,
-                )
-
-        if len(pnm_header) == 2 and magic_number in [b"P1", b"P4"]:
-            if not bitmap:
-                raise RuntimeError(
-                    "A bitmap constructor is required for this type of pnm format file"
-                )
-            bitmap_obj = bitmap(pnm_header[0], pnm_header[1], 1)
-            palette_obj = None
-            if palette:
-                palette_obj = palette(1)
-                palette_obj[0] = b"\xff\xff\xff"
-            if magic_number.startswith(b"P1"):
-                from . import pbm_ascii
-
-                return pbm_ascii.load(
-                    file,
-                    pnm_header[0],
-                    pnm_header[1],
-                    bitmap=bitmap_obj,
-                    palette=palette_obj,
-                )
+    pnm_header, data = _read_header(file, header)
+    if magic_number in [b"P2", b"P5"]:
+        from . import pgm
 
-            from . import pbm_binary
+        return pgm.load(
+            data,
+            magic_number,
+            pnm_header,
+            bitmap=bitmap,
+            palette=palette,
+            crop=crop,
+            scale=scale,
+        )
+
+    if magic_number == b"P3":
+        from . import ppm_ascii
+
+        return ppm_ascii.load(
+            data,
+            pnm_header[0],
+            pnm_header[1],
+            bitmap=bitmap,
+            palette=palette,
+            crop=crop,
+            scale=scale,
+        )
 
-            return pbm_binary.load(
-                file,
+    if magic_number == b"P6":
+        from . import ppm_binary
+
+        return ppm_binary.load(
+            data,
+            pnm_header[0],
+            pnm_header[1],
+            bitmap=bitmap,
+            palette=palette,
+            crop=crop,
+            scale=scale,
+        )
+
+    if magic_number in [b"P1", b"P4"]:
+        if not bitmap:
+            raise RuntimeError("A bitmap constructor is required for this type of pnm format file")
+        _, _, crop_width, crop_height = crop_window(crop, pnm_header[0], pnm_header[1])
+        bitmap_obj = bitmap(scaled_size(crop_width, scale), scaled_size(crop_height, scale), 1)
+        palette_obj = None
+        if palette:
+            palette_obj = palette(1)
+            palette_obj[0] = b"\xff\xff\xff"
+        if magic_number.startswith(b"P1"):
+            from . import pbm_ascii
+
+            return pbm_ascii.load(
+                data,
                 pnm_header[0],
                 pnm_header[1],
                 bitmap=bitmap_obj,
                 palette=palette_obj,
+                crop=crop,
+                scale=scale,
             )
 
-        next_byte = file.read(1)
-        if next_byte == b"":
-            # mpy-cross does not support !r in f-string substitution, so ignore ruff rule
-            raise RuntimeError("Unsupported image format {!r}".format(magic_number))  # noqa: UP032, f-string
-        if next_byte == b"#":  # comment found, seek until a newline or EOF is found
-            while file.read(1) not in [b"", b"\n"]:  # EOF or NL
-                pass
-        elif not next_byte.isdigit():  # boundary found in header data
-            if next_value:
-                # pull values until space is found
-                pnm_header.append(int("".join([chr(char) for char in next_value])))
-                next_value = bytearray()  # reset the byte array
+        from . import pbm_binary
+
+        return pbm_binary.load(
+            data,
+            pnm_header[0],
+            pnm_header[1],
+            bitmap=bitmap_obj,
+            palette=palette_obj,
+            crop=crop,
+            scale=scale,
+        )
+
+    # mpy-cross does not support !r in f-string substitution, so ignore ruff rule
+    raise RuntimeError("Unsupported image format {!r}".format(magic_number))  # noqa: UP032, f-string
+
+
+def bands(  # noqa: PLR0912 Too many branches
+    file: BufferedReader,
+    header: bytes,
+    rows: int = 16,
+    *,
+    bitmap: BitmapConstructor,
+    palette: Optional[PaletteConstructor] = None,
+) -> Iterator[Band]:
+    """
+    Load a netpbm image a band of ``rows`` rows at a time, see `adafruit_imageload.bands`.
+    Color (ppm) images are loaded as RGB565 with a `displayio.ColorConverter`, as their
+    palette is not known until the last row has been read.
+    """
+    magic_number = header[:2]
+    pnm_header, data = _read_header(file, header)
+    width, height = pnm_header[0], pnm_header[1]
+    if magic_number in [b"P3", b"P6"]:
+        if magic_number == b"P3":
+            from .ppm_ascii import read_rows
         else:
-            next_value += next_byte  # push the digit into the byte array
+            from .ppm_binary import read_rows
+        from . import ppm_palette
+
+        yield from ppm_palette.bands(read_rows(data, width, height), width, height, rows, bitmap)
+        return
+
+    palette_obj = None
+    if magic_number in [b"P2", b"P5"]:
+        if pnm_header[2] > 255:
+            raise NotImplementedError("16 bit files are not supported")
+        colors = pnm_header[2] + 1
+        if palette:
+            from .pgm import build_palette
+
+            palette_obj = build_palette(palette, pnm_header[2])
+        writer = RowWriter(bitmap(width, min(rows, height), colors), colors)
+        if magic_number == b"P2":
+            from .pgm import ascii as pgm_ascii
+
+            decoder = pgm_ascii.write_rows(data, writer, width, height)
+        else:
+            from .pgm import binary
+
+            decoder = binary.write_rows(data, writer, width, range(height), False)
+    elif magic_number in [b"P1", b"P4"]:
+        if palette:
+            palette_obj = palette(1)
+            palette_obj[0] = b"\xff\xff\xff"
+        writer = RowWriter(bitmap(width, min(rows, height), 1), 1)
+        if magic_number == b"P1":
+            from . import pbm_ascii
+
+            decoder = pbm_ascii.write_rows(data, writer, width, height)
+        else:
+            from . import pbm_binary
+
+            decoder = pbm_binary.write_rows(data, writer, width, range(height), False)
+    else:
+        raise RuntimeError("Unsupported image format {!r}".format(magic_number))  # noqa: UP032, f-string
+    yield from write_bands(decoder, writer, height, palette_obj)
+
+
+def info(file: BufferedReader, header: bytes) -> ImageInfo:
+    """
+    Read the size and maximum value of a netpbm image, without reading any pixel data.
+    """
+    magic_number = header[:2]
+    pnm_header, _ = _read_header(file, header)
+    width, height = pnm_header[0], pnm_header[1]
+    if magic_number in [b"P1", b"P4"]:
+        return ImageInfo("pbm", width, height, 1, 2, 1)
+    if magic_number in [b"P2", b"P5"]:
+        return ImageInfo("pgm", width, height, pnm_header[2].bit_length(), pnm_header[2] + 1, 1)
+    if magic_number in [b"P3", b"P6"]:
+        # the palette is only known once all of the pixels are read
+        return ImageInfo("ppm", width, height, 3 * pnm_header[2].bit_length(), 0, 1)
+    raise RuntimeError("Unsupported image format {!r}".format(magic_number))  # noqa: UP032, f-string
+
+
+def whole_image_file(
+    file: Union[BufferedReader, Tokenizer], size: int
+) -> Optional[Union[BufferedReader, Tokenizer]]:
+    """
+    The file to read the ``size`` bytes of a whole binary image from at once with
+    `bitmaptools.readinto`, from where ``file`` is, or None when the image has to be read
+    row by row. A file that is cut short is read row by row, to load the rows that are
+    there, and so is a file that can't seek to find its size. For a `Tokenizer` it is the
+    file the tokenizer reads, as `bitmaptools.readinto` needs a real file, moved to where
+    the tokenizer is.
+    """
+    try:
+        start = file.tell()
+        file.seek(0, 2)
+        end = file.tell()
+        # dropping the bytes a tokenizer read ahead
+        file.seek(start)
+    except (AttributeError, OSError):
+        return None
+    if end - start < size:
+        return None
+    return file.file if isinstance(file, Tokenizer) else file
+
+
+def _read_header(file: BufferedReader, header: bytes) -> Tuple[List[int], Tokenizer]:
+    """
+    Read the width, height and (except for P1 and P4) max color value that follow the
+    magic number, skipping over comments. Returns them with the `Tokenizer` that read them,
+    to read the pixel data from, as it holds the bytes it read ahead of them.
+
+    The file is read on from the end of ``header`` when it is longer than the magic number,
+    without moving it, so it doesn't have to be seekable. Otherwise it is moved to just
+    after the magic number.
+    """
+    magic_number = header[:2]
+    if len(header) <= 2:
+        file.seek(2)
+    count = 2 if magic_number in [b"P1", b"P4"] else 3
+    pnm_header = [0] * count  # type: List[int]
+    tokens = Tokenizer(file, prefix=header[2:])
+    if tokens.read_numbers(pnm_header, count) < count:
+        # mpy-cross does not support !r in f-string substitution, so ignore ruff rule
+        raise RuntimeError("Unsupported image format {!r}".format(magic_number))  # noqa: UP032, f-string
+    return pnm_header, tokens
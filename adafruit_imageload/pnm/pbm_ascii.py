@@ -18,35 +18,53 @@ return None for pallet.
 
 try:
     from io import BufferedReader
-    from typing import Optional, Tuple
+    from typing import Iterator, Optional, Tuple, Union
 
     from displayio import Bitmap, Palette
 except ImportError:
     pass
 
+from ..row_writer import RowWriter, crop_window
+from .tokenizer import Tokenizer
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(
-    file: BufferedReader,
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     width: int,
     height: int,
     bitmap: Bitmap,
     palette: Optional[Palette] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Bitmap, Optional[Palette]]:
     """
     Load a P1 'PBM' ascii image into the displayio.Bitmap
+
+    With a ``crop``, the bitmap only holds that part of the image, the pixels
+    outside of it are read but not stored. The bitmap must already be scaled down
+    when ``scale`` is 2, 4 or 8, every scale-th pixel of every scale-th row is kept.
     """
-    next_byte = b"1"  # just to start the iterator
-    for y in range(height):
-        x = 0
-        while next_byte:
-            next_byte = file.read(1)
-            if not next_byte.isdigit():
-                continue
-            bitmap[x, y] = 1 if next_byte == b"1" else 0
-            if x == width - 1:
-                break
-            x += 1
+    left, top, _, crop_height = crop_window(crop, width, height)
+    writer = RowWriter(bitmap, 1, left, top, width, scale)
+    for _ in write_rows(file, writer, width, top + crop_height):
+        pass
     return bitmap, palette
+
+
+def write_rows(
+    file: Union[BufferedReader, Tokenizer], writer: RowWriter, width: int, height: int
+) -> Iterator[int]:
+    """
+    Generator to read the first ``height`` rows of the image into ``writer``, yielding
+    the number of each row before it is written. The pixels of a row are read straight
+    into the row of the writer.
+    """
+    row = writer.row
+    tokens = Tokenizer(file, digits=True)
+    for y in range(height):
+        yield y
+        # a row cut short by the end of the file, see RowWriter.flush
+        writer.flush(y, 0, tokens.read_numbers(row, width))
@@ -18,59 +18,88 @@ return None for pallet.
 
 try:
     from io import BufferedReader
-    from typing import Iterator, Optional, Tuple
+    from typing import Iterable, Iterator, Optional, Tuple, Union
 
     from displayio import Bitmap, Palette
+
+    from .tokenizer import Tokenizer
 except ImportError:
     pass
 
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None
+
+from ..row_writer import RowWriter, crop_window, unpack, unpack_table
+from . import whole_image_file
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(
-    file: BufferedReader,
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     width: int,
     height: int,
     bitmap: Bitmap,
     palette: Optional[Palette] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Bitmap, Optional[Palette]]:
     """
     Load a P4 'PBM' binary image into the Bitmap
-    """
-    padded_width = (width + 7) // 8 * 8
-    x = 0
-    y = 0
-    while True:
-        next_byte = file.read(1)
-        if not next_byte:
-            break  # out of bits
-        for bit in iterbits(next_byte):
-            if x < width:
-                bitmap[x, y] = bit
-            x += 1
-            if x > padded_width - 1:
-                y += 1
-                x = 0
-            if y > height - 1:
-                break
-    return bitmap, palette
-
 
-def iterbits(b: bytes) -> Iterator[int]:
-    """
-    generator to iterate over the bits in a byte (character)
+    With a ``crop``, the bitmap only holds that part of the image and only
+    the bytes of the pixels in it are read. The bitmap must already be scaled down
+    when ``scale`` is 2, 4 or 8, then only every scale-th row is read.
+    Whole images are read with `bitmaptools.readinto` when it is available, as they are
+    packed the same way as a 1 bit bitmap.
     """
-    in_char = reverse(int.from_bytes(b, "little"))
-    for i in range(8):
-        yield (in_char >> i) & 1
+    whole = None
+    if _bitmap_readinto and not crop and scale == 1:
+        whole = whole_image_file(file, (width + 7) // 8 * height)
+    if whole is not None:
+        # rows are padded to a whole byte, the first pixel is the top bit
+        _bitmap_readinto(bitmap, whole, bits_per_pixel=1, reverse_pixels_in_element=True)
+        return bitmap, palette
+    left, top, _, crop_height = crop_window(crop, width, height)
+    writer = RowWriter(bitmap, 1, left, top, scale=scale)
+    rows = range(top, top + crop_height, scale)
+    for _ in write_rows(file, writer, width, rows, bool(crop) or scale > 1):
+        pass
+    return bitmap, palette
 
 
-def reverse(b: int) -> int:
+def write_rows(
+    file: Union[BufferedReader, Tokenizer],
+    writer: RowWriter,
+    width: int,
+    rows: Iterable[int],
+    seek: bool,
+) -> Iterator[int]:
     """
-    reverse bit order so the iterbits works
+    Generator to read ``rows`` of the image into ``writer``, yielding the number of each
+    row before it is written. Only the bytes of the columns of the bitmap of the writer
+    are read, a row at a time, and they are unpacked a whole byte at a time with a table.
+    Without ``seek`` the rows must follow each other in the file, from where it is now.
     """
-    b = (b & 0xF0) >> 4 | (b & 0x0F) << 4
-    b = (b & 0xCC) >> 2 | (b & 0x33) << 2
-    b = (b & 0xAA) >> 1 | (b & 0x55) << 1
-    return b
+    left = writer.x
+    scale = writer.scale
+    # each row is padded to a whole byte
+    row_bytes = (width + 7) // 8
+    first_byte = left // 8
+    line = bytearray((left + (writer.width - 1) * scale) // 8 + 1 - first_byte)
+    pixels = bytearray(8 * len(line))
+    table = unpack_table(1)
+    start = file.tell() if seek else 0
+    for y in rows:
+        if seek:
+            file.seek(start + y * row_bytes + first_byte)
+        count = file.readinto(line)
+        if not count:
+            break  # out of bits
+        yield y
+        # a row cut short by the end of the file, see RowWriter.flush
+        unpack(line, pixels, 8 * count, table)
+        writer.flush(y, 8 * first_byte, 8 * count, pixels)
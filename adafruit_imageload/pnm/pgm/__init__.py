@@ -17,39 +17,75 @@ Load pixel values (indices or colors) into a bitmap and colors into a palette.
 
 try:
     from io import BufferedReader
-    from typing import List, Optional, Set, Tuple
+    from typing import List, Optional, Tuple, Union
 
     from displayio import Bitmap, Palette
 
     from ...displayio_types import BitmapConstructor, PaletteConstructor
+    from ..tokenizer import Tokenizer
 except ImportError:
     pass
 
 
-def load(
-    file: BufferedReader,
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     magic_number: bytes,
     header: List[int],
     *,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Optional[Bitmap], Optional[Palette]]:
     """
     Perform the load of Netpbm greyscale images (P2, P5)
+
+    Gray levels are used directly as palette indices, with a palette of
+    ``maxval + 1`` grays, so the pixel data only needs to be read once.
     """
-    if header[2] > 256:
+    if header[2] > 255:
         raise NotImplementedError("16 bit files are not supported")
     width = header[0]
     height = header[1]
+    maxval = header[2]
 
     if magic_number == b"P2":  # To handle ascii PGM files.
         from . import ascii as pgm_ascii
 
-        return pgm_ascii.load(file, width, height, bitmap=bitmap, palette=palette)
+        return pgm_ascii.load(
+            file,
+            width,
+            height,
+            bitmap=bitmap,
+            palette=palette,
+            maxval=maxval,
+            crop=crop,
+            scale=scale,
+        )
 
     if magic_number == b"P5":  # To handle binary PGM files.
         from . import binary
 
-        return binary.load(file, width, height, bitmap=bitmap, palette=palette)
+        return binary.load(
+            file,
+            width,
+            height,
+            bitmap=bitmap,
+            palette=palette,
+            maxval=maxval,
+            crop=crop,
+            scale=scale,
+        )
 
     raise NotImplementedError("Was not able to send image")
+
+
+def build_palette(palette_class: PaletteConstructor, maxval: int) -> Palette:
+    """
+    construct the Palette, and populate it with ``maxval + 1`` grays from black to white
+    """
+    palette = palette_class(maxval + 1)
+    for level in range(maxval + 1):
+        gray = level * 255 // maxval if maxval else 0
+        palette[level] = bytes((gray, gray, gray))
+    return palette
@@ -17,7 +17,7 @@ Load pixel values (indices or colors) into a bitmap and colors into a palette.
 
 try:
     from io import BufferedReader
-    from typing import Optional, Set, Tuple
+    from typing import Iterator, Optional, Tuple, Union
 
     from displayio import Bitmap, Palette
 
@@ -25,55 +25,56 @@ try:
 except ImportError:
     pass
 
+from ...row_writer import RowWriter, crop_window, scaled_size
+from ..tokenizer import Tokenizer
+from . import build_palette
 
-def load(
-    file: BufferedReader,
+
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     width: int,
     height: int,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    maxval: int = 255,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Optional[Bitmap], Optional[Palette]]:
     """
     Load a PGM ascii file (P2)
+
+    With a ``crop``, the pixels outside of it are read but not stored, as are the
+    pixels dropped by a ``scale`` of 2, 4 or 8.
     """
-    data_start = file.tell()  # keep this so we can rewind
-    _palette_colors = set()
-    pixel = bytearray()
-    # build a set of all colors present in the file, so palette and bitmap can be constructed
-    while True:
-        byte = file.read(1)
-        if byte == b"":
-            break
-        if not byte.isdigit():
-            int_pixel = int("".join([chr(char) for char in pixel]))
-            _palette_colors.add(int_pixel)
-            pixel = bytearray()
-        pixel += byte
     palette_obj = None
     if palette:
-        palette_obj = build_palette(palette, _palette_colors)
+        palette_obj = build_palette(palette, maxval)
     bitmap_obj = None
     if bitmap:
-        bitmap_obj = bitmap(width, height, len(_palette_colors))
-        file.seek(data_start)
-        for y in range(height):
-            for x in range(width):
-                pixel = bytearray()
-                while True:
-                    byte = file.read(1)
-                    if not byte.isdigit():
-                        break
-                    pixel += byte
-                int_pixel = int("".join([chr(char) for char in pixel]))
-                bitmap_obj[x, y] = list(_palette_colors).index(int_pixel)
+        left, top, crop_width, crop_height = crop_window(crop, width, height)
+        bitmap_obj = bitmap(
+            scaled_size(crop_width, scale), scaled_size(crop_height, scale), maxval + 1
+        )
+        writer = RowWriter(bitmap_obj, maxval + 1, left, top, width, scale)
+        for _ in write_rows(file, writer, width, top + crop_height):
+            pass
     return bitmap_obj, palette_obj
 
 
-def build_palette(palette_class: PaletteConstructor, palette_colors: Set[int]) -> Palette:
+def write_rows(
+    file: Union[BufferedReader, Tokenizer], writer: RowWriter, width: int, height: int
+) -> Iterator[int]:
     """
-    construct the Palette, and populate it with the set of palette_colors
+    Generator to read the first ``height`` rows of the image into ``writer``, yielding
+    the number of each row before it is written. The values of a row are read straight
+    into the row of the writer, missing values at the end of the file are black.
     """
-    palette = palette_class(len(palette_colors))
-    for counter, color in enumerate(palette_colors):
-        palette[counter] = bytes([color, color, color])
-    return palette
+    row = writer.row
+    assert isinstance(row, bytearray)  # there are at most 256 gray levels
+    tokens = Tokenizer(file)
+    for y in range(height):
+        yield y
+        count = tokens.read_numbers(row, width)
+        if count < width:
+            row[count:width] = bytes(width - count)
+        writer.flush(y)
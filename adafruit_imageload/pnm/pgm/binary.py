@@ -17,51 +17,86 @@ Load pixel values (indices or colors) into a bitmap and colors into a palette.
 
 try:
     from io import BufferedReader
-    from typing import Optional, Set, Tuple
+    from typing import Iterable, Iterator, Optional, Tuple, Union
 
     from displayio import Bitmap, Palette
 
     from ...displayio_types import BitmapConstructor, PaletteConstructor
+    from ..tokenizer import Tokenizer
 except ImportError:
     pass
 
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None
+
+from ...row_writer import RowWriter, crop_window, scaled_size
+from .. import whole_image_file
+from . import build_palette
+
 
-def load(
-    file: BufferedReader,
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     width: int,
     height: int,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
+    maxval: int = 255,
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
 ) -> Tuple[Optional[Bitmap], Optional[Palette]]:
     """
     Load a P5 format file (binary), handle PGM (greyscale)
-    """
-    palette_colors = set()  # type: Set[int]
-    data_start = file.tell()
-    for y in range(height):
-        data_line = iter(bytes(file.read(width)))
-        for pixel in data_line:
-            palette_colors.add(pixel)
 
+    With a ``crop``, only the bytes of the pixels in it are read. With a ``scale``
+    of 2, 4 or 8 only every scale-th row is read. Whole images are read with
+    `bitmaptools.readinto` when it is available.
+    """
     palette_obj = None
     if palette:
-        palette_obj = build_palette(palette, palette_colors)
+        palette_obj = build_palette(palette, maxval)
     bitmap_obj = None
     if bitmap:
-        bitmap_obj = bitmap(width, height, len(palette_colors))
-        file.seek(data_start)
-        for y in range(height):
-            data_line = iter(bytes(file.read(width)))
-            for x, pixel in enumerate(data_line):
-                bitmap_obj[x, y] = list(palette_colors).index(pixel)
+        left, top, crop_width, crop_height = crop_window(crop, width, height)
+        bitmap_obj = bitmap(
+            scaled_size(crop_width, scale), scaled_size(crop_height, scale), maxval + 1
+        )
+        whole = None
+        if _bitmap_readinto and not crop and scale == 1:
+            whole = whole_image_file(file, width * height)
+        if whole is not None:
+            _bitmap_readinto(bitmap_obj, whole, bits_per_pixel=8)
+            return bitmap_obj, palette_obj
+        writer = RowWriter(bitmap_obj, maxval + 1, left, top, scale=scale)
+        rows = range(top, top + crop_height, scale)
+        for _ in write_rows(file, writer, width, rows, bool(crop) or scale > 1):
+            pass
     return bitmap_obj, palette_obj
 
 
-def build_palette(palette_class: PaletteConstructor, palette_colors: Set[int]) -> Palette:
+def write_rows(
+    file: Union[BufferedReader, Tokenizer],
+    writer: RowWriter,
+    width: int,
+    rows: Iterable[int],
+    seek: bool,
+) -> Iterator[int]:
     """
-    construct the Palette, and populate it with the set of palette_colors
+    Generator to read ``rows`` of the image into ``writer``, yielding the number of each
+    row before it is written. Only the bytes of the columns of the bitmap of the writer
+    are read. Without ``seek`` the rows must follow each other in the file, from where
+    it is now.
     """
-    _palette = palette_class(len(palette_colors))
-    for counter, color in enumerate(palette_colors):
-        _palette[counter] = bytes([color, color, color])
-    return _palette
+    left = writer.x
+    scale = writer.scale
+    # a scaled row is read whole and then thinned out by the writer
+    line = writer.row if scale == 1 else bytearray((writer.width - 1) * scale + 1)
+    assert isinstance(line, bytearray)  # there are at most 256 gray levels
+    start = file.tell() if seek else 0
+    for y in rows:
+        if seek:
+            file.seek(start + y * width + left)
+        file.readinto(line)
+        yield y
+        writer.flush(y, left, data=line)
@@ -25,74 +25,80 @@ try:
         Iterator,
         List,
         Optional,
-        Set,
         Tuple,
+        Union,
     )
 
-    from displayio import Bitmap, Palette
+    from displayio import Bitmap, ColorConverter, Palette
 
     from ..displayio_types import BitmapConstructor, PaletteConstructor
 except ImportError:
     pass
 
+from ..row_writer import crop_window, scaled_size
+from . import ppm_palette
+from .tokenizer import Tokenizer
 
-def load(
-    file: BufferedReader,
+
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     width: int,
     height: int,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
-) -> Tuple[Optional[Bitmap], Optional[Palette]]:
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+) -> Tuple[Optional[Bitmap], Optional[Union[Palette, ColorConverter]]]:
     """
     :param stream file: infile with the position set at start of data
     :param int width:
     :param int height:
-    :param int max_colors: color space of file
     :param bitmap: displayio.Bitmap class
     :param palette: displayio.Palette class
+    :param tuple crop: x, y, width and height of the part of the image to load,
+      the rest is read but not stored
+    :param int scale: load the image 1, 2, 4 or 8 times smaller, keeping every
+      scale-th pixel of every scale-th row
     :return tuple:
     """
-    palette_colors = set()  # type: Set[bytes]
-    data_start = file.tell()
-    for triplet in read_three_colors(file):
-        palette_colors.add(triplet)
+    rows: Iterator[Union[bytearray, memoryview]] = read_rows(file, width, height)
+    left, top, crop_width, crop_height = crop_window(crop, width, height)
+    if crop or scale > 1:
+        rows = ppm_palette.crop_rows(rows, left, top, crop_width, crop_height, scale)
+    return ppm_palette.load(
+        rows,
+        scaled_size(crop_width, scale),
+        scaled_size(crop_height, scale),
+        bitmap=bitmap,
+        palette=palette,
+    )
+
 
-    palette_obj = None
-    if palette:
-        palette_obj = palette(len(palette_colors))
-        for counter, color in enumerate(palette_colors):
-            palette_obj[counter] = color
-    bitmap_obj = None
-    if bitmap:
-        file.seek(data_start)
-        bitmap_obj = bitmap(width, height, len(palette_colors))
-        for y in range(height):
-            for x in range(width):
-                for color in read_three_colors(file):
-                    bitmap_obj[x, y] = list(palette_colors).index(color)
-                    break  # exit the inner generator
-    return bitmap_obj, palette_obj
+def read_rows(
+    file: Union[BufferedReader, Tokenizer], width: int, height: int
+) -> Iterator[bytearray]:
+    """
+    Generator to assemble each row of RGB data, reusing a single buffer that the
+    values are read straight into. Missing values at the end of the file are filled
+    with black.
+    """
+    size = width * 3
+    line = bytearray(size)
+    tokens = Tokenizer(file)
+    for _ in range(height):
+        count = tokens.read_numbers(line, size)
+        if count < size:
+            line[count:size] = bytes(size - count)
+        yield line
 
 
-def read_three_colors(file: BufferedReader) -> Iterator[bytes]:
+def read_three_colors(file: Union[BufferedReader, Tokenizer]) -> Iterator[bytes]:
     """
     Generator to read integer values from file, in groups of three.
     Each value can be len 1-3, for values 0 - 255, space padded.
     :return Iterator[bytes]:
     """
-    triplet = []  # type: List[int]
-    color = bytearray()
-    while True:
-        this_byte = file.read(1)
-        if this_byte.isdigit():
-            color += this_byte
-        # not a digit means we completed one number (found a space separator or EOF)
-        elif color or (triplet and this_byte == b""):
-            triplet.append(int("".join([chr(char) for char in color])))
-            color = bytearray()
-        if len(triplet) == 3:  # completed one pixel
-            yield bytes(tuple(triplet))
-            triplet = []
-        # short circuit must be after all other cases, so we yield the last pixel before returning
-        if this_byte == b"":
-            return
+    triplet = bytearray(3)
+    tokens = Tokenizer(file)
+    while tokens.read_numbers(triplet, 3) == 3:
+        yield bytes(triplet)
@@ -18,57 +18,90 @@ return None for pallet.
 
 try:
     from io import BufferedReader
-    from typing import Optional, Set, Tuple
+    from typing import Iterator, Optional, Tuple, Union
 
-    from displayio import Bitmap, Palette
+    from displayio import Bitmap, ColorConverter, Palette
 
     from ..displayio_types import BitmapConstructor, PaletteConstructor
+    from .tokenizer import Tokenizer
 except ImportError:
     pass
 
+from ..row_writer import crop_window, scaled_size
+from . import ppm_palette
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
 
 
-def load(
-    file: BufferedReader,
+def load(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
     width: int,
     height: int,
     bitmap: Optional[BitmapConstructor] = None,
     palette: Optional[PaletteConstructor] = None,
-) -> Tuple[Optional[Bitmap], Optional[Palette]]:
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]] = None,
+    scale: int = 1,
+) -> Tuple[Optional[Bitmap], Optional[Union[Palette, ColorConverter]]]:
     """
     Load pixel values (indices or colors) into a bitmap and for a binary
     ppm, return None for pallet.
+
+    The pixel data is read once, so ``file`` does not need to be seekable, unless
+    a ``crop`` of the image is loaded. Then only the pixels inside of it are read.
+    With a ``scale`` of 2, 4 or 8 the image is loaded that many times smaller and
+    only every scale-th row is read.
+    Images with more than `ppm_palette.MAX_PALETTE_COLORS` distinct colors are
+    loaded as RGB565 values and returned with a `displayio.ColorConverter`.
+    """
+    left, top, crop_width, crop_height = crop_window(crop, width, height)
+    if crop or scale > 1:
+        rows = read_window(file, width, left, top, crop_width, crop_height, scale)
+    else:
+        rows = read_rows(file, width, height)
+    return ppm_palette.load(
+        rows,
+        scaled_size(crop_width, scale),
+        scaled_size(crop_height, scale),
+        bitmap=bitmap,
+        palette=palette,
+    )
+
+
+def read_rows(
+    file: Union[BufferedReader, Tokenizer], width: int, height: int
+) -> Iterator[bytearray]:
     """
+    Generator to read each row of RGB data, reusing a single buffer.
+    """
+    line = bytearray(width * 3)
+    for _ in range(height):
+        file.readinto(line)
+        yield line
+
 
-    data_start = file.tell()
-    palette_colors = set()  # type: Set[Tuple[int, int, int]]
-    line_size = width * 3
-
-    for y in range(height):
-        data_line = iter(bytes(file.read(line_size)))
-        for red in data_line:
-            # red, green, blue
-            palette_colors.add((red, next(data_line), next(data_line)))
-
-    palette_obj = None
-    if palette:
-        palette_obj = palette(len(palette_colors))
-        for counter, color in enumerate(palette_colors):
-            palette_obj[counter] = bytes(color)
-    bitmap_obj = None
-    if bitmap:
-        bitmap_obj = bitmap(width, height, len(palette_colors))
-        file.seek(data_start)
-        for y in range(height):
-            x = 0
-            data_line = iter(bytes(file.read(line_size)))
-            for red in data_line:
-                # red, green, blue
-                bitmap_obj[x, y] = list(palette_colors).index(
-                    (red, next(data_line), next(data_line))
-                )
-                x += 1
-
-    return bitmap_obj, palette_obj
+def read_window(  # noqa: PLR0913 Too many arguments in function definition
+    file: Union[BufferedReader, Tokenizer],
+    width: int,
+    x: int,
+    y: int,
+    window_width: int,
+    window_height: int,
+    scale: int = 1,
+) -> Iterator[bytearray]:
+    """
+    Generator to read the RGB data of each row of a window of the image, seeking
+    straight to it in the file and reusing a single buffer. With a ``scale`` of
+    2, 4 or 8 only every scale-th row is read and every scale-th pixel passed on.
+    """
+    start = file.tell()
+    line = bytearray(window_width * 3)
+    scaled = bytearray(scaled_size(window_width, scale) * 3 if scale > 1 else 0)
+    for row in range(y, y + window_height, scale):
+        file.seek(start + (row * width + x) * 3)
+        file.readinto(line)
+        if scale == 1:
+            yield line
+        else:
+            ppm_palette.scale_row(line, scaled, scale)
+            yield scaled
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2018 Scott Shawcroft for Adafruit Industries
+# SPDX-FileCopyrightText: 2022-2023 Matt Land
+# SPDX-FileCopyrightText: Brooke Storm
+# SPDX-FileCopyrightText: Sam McGahan
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_imageload.pnm.ppm_palette`
+====================================================
+
+Build a bitmap and palette from rows of RGB pixel data in a single pass,
+shared by the ascii and binary ppm loaders.
+
+* Author(s):  Matt Land, Brooke Storm, Sam McGahan
+
+"""
+
+try:
+    from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+    from displayio import Bitmap, ColorConverter, Palette
+
+    from ..displayio_types import BitmapConstructor, PaletteConstructor
+except ImportError:
+    pass
+
+from .. import Band
+from ..row_writer import RowWriter, scaled_size, write_bands
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
+
+# Images with more distinct colors than this are loaded as RGB565 truecolor,
+# a larger palette would need a 16 bit bitmap anyway.
+MAX_PALETTE_COLORS = 256
+
+
+def load(  # noqa: PLR0912 Too many branches
+    rows: Iterator[Union[bytearray, memoryview]],
+    width: int,
+    height: int,
+    bitmap: Optional[BitmapConstructor] = None,
+    palette: Optional[PaletteConstructor] = None,
+) -> Tuple[Optional[Bitmap], Optional[Union[Palette, ColorConverter]]]:
+    """
+    Decode ``height`` rows of ``width`` RGB888 pixels, discovering the palette as we go.
+
+    Pixels are stored as provisional palette indices until all colors are known and
+    the bitmap can be sized. When more than `MAX_PALETTE_COLORS` colors are found,
+    the pixels decoded so far are converted to RGB565 and the rest of the image is
+    written straight into a truecolor bitmap, returned with a `displayio.ColorConverter`.
+
+    :param Iterator[bytearray|memoryview] rows: yields each row of ``width * 3`` bytes in turn
+    :param int width: Image width in pixels
+    :param int height: Image height in pixels
+    :param BitmapConstructor bitmap: a function that returns a displayio.Bitmap
+    :param PaletteConstructor palette: a function that returns a displayio.Palette
+    """
+    # maps each 0xRRGGBB color to its palette index
+    palette_colors = {}  # type: Dict[int, int]
+    indices = bytearray(width * height if bitmap else width)
+    writer = None
+    for y in range(height):
+        line = next(rows)
+        offset = y * width if bitmap else 0
+        x = 0
+        if writer is None:
+            for x in range(width):
+                i = x * 3
+                color = line[i] << 16 | line[i + 1] << 8 | line[i + 2]
+                index = palette_colors.get(color)
+                if index is None:
+                    index = len(palette_colors)
+                    if index == MAX_PALETTE_COLORS:
+                        break
+                    palette_colors[color] = index
+                indices[offset + x] = index
+            else:
+                continue
+            if not bitmap:
+                return None, _truecolor_converter()
+            writer = _to_truecolor(bitmap, width, height, indices, offset + x, palette_colors)
+            del indices
+        row = writer.row
+        for x in range(x, width):
+            i = x * 3
+            row[x] = rgb565(line[i] << 16 | line[i + 1] << 8 | line[i + 2])
+        writer.flush(y)
+    if writer is not None:
+        return writer.bitmap, _truecolor_converter()
+
+    palette_obj = None
+    if palette:
+        palette_obj = palette(len(palette_colors))
+        for color, index in palette_colors.items():
+            palette_obj[index] = bytes((color >> 16, (color >> 8) & 0xFF, color & 0xFF))
+    bitmap_obj = None
+    if bitmap:
+        bitmap_obj = bitmap(width, height, len(palette_colors))
+        writer = RowWriter(bitmap_obj, len(palette_colors))
+        view = memoryview(indices)
+        for y in range(height):
+            writer.flush(y, data=view[y * width :])
+    return bitmap_obj, palette_obj
+
+
+def bands(
+    rows: Iterator[Union[bytearray, memoryview]],
+    width: int,
+    height: int,
+    band_height: int,
+    bitmap: BitmapConstructor,
+) -> Iterator[Band]:
+    """
+    Decode ``height`` rows of ``width`` RGB888 pixels into bands of ``band_height`` rows,
+    see `adafruit_imageload.bands`. The pixels are converted to RGB565 straight away, as
+    the palette is not known until the last row has been read.
+    """
+    writer = RowWriter(bitmap(width, min(band_height, height), 65536), 65536)
+    yield from write_bands(
+        _truecolor_rows(rows, writer, height), writer, height, _truecolor_converter()
+    )
+
+
+def _truecolor_rows(
+    rows: Iterator[Union[bytearray, memoryview]], writer: RowWriter, height: int
+) -> Iterator[int]:
+    """Convert ``height`` rows to RGB565 and write them to ``writer``, yielding the number
+    of each row before it is written."""
+    row = writer.row
+    for y in range(height):
+        line = next(rows)
+        yield y
+        for x in range(writer.width):
+            i = x * 3
+            row[x] = rgb565(line[i] << 16 | line[i + 1] << 8 | line[i + 2])
+        writer.flush(y)
+
+
+def crop_rows(  # noqa: PLR0913 Too many arguments in function definition
+    rows: Iterator[Union[bytearray, memoryview]],
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    scale: int = 1,
+) -> Iterator[Union[memoryview, bytearray]]:
+    """
+    Generator to pass on the part of each row of RGB data that is inside a window,
+    skipping the rows above it and stopping after its last row. With a ``scale``
+    of 2, 4 or 8 only every scale-th pixel of every scale-th row is passed on.
+    """
+    for _ in range(y):
+        next(rows)
+    scaled = bytearray(scaled_size(width, scale) * 3 if scale > 1 else 0)
+    for row in range(height):
+        line = memoryview(next(rows))[x * 3 : (x + width) * 3]
+        if row % scale:
+            continue
+        if scale == 1:
+            yield line
+        else:
+            scale_row(line, scaled, scale)
+            yield scaled
+
+
+def scale_row(line: Union[bytearray, memoryview], scaled: bytearray, scale: int) -> None:
+    """Copy every ``scale``-th pixel of a row of RGB data into ``scaled``."""
+    for i in range(0, len(scaled), 3):
+        j = i * scale
+        scaled[i : i + 3] = line[j : j + 3]
+
+
+def rgb565(color: int) -> int:
+    """Pack a 0xRRGGBB color into RGB565, the same way `displayio.ColorConverter` does."""
+    return (color >> 8) & 0xF800 | (color >> 5) & 0x07E0 | (color & 0xFF) >> 3
+
+
+def _to_truecolor(  # noqa: PLR0913 Too many arguments in function definition
+    bitmap: BitmapConstructor,
+    width: int,
+    height: int,
+    indices: bytearray,
+    count: int,
+    palette_colors: Dict[int, int],
+) -> RowWriter:
+    """Allocate a RGB565 bitmap and convert the first ``count`` provisional pixels.
+    Complete rows are written to the bitmap, the rest is left in the row of the writer."""
+    colors = [0] * len(palette_colors)  # type: List[int]
+    for color, index in palette_colors.items():
+        colors[index] = rgb565(color)
+    writer = RowWriter(bitmap(width, height, 65536), 65536)
+    row = writer.row
+    for i in range(count):
+        x = i % width
+        row[x] = colors[indices[i]]
+        if x == width - 1:
+            writer.flush(i // width)
+    return writer
+
+
+def _truecolor_converter() -> ColorConverter:
+    from displayio import ColorConverter, Colorspace
+
+    return ColorConverter(input_colorspace=Colorspace.RGB565)
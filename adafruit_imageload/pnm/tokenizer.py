@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_imageload.pnm.tokenizer`
+====================================================
+
+Read the numbers of the header and the ascii pixel data of netpbm files,
+shared by the header parser and the ascii loaders.
+
+"""
+
+try:
+    from array import array
+    from io import BufferedReader
+    from typing import List, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
+
+# Ascii data is read from the file in blocks of this many bytes
+_BLOCK_SIZE = 256
+
+
+class Tokenizer:
+    """
+    Reads the whitespace separated numbers of a netpbm file a block at a time, skipping
+    over ``#`` comments, which run to the end of the line.
+
+    The pixels of P1 images don't have to be separated, so with ``digits`` every digit
+    is a number of its own.
+
+    It also reads like a file, from just after the character that ended the last number,
+    starting with the bytes of the block that were read ahead. The binary pixel data that
+    follows the header is read from the tokenizer of the header that way, so the file
+    does not have to be moved back to where the header ends.
+
+    :param file: The file, from where it is now
+    :param bool digits: Whether each digit is a number
+    :param bytes prefix: Bytes that were already read from the file, which are read first
+    """
+
+    def __init__(
+        self, file: Union[BufferedReader, "Tokenizer"], digits: bool = False, prefix: bytes = b""
+    ) -> None:
+        self.file = file
+        self.digits = digits
+        self._block = bytearray(max(_BLOCK_SIZE, len(prefix)))
+        self._block[0 : len(prefix)] = prefix
+        self._end = len(prefix)
+        self._index = 0
+        self._value = 0
+        self._in_number = False
+        self._comment = False
+
+    def read_numbers(self, values: Union[bytearray, array, List[int]], count: int) -> int:
+        """Read the next ``count`` numbers into ``values``. Returns how many were read,
+        fewer than ``count`` once the end of the file is reached."""
+        block = self._block
+        end = self._end
+        i = self._index
+        value = self._value
+        in_number = self._in_number
+        comment = self._comment
+        digits = self.digits
+        read = 0
+        while read < count:
+            if i == end:
+                end = self.file.readinto(block) or 0
+                i = 0
+                if not end:
+                    if in_number:  # the last number runs to the end of the file
+                        values[read] = value
+                        read += 1
+                        in_number = False
+                    break
+            char = block[i]
+            i += 1
+            if comment:
+                comment = char not in (10, 13)  # a new line ends the comment
+            elif 48 <= char <= 57:  # a digit
+                if digits:
+                    values[read] = char - 48
+                    read += 1
+                else:
+                    value = value * 10 + char - 48
+                    in_number = True
+            else:
+                if in_number:
+                    values[read] = value
+                    read += 1
+                    value = 0
+                    in_number = False
+                comment = char == 35  # "#"
+        self._end = end
+        self._index = i
+        self._value = value
+        self._in_number = in_number
+        self._comment = comment
+        return read
+
+    def readinto(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Read bytes into ``buffer`` like a file, the ones that were read ahead first.
+        Returns how many were read."""
+        count = min(self._end - self._index, len(buffer))
+        if count:
+            buffer[0:count] = memoryview(self._block)[self._index : self._index + count]
+            self._index += count
+        if count < len(buffer):
+            count += self.file.readinto(memoryview(buffer)[count:]) or 0
+        return count
+
+    def read(self, size: int) -> bytes:
+        """Read up to ``size`` bytes like a file."""
+        buffer = bytearray(size)
+        return bytes(memoryview(buffer)[: self.readinto(buffer)])
+
+    def tell(self) -> int:
+        """Where the next byte is read from in the file."""
+        return self.file.tell() - (self._end - self._index)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Move to ``offset`` like a file, dropping the bytes that were read ahead."""
+        if whence == 1:
+            offset -= self._end - self._index
+        position = self.file.seek(offset, whence)
+        self._end = 0
+        self._index = 0
+        return position
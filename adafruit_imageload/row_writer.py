@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_imageload.row_writer`
+====================================================
+
+Write decoded pixel values into a bitmap a row at a time, shared by all of the decoders.
+
+"""
+
+import sys
+from array import array
+
+try:
+    from typing import Iterator, Optional, Tuple, Union
+
+    from displayio import Bitmap, ColorConverter, Palette
+except ImportError:
+    pass
+
+try:
+    from bitmaptools import arrayblit as _arrayblit
+    from displayio import Bitmap as _Bitmap
+except ImportError:
+    _arrayblit = None
+
+if sys.implementation.name != "circuitpython":
+    # Blinka's bitmaptools is pure Python, it sets each pixel in turn anyway
+    _arrayblit = None
+
+from . import Band
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ImageLoad.git"
+
+# The value that transparent pixels of images with an alpha channel are loaded as, when
+# asked to. Opaque pixels of this value are loaded as 0 instead, the color next to it.
+TRANSPARENT_KEY = 1
+
+
+class RowWriter:
+    """
+    Writes rows of pixel values into a bitmap with the fastest method the bitmap supports.
+
+    Decoders put the values of a row in `row` and then `flush` it to the bitmap.
+    A `displayio.Bitmap` is written with `bitmaptools.arrayblit` on CircuitPython.
+    Anything else is written one pixel at a time.
+
+    Rows are flushed in image coordinates. The bitmap can hold just a window of the image,
+    with its top left corner at ``x``, ``y``, and anything outside of it is discarded.
+    With a ``scale`` above 1 the bitmap is that many times smaller than the window, and
+    only every ``scale``-th value of every ``scale``-th row is kept.
+
+    :param Bitmap bitmap: The bitmap to write to
+    :param int colors: The number of values the bitmap was created with
+    :param int x: The column of the image shown in the first column of the bitmap
+    :param int y: The row of the image shown in the first row of the bitmap
+    :param int row_width: The length of `row`, by default the width of the bitmap
+    :param int scale: How many times smaller the bitmap is than the image, 1, 2, 4 or 8
+    """
+
+    def __init__(  # noqa: PLR0913 Too many arguments in function definition
+        self,
+        bitmap: Bitmap,
+        colors: int,
+        x: int = 0,
+        y: int = 0,
+        row_width: Optional[int] = None,
+        scale: int = 1,
+    ) -> None:
+        self.bitmap = bitmap
+        self.width = bitmap.width
+        self.height = bitmap.height
+        self.x = x
+        self.y = y
+        self.scale = scale
+        self._scaled: Optional[Union[bytearray, array]] = None
+        if row_width is None:
+            row_width = self.width
+        self.row: Union[bytearray, array]
+        if colors <= 256:
+            self.row = bytearray(row_width)
+        else:
+            self.row = array("H", bytes(2 * row_width))
+        self._blit = _arrayblit is not None and isinstance(bitmap, _Bitmap)
+
+    def flush(  # noqa: PLR0913 Too many arguments in function definition
+        self,
+        y: int,
+        x: int = 0,
+        count: Optional[int] = None,
+        data: Optional[Union[bytearray, array, memoryview]] = None,
+        step: int = 1,
+        skip: Optional[int] = None,
+    ) -> None:
+        """
+        Write the first ``count`` values of ``data`` to row ``y`` of the image, leaving out
+        any that are outside of the bitmap or dropped by the scale.
+
+        :param int y: The row of the image
+        :param int x: The column of the first value, which may be left of the bitmap, as when
+          ``data`` starts at the first pixel of a byte that holds several
+        :param int count: Number of values to write, by default all of ``data``. A row cut
+          short by the end of the file is written with just the values that were read,
+          the rest of the bitmap row is left as it was
+        :param data: The values, by default `row`. Must hold the same type of values as `row`.
+        :param int step: Columns to move between values, for images stored out of order
+        :param int skip: A value that is not written, leaving the bitmap unchanged
+        """
+        if data is None:
+            data = self.row
+        if count is None:
+            count = len(data)
+        y -= self.y
+        x -= self.x
+        scale = self.scale
+        if scale > 1:
+            if y % scale:
+                return
+            y //= scale
+            if step >= scale:
+                # every value is in a kept column, or none are
+                if x % scale:
+                    return
+                x //= scale
+                step //= scale
+            elif 0 <= y < self.height:
+                data, x, count = self._decimate(data, x, count, step)
+                step = 1
+        if y < 0 or y >= self.height:
+            return
+        if x < 0:
+            first = (step - 1 - x) // step
+            x += first * step
+            count -= first
+            data = memoryview(data)[first:]
+        count = min(count, (self.width - x + step - 1) // step)
+        if count <= 0:
+            return
+        if step == 1 and self._blit:
+            _arrayblit(self.bitmap, data, x, y, x + count, y + 1, skip_index=skip)
+            return
+        bitmap = self.bitmap
+        offset = y * self.width + x
+        if skip is None:
+            for i in range(count):
+                bitmap[offset + i * step] = data[i]
+        else:
+            for i in range(count):
+                value = data[i]
+                if value != skip:
+                    bitmap[offset + i * step] = value
+
+    def keeps(self, y: int) -> bool:
+        """Whether row ``y`` of the image is stored in the bitmap, so decoders can
+        skip converting the values of the rows that are not."""
+        y -= self.y
+        return y >= 0 and y % self.scale == 0 and y // self.scale < self.height
+
+    def area(self, x: int, y: int, width: int, height: int) -> Tuple[int, int, int, int]:
+        """The left, top, right and bottom of the part of the bitmap that shows a
+        rectangle of the image, empty when it is not shown at all."""
+        scale = self.scale
+        # bitmap columns and rows round up, to the first that is inside of the rectangle
+        return (
+            max(0, -((self.x - x) // scale)),
+            max(0, -((self.y - y) // scale)),
+            min(self.width, -((self.x - x - width) // scale)),
+            min(self.height, -((self.y - y - height) // scale)),
+        )
+
+    def _decimate(
+        self, data: Union[bytearray, array, memoryview], x: int, count: int, step: int
+    ) -> Tuple[Union[bytearray, array, memoryview], int, int]:
+        """Copy the values of ``data`` that are in kept columns of the bitmap into a
+        buffer. Returns it with the bitmap column of its first value and its length."""
+        scale = self.scale
+        stride = scale // step
+        if x % step:
+            return data, 0, 0
+        first = (-x // step) % stride
+        x = (x + first * step) // scale
+        count = (count - first + stride - 1) // stride
+        if x < 0:
+            first -= x * stride
+            count += x
+            x = 0
+        count = min(count, self.width - x)
+        if count <= 0:
+            return data, 0, 0
+        scaled = self._scaled
+        if scaled is None or len(scaled) < count:
+            if isinstance(self.row, array):
+                scaled = array("H", bytes(2 * count))
+            else:
+                scaled = bytearray(count)
+            self._scaled = scaled
+        for i in range(count):
+            scaled[i] = data[first + i * stride]
+        return scaled, x, count
+
+
+def scaled_size(size: int, scale: int) -> int:
+    """The number of pixels that ``size`` pixels of an image are reduced to by ``scale``,
+    rounding up so the last pixel is always kept."""
+    if scale not in {1, 2, 4, 8}:
+        raise ValueError("Scale must be 1, 2, 4 or 8")
+    return (size + scale - 1) // scale
+
+
+def kept_rows(y: int, height: int, scale: int, bottom_up: bool = False) -> range:
+    """The rows from ``y`` on of a window ``height`` rows high that are kept by ``scale``,
+    in the order they are stored in the file. With ``bottom_up`` that is the last one first,
+    as in most BMP files."""
+    if bottom_up:
+        return range(y + (height - 1) // scale * scale, y - 1, -scale)
+    return range(y, y + height, scale)
+
+
+def unpack_table(depth: int, mask: Optional[int] = None) -> Tuple[bytes, ...]:
+    """
+    The pixel values packed into each of the 256 byte values, most significant bits first,
+    for a ``depth`` of 1, 2, 4 or 8 bits per pixel. Used by `unpack` to unpack a whole byte
+    at a time, it takes 256 small bytes objects so decoders only keep it while they load.
+    Only the bits of each value in ``mask`` are kept, all of them by default.
+    """
+    if mask is None:
+        mask = (1 << depth) - 1
+    shifts = range(8 - depth, -1, -depth)
+    return tuple(bytes([(byte >> shift) & mask for shift in shifts]) for byte in range(256))
+
+
+def unpack(
+    data: Union[bytes, bytearray, memoryview],
+    values: Union[bytearray, memoryview],
+    count: int,
+    table: Tuple[bytes, ...],
+) -> None:
+    """Unpack the first ``count`` pixels packed into ``data`` into ``values``, one byte
+    per pixel, with a table from `unpack_table`."""
+    pixels_per_byte = len(table[0])
+    unpacked = b"".join([table[byte] for byte in data[: -(-count // pixels_per_byte)]])
+    values[0:count] = memoryview(unpacked)[:count]
+
+
+def crop_window(
+    crop: Optional[Tuple[int, int, Optional[int], Optional[int]]], width: int, height: int
+) -> Tuple[int, int, int, int]:
+    """
+    The x, y, width and height of the part of an image of ``width`` by ``height`` pixels
+    to load, the whole image when ``crop`` is None. A width or height of None in ``crop``
+    extends the window to the edge of the image, and the window is limited to the image.
+    """
+    if crop is None:
+        return 0, 0, width, height
+    x, y, crop_width, crop_height = crop
+    if x < 0 or y < 0:
+        raise ValueError("Crop must start inside the image")
+    right = width if crop_width is None else min(width, x + crop_width)
+    bottom = height if crop_height is None else min(height, y + crop_height)
+    if right <= x or bottom <= y:
+        raise ValueError("Crop is outside of the image")
+    return x, y, right - x, bottom - y
+
+
+def write_bands(
+    rows: Iterator[int],
+    writer: RowWriter,
+    height: int,
+    palette: Optional[Union[Palette, ColorConverter]],
+) -> Iterator[Band]:
+    """
+    Move the bitmap of ``writer`` down (or up) an image of ``height`` rows a band at a time,
+    yielding each band as a `Band` once it is complete.
+
+    ``rows`` is a decoder that yields the number of each row of the image before it writes
+    to it. Bands are as tall as the bitmap and start at a multiple of its height, so rows
+    may come in any order, but a band is yielded as soon as a row outside of it is written.
+    Bands that are skipped over are yielded empty, so every row of the image is covered.
+    The bitmap is cleared between bands, it is reused for all of them.
+    """
+    bitmap = writer.bitmap
+    band_height = writer.height
+    step = band_height
+    top = None
+    for y in rows:
+        if top is not None and top <= y < top + band_height or not 0 <= y < height:
+            continue
+        band = y // band_height * band_height
+        if top is not None:
+            step = band_height if band > top else -band_height
+            while top != band:
+                yield Band(top, min(band_height, height - top), bitmap, palette)
+                bitmap.fill(0)
+                top += step
+        top = band
+        writer.y = top
+    if top is None:
+        top = 0
+    # the last band, and those that were never written to up to the edge of the image
+    while True:
+        yield Band(top, min(band_height, height - top), bitmap, palette)
+        top += step
+        if not 0 <= top < height:
+            break
+        bitmap.fill(0)
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import os
+from io import BytesIO
+from unittest import TestCase
+
+import displayio
+
+from adafruit_imageload import bands, load
+
+from .test_bmp_truecolor_load import make_bmp, rgb565
+from .test_gif_load import image_block, make_gif
+from .test_png_load import make_png
+
+IMAGES = os.path.join(os.path.dirname(__file__), "..", "examples", "images")
+
+
+class TestBands(TestCase):
+    def assert_bands_match(self, bands_, full, rows):
+        """Check the bands cover the whole of ``full`` in order, all but the last ``rows`` tall."""
+        tops = []
+        for band in bands_:
+            tops.append(band.y)
+            self.assertEqual((full.width, rows), (band.bitmap.width, band.bitmap.height))
+            self.assertEqual(min(rows, full.height - band.y), band.height)
+            for y in range(band.height):
+                for x in range(full.width):
+                    self.assertEqual(full[x, band.y + y], band.bitmap[x, y], (x, band.y + y))
+        return tops
+
+    def test_bmp_truecolor(self):
+        pixels = [[(x * 40, y * 30, 255 - x * y) for x in range(6)] for y in range(7)]
+        full, _ = load(make_bmp(6, 7, pixels))
+        tops = self.assert_bands_match(bands(make_bmp(6, 7, pixels), 3), full, 3)
+        # uncompressed rows are read from the top, even when stored bottom up
+        self.assertEqual([0, 3, 6], tops)
+
+    def test_bmp_rle(self):
+        for name in ("4bit_rle.bmp", "8bit_rle.bmp"):
+            path = os.path.join(IMAGES, name)
+            full, palette = load(path)
+            band_palette = next(bands(path, 4)).palette
+            self.assertIsInstance(band_palette, displayio.Palette)
+            self.assertEqual(len(palette), len(band_palette))
+            # compressed rows come in the order they are stored, bottom up
+            self.assertEqual([16, 12, 8, 4, 0], self.assert_bands_match(bands(path, 4), full, 4))
+            tops = self.assert_bands_match(bands(path, 1), full, 1)
+            self.assertEqual(list(range(full.height - 1, -1, -1)), tops)
+
+    def test_pgm(self):
+        data = b"P5 3 5 255\n" + bytes(range(15))
+        full, _ = load(BytesIO(data))
+        tops = self.assert_bands_match(bands(BytesIO(data), 2), full, 2)
+        self.assertEqual([0, 2, 4], tops)
+
+    def test_ppm_truecolor(self):
+        data = b"P6 2 2 255\n" + bytes(range(12))
+        band_list = list(bands(BytesIO(data), 2))
+        self.assertEqual(1, len(band_list))
+        self.assertIsInstance(band_list[0].palette, displayio.ColorConverter)
+        self.assertEqual(rgb565(3, 4, 5), band_list[0].bitmap[1, 0])
+        self.assertEqual(rgb565(9, 10, 11), band_list[0].bitmap[1, 1])
+
+    def test_png(self):
+        rows = [
+            bytearray(b"".join(bytes((x * 20, y * 20, 100)) for x in range(4))) for y in range(9)
+        ]
+        full, _ = load(make_png(4, 9, 2, 8, rows))
+        tops = self.assert_bands_match(bands(make_png(4, 9, 2, 8, rows), 4), full, 4)
+        self.assertEqual([0, 4, 8], tops)
+
+    def test_png_gray_palette(self):
+        rows = [bytearray(x * 30 + y for x in range(5)) for y in range(6)]
+        full, _ = load(make_png(5, 6, 0, 8, rows), gray_palette=True)
+        band_list = bands(make_png(5, 6, 0, 8, rows), 4, gray_palette=True)
+        self.assertEqual([0, 4], self.assert_bands_match(band_list, full, 4))
+        self.assertEqual(31, full[1, 1])
+
+    def test_png_interlaced(self):
+        rows = [bytearray(3)]
+        with self.assertRaises(NotImplementedError):
+            list(bands(make_png(1, 1, 2, 8, rows, interlaced=True)))
+
+    def test_gif(self):
+        with self.assertRaises(NotImplementedError):
+            list(bands(make_gif(1, 1, [image_block(1, 1, [0], 2)])))
@@ -28,13 +28,32 @@
 """
 
 import os
-from unittest import TestCase
+import struct
+from io import BytesIO
+from unittest import TestCase, mock
 
-from adafruit_imageload import load
+from adafruit_imageload import info, load
+from adafruit_imageload.bmp import indexed
 
 from .displayio_shared_bindings import Bitmap_C_Interface, Palette_C_Interface
 
 
+def make_rle_bmp(width, height, depth, data):
+    """Build a bottom up RLE compressed BMP with 16 colors from the encoded ``data``."""
+    compression = 1 if depth == 8 else 2
+    header = struct.pack(
+        "<IiiHHIIiiII", 40, width, height, 1, depth, compression, len(data), 0, 0, 16, 0
+    )
+    start = 14 + len(header) + 16 * 4
+    return BytesIO(
+        b"BM"
+        + struct.pack("<IHHI", start + len(data), 0, 0, start)
+        + header
+        + bytes(range(64))
+        + data
+    )
+
+
 class TestBmpIndexedLoad(TestCase):
     def test_order_bgra_to_rgba(self):
         test_file = os.path.join(os.path.dirname(__file__), "..", "examples", "images", "4bit.bmp")
@@ -61,3 +80,68 @@ class TestBmpIndexedLoad(TestCase):
         self.assertTrue(palette[4] in [b"\x9d\x00\xff\x00", b"\x9d\x00\xff"])
         # uncomment line below to see a string representation of the object
         # self.fail(str(palette))
+
+    def test_crop(self):
+        test_file = os.path.join(os.path.dirname(__file__), "..", "examples", "images", "4bit.bmp")
+        full, _ = load(test_file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        for rle in ("4bit.bmp", "4bit_rle.bmp"):
+            bitmap, _ = load(
+                os.path.join(os.path.dirname(test_file), rle),
+                bitmap=Bitmap_C_Interface,
+                palette=Palette_C_Interface,
+                x=2,
+                y=3,
+                width=10,
+                height=5,
+            )
+            self.assertEqual((10, 5), (bitmap.width, bitmap.height))
+            bitmap.validate()
+            for y in range(5):
+                for x in range(10):
+                    self.assertEqual(full[x + 2, y + 3], bitmap[x, y], (rle, x, y))
+
+    def test_rle8(self):
+        data = bytes(
+            (5, 7, 3, 1, 0, 0)  # a run past the edge of the image
+            + (0, 3, 2, 3, 4, 0, 0, 2, 2, 0, 1, 9, 0, 0)  # a literal, then a delta
+            + (6, 5, 0, 1)
+        )
+        bitmap, _ = load(make_rle_bmp(6, 3, 8, data))
+        self.assertEqual(
+            [[5] * 6, [2, 3, 4, 0, 0, 9], [7, 7, 7, 7, 7, 1]],
+            [[bitmap[x, y] for x in range(6)] for y in range(3)],
+        )
+
+    def test_rle4(self):
+        data = bytes((5, 0xAB, 0, 0, 0, 3, 0x12, 0x30, 2, 0x44, 0, 1))
+        bitmap, _ = load(make_rle_bmp(5, 2, 4, data))
+        self.assertEqual(
+            [[1, 2, 3, 4, 4], [10, 11, 10, 11, 10]],
+            [[bitmap[x, y] for x in range(5)] for y in range(2)],
+        )
+
+    def test_without_readinto(self):
+        images = os.path.join(os.path.dirname(__file__), "..", "examples", "images")
+        for name in ("1bit.bmp", "2bit.bmp", "4bit.bmp", "1bit-not-byte-aligned.bmp"):
+            expected, _ = load(os.path.join(images, name))
+            with mock.patch.object(indexed, "_bitmap_readinto", None):
+                bitmap, _ = load(os.path.join(images, name))
+            self.assertEqual(
+                [expected[i] for i in range(expected.width * expected.height)],
+                [bitmap[i] for i in range(bitmap.width * bitmap.height)],
+                name,
+            )
+
+    def test_top_down(self):
+        # a negative height means the rows are stored from the top down
+        rows = [b"\x01\x02\x03\x00", b"\x04\x05\x06\x00"]
+        for height, data in ((2, rows[1] + rows[0]), (-2, rows[0] + rows[1])):
+            header = struct.pack("<IiiHHIIiiII", 40, 3, height, 1, 8, 0, len(data), 0, 0, 16, 0)
+            start = 14 + len(header) + 16 * 4
+            image = b"BM" + struct.pack("<IHHI", start + len(data), 0, 0, start)
+            image += header + bytes(range(64)) + data
+            for readinto in (indexed._bitmap_readinto, None):
+                with mock.patch.object(indexed, "_bitmap_readinto", readinto):
+                    bitmap, _ = load(BytesIO(image))
+                self.assertEqual([1, 2, 3, 4, 5, 6], [bitmap[i] for i in range(6)], height)
+            self.assertEqual(2, info(BytesIO(image)).height)
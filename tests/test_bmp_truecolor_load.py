@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import struct
+from io import BytesIO
+from unittest import TestCase, mock
+
+import displayio
+
+from adafruit_imageload import load
+from adafruit_imageload.bmp import truecolor
+
+
+def make_bmp(width, height, pixels):
+    """Build a bottom up 24 bit BMP from rows of (red, green, blue) ``pixels``, top row first."""
+    line_size = (width * 3 + 3) // 4 * 4
+    data = b""
+    for row in reversed(pixels):
+        line = b"".join(bytes((blue, green, red)) for red, green, blue in row)
+        data += line + bytes(line_size - len(line))
+    header = struct.pack("<IiiHHIIiiII", 40, width, height, 1, 24, 0, len(data), 0, 0, 0, 0)
+    return BytesIO(b"BM" + struct.pack("<IHHI", 54 + len(data), 0, 0, 54) + header + data)
+
+
+def make_bmp16(width, height, values, masks=None):
+    """Build a bottom up 16 bit BMP from rows of raw pixel ``values``, top row first, with
+    red, green and blue bitfield ``masks`` in a version 3 header when they are given."""
+    line_size = (width * 2 + 3) // 4 * 4
+    data = b""
+    for row in reversed(values):
+        line = struct.pack(f"<{width}H", *row)
+        data += line + bytes(line_size - len(line))
+    header_length = 40 if masks is None else 56
+    header = struct.pack(
+        "<IiiHHIIiiII",
+        header_length,
+        width,
+        height,
+        1,
+        16,
+        0 if masks is None else 3,
+        0,
+        0,
+        0,
+        0,
+        0,
+    )
+    if masks is not None:
+        header += struct.pack("<IIII", *masks, 0)
+    offset = 14 + len(header)
+    return BytesIO(b"BM" + struct.pack("<IHHI", offset + len(data), 0, 0, offset) + header + data)
+
+
+def make_bmp32(width, height, pixels, alpha_mask=None):
+    """Build a bottom up 32 bit BMP from rows of (red, green, blue, alpha) ``pixels``, with
+    BGRA bitfield masks in a version 3 header when an ``alpha_mask`` is given."""
+    data = b"".join(
+        bytes((blue, green, red, alpha))
+        for row in reversed(pixels)
+        for red, green, blue, alpha in row
+    )
+    if alpha_mask is None:
+        header = struct.pack("<IiiHHIIiiII", 40, width, height, 1, 32, 0, len(data), 0, 0, 0, 0)
+    else:
+        header = struct.pack("<IiiHHIIiiII", 56, width, height, 1, 32, 3, len(data), 0, 0, 0, 0)
+        header += struct.pack("<IIII", 0x00FF0000, 0x0000FF00, 0x000000FF, alpha_mask)
+    offset = 14 + len(header)
+    return BytesIO(b"BM" + struct.pack("<IHHI", offset + len(data), 0, 0, offset) + header + data)
+
+
+def rgb565(red, green, blue):
+    return (red & 0xF8) << 8 | (green & 0xFC) << 3 | blue >> 3
+
+
+class TestBmpTruecolorLoad(TestCase):
+    width = 5
+    height = 3
+    pixels = [[(x * 50, y * 100, 200 - x * 40) for x in range(5)] for y in range(3)]
+
+    def test_padded_rows(self):
+        # 5 pixels take 15 bytes, so each row is padded with a byte
+        bitmap, _ = load(make_bmp(self.width, self.height, self.pixels), bitmap=displayio.Bitmap)
+        for y in range(self.height):
+            for x in range(self.width):
+                self.assertEqual(rgb565(*self.pixels[y][x]), bitmap[x, y], (x, y))
+
+    def test_crop(self):
+        bitmap, _ = load(
+            make_bmp(self.width, self.height, self.pixels),
+            bitmap=displayio.Bitmap,
+            x=1,
+            y=1,
+            width=3,
+        )
+        self.assertEqual((3, 2), (bitmap.width, bitmap.height))
+        for y in range(2):
+            for x in range(3):
+                self.assertEqual(rgb565(*self.pixels[y + 1][x + 1]), bitmap[x, y], (x, y))
+
+    def test_16bit(self):
+        values = [[0x7FFF, 0x001F, 0x03E0, 0x7C00], [0x1234, 0x4321, 0x0000, 0x5555]]
+        for masks in (None, (0x7C00, 0x03E0, 0x001F)):
+            bitmap, converter = load(make_bmp16(4, 2, values, masks), bitmap=displayio.Bitmap)
+            # the pixels are loaded as they are, and converted when they are shown
+            self.assertEqual(values, [[bitmap[x, y] for x in range(4)] for y in range(2)])
+            self.assertEqual(0xFFDF, converter.convert(0x7FFF))
+            self.assertEqual(0x07C0, converter.convert(0x03E0))
+
+    def test_16bit_rgb565(self):
+        values = [[0xFFFF, 0xF800, 0x07E0], [0x001F, 0x1234, 0x8421]]
+        masks = (0xF800, 0x07E0, 0x001F)
+        bitmap, converter = load(make_bmp16(3, 2, values, masks), bitmap=displayio.Bitmap)
+        self.assertEqual(0x1234, converter.convert(0x1234))
+        self.assertEqual(values, [[bitmap[x, y] for x in range(3)] for y in range(2)])
+        # the same without bitmaptools.readinto
+        with mock.patch.object(truecolor, "_bitmap_readinto", None):
+            bitmap, _ = load(make_bmp16(3, 2, values, masks), bitmap=displayio.Bitmap)
+        self.assertEqual(values, [[bitmap[x, y] for x in range(3)] for y in range(2)])
+        bitmap, _ = load(make_bmp16(3, 2, values, masks), bitmap=displayio.Bitmap, scale=2)
+        self.assertEqual([[0xFFFF, 0x07E0]], [[bitmap[x, 0] for x in range(2)]])
+
+    def test_16bit_unsupported_masks(self):
+        # RGB444 is refused whether the whole image is read at once or row by row
+        values = [[0x0FFF, 0x0F00], [0x00F0, 0x000F]]
+        masks = (0x0F00, 0x00F0, 0x000F)
+        for window in ({}, {"x": 1, "width": 1}):
+            with self.assertRaises(NotImplementedError):
+                load(make_bmp16(2, 2, values, masks), bitmap=displayio.Bitmap, **window)
+
+    def test_32bit_transparency(self):
+        pixels = [[(255, 255, 255, 255), (255, 255, 255, 0)], [(0, 0, 8, 200), (0, 0, 0, 90)]]
+        bitmap, converter = load(make_bmp32(2, 2, pixels, 0xFF000000), transparency=True)
+        self.assertEqual([0xFFFF, 1, 0, 1], [bitmap[x, y] for y in range(2) for x in range(2)])
+        self.assertEqual(1, converter._transparent_color)
+        # without it the fourth byte is ignored
+        bitmap, converter = load(make_bmp32(2, 2, pixels, 0xFF000000))
+        self.assertEqual([0xFFFF, 0xFFFF, 1, 0], [bitmap[x, y] for y in range(2) for x in range(2)])
+        self.assertIsNone(converter._transparent_color)
+
+    def test_32bit_padding(self):
+        # without an alpha mask the fourth byte is padding, usually 0, and not an alpha
+        pixels = [[(255, 255, 255, 0), (0, 0, 8, 0)]]
+        for alpha_mask in (None, 0):
+            bitmap, converter = load(make_bmp32(2, 1, pixels, alpha_mask), transparency=True)
+            self.assertEqual([0xFFFF, 1], [bitmap[x, 0] for x in range(2)])
+            self.assertIsNone(converter._transparent_color)
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import struct
+from io import BytesIO
+from unittest import TestCase
+
+import displayio
+
+from adafruit_imageload import gif, load
+
+from .displayio_shared_bindings import Bitmap_C_Interface, Palette_C_Interface
+
+
+def lzw_encode(pixels, code_size):
+    """Compress ``pixels`` the way a GIF encoder does, growing codes up to 12 bits."""
+    clear_code = 1 << code_size
+    codes = []
+
+    def reset():
+        return {bytes([i]): i for i in range(clear_code)}, clear_code + 2, code_size + 1
+
+    table, next_code, code_len = reset()
+    out = [(clear_code, code_len)]
+    current = b""
+    for pixel in pixels:
+        extended = current + bytes([pixel])
+        if extended in table:
+            current = extended
+            continue
+        out.append((table[current], code_len))
+        if next_code < 4096:
+            table[extended] = next_code
+            next_code += 1
+            if next_code > 1 << code_len and code_len < 12:
+                code_len += 1
+        else:
+            out.append((clear_code, code_len))
+            table, next_code, code_len = reset()
+        current = bytes([pixel])
+    out.append((table[current], code_len))
+    out.append((clear_code + 1, code_len))
+    bits = 0
+    bit_count = 0
+    for code, length in out:
+        bits |= code << bit_count
+        bit_count += length
+        while bit_count >= 8:
+            codes.append(bits & 0xFF)
+            bits >>= 8
+            bit_count -= 8
+    if bit_count:
+        codes.append(bits)
+    return bytes(codes)
+
+
+def blocks(data):
+    out = b""
+    for start in range(0, len(data), 255):
+        piece = data[start : start + 255]
+        out += bytes([len(piece)]) + piece
+    return out + b"\x00"
+
+
+def image_block(width, height, pixels, code_size, x=0, y=0, flags=0):  # noqa: PLR0913
+    return (
+        b"\x2c"
+        + struct.pack("<HHHHB", x, y, width, height, flags)
+        + bytes([code_size])
+        + blocks(lzw_encode(pixels, code_size))
+    )
+
+
+def control(delay, disposal, transparent_index=None):
+    flags = disposal << 2 | (transparent_index is not None)
+    return b"\x21\xf9\x04" + struct.pack("<BHB", flags, delay, transparent_index or 0) + b"\x00"
+
+
+def make_gif(width, height, frames, colors=4):
+    """Build a GIF with a global palette of ``colors`` grays and the given frame blocks."""
+    bits = max(1, (colors - 1).bit_length())
+    palette = b"".join(bytes((i * 255 // (colors - 1),) * 3) for i in range(1 << bits))
+    header = b"GIF89a" + struct.pack("<HHBBB", width, height, 0x80 | 0x70 | (bits - 1), 0, 0)
+    return BytesIO(header + palette + b"".join(frames) + b"\x3b")
+
+
+class TestGifLoad(TestCase):
+    def test_single_frame(self):
+        width, height = 13, 11
+        pixels = [(x * y + x // 3) % 4 for y in range(height) for x in range(width)]
+        file = make_gif(width, height, [image_block(width, height, pixels, 2)])
+        bitmap, palette = load(file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        self.assertEqual(4, palette.num_colors)
+        self.assertEqual(width, bitmap.width)
+        for y in range(height):
+            for x in range(width):
+                self.assertEqual(pixels[y * width + x], bitmap[x, y], (x, y))
+
+    def test_long_runs_and_table_reset(self):
+        # enough varied data to fill the 4096 entry table and force a clear code
+        width, height = 120, 100
+        pixels = [
+            (x * 7 + y * 13 + (x * y) % 11) % 256 for y in range(height) for x in range(width)
+        ]
+        file = make_gif(width, height, [image_block(width, height, pixels, 8)], colors=256)
+        bitmap, _ = load(file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        for y in range(height):
+            for x in range(width):
+                self.assertEqual(pixels[y * width + x], bitmap[x, y], (x, y))
+
+    def test_extensions_are_skipped(self):
+        width, height = 6, 4
+        pixels = [(x + y) % 2 for y in range(height) for x in range(width)]
+        comment = b"\x21\xfe" + blocks(b"a comment " * 40)
+        control = b"\x21\xf9\x04\x00\x00\x00\x00\x00"
+        file = make_gif(width, height, [comment, control, image_block(width, height, pixels, 2)])
+        bitmap, _ = load(file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        for y in range(height):
+            for x in range(width):
+                self.assertEqual(pixels[y * width + x], bitmap[x, y], (x, y))
+
+    def test_frames(self):
+        file = make_gif(
+            4,
+            4,
+            [
+                control(10, gif.DISPOSAL_PREVIOUS),
+                image_block(4, 4, [1] * 16, 2),
+                control(25, gif.DISPOSAL_BACKGROUND, transparent_index=3),
+                image_block(2, 2, [2, 2, 2, 3], 2, x=1, y=1),
+                image_block(1, 1, [1], 2),
+            ],
+        )
+        canvases = []
+        for frame in gif.frames(file, bitmap=displayio.Bitmap, palette=displayio.Palette):
+            transparent = [frame.palette.is_transparent(i) for i in range(4)]
+            canvases.append(([frame.bitmap[i] for i in range(16)], frame, transparent))
+        self.assertEqual(3, len(canvases))
+
+        pixels, frame, transparent = canvases[0]
+        self.assertEqual([1] * 16, pixels)
+        self.assertEqual(0.1, frame.delay)
+        self.assertEqual(gif.DISPOSAL_PREVIOUS, frame.disposal)
+        self.assertIsNone(frame.transparent_index)
+        self.assertEqual([False] * 4, transparent)
+
+        # the first frame was restored to the empty canvas, the transparent pixel is not drawn
+        pixels, frame, transparent = canvases[1]
+        self.assertEqual([0, 0, 0, 0, 0, 2, 2, 0, 0, 2, 0, 0, 0, 0, 0, 0], pixels)
+        self.assertEqual(0.25, frame.delay)
+        self.assertEqual(3, frame.transparent_index)
+        self.assertEqual([False, False, False, True], transparent)
+
+        # the second frame was cleared to its transparent index
+        pixels, frame, transparent = canvases[2]
+        self.assertEqual([1, 0, 0, 0, 0, 3, 3, 0, 0, 3, 3, 0, 0, 0, 0, 0], pixels)
+        self.assertEqual(0, frame.delay)
+        self.assertEqual(gif.DISPOSAL_UNSPECIFIED, frame.disposal)
+        self.assertEqual([False] * 4, transparent)
+        self.assertIs(canvases[0][1].bitmap, frame.bitmap)
+
+    def test_load_first_frame_only(self):
+        file = make_gif(2, 1, [image_block(2, 1, [1, 2], 2), image_block(2, 1, [3, 3], 2)])
+        bitmap, _ = load(file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        self.assertEqual([1, 2], [bitmap[0, 0], bitmap[1, 0]])
+
+    def test_load_transparent_index(self):
+        file = make_gif(2, 1, [control(0, gif.DISPOSAL_NONE, 2), image_block(2, 1, [1, 2], 2)])
+        _, palette = load(file, bitmap=displayio.Bitmap, palette=displayio.Palette)
+        self.assertEqual([False, False, True, False], [palette.is_transparent(i) for i in range(4)])
+
+    def test_local_palette(self):
+        local = b"\x10\x20\x30\x40\x50\x60"
+        block = image_block(2, 1, [0, 1], 2, flags=0x80)
+        # a local color table of 2 entries goes right after the image descriptor
+        block = block[:10] + local + block[10:]
+        file = make_gif(2, 1, [block])
+        frame = next(gif.frames(file, bitmap=displayio.Bitmap, palette=displayio.Palette))
+        self.assertEqual(2, len(frame.palette))
+        self.assertEqual(0x405060, frame.palette[1])
+
+    def test_interlaced(self):
+        width, height = 3, 11
+        pixels = [(x + y) % 4 for y in range(height) for x in range(width)]
+        order = [0, 8, 4, 2, 6, 10, 1, 3, 5, 7, 9]
+        stored = [pixels[y * width + x] for y in order for x in range(width)]
+        file = make_gif(width, height, [image_block(width, height, stored, 2, flags=0x40)])
+        bitmap, _ = load(file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        for y in range(height):
+            for x in range(width):
+                self.assertEqual(pixels[y * width + x], bitmap[x, y], (x, y))
+
+    def test_frames_crop(self):
+        # the same animation as test_frames, with only the 2x2 pixels in the middle loaded
+        file = make_gif(
+            4,
+            4,
+            [
+                control(10, gif.DISPOSAL_PREVIOUS),
+                image_block(4, 4, [1] * 16, 2),
+                control(25, gif.DISPOSAL_BACKGROUND, transparent_index=3),
+                image_block(2, 2, [2, 2, 2, 3], 2, x=1, y=1),
+                image_block(1, 1, [1], 2),
+            ],
+        )
+        canvases = [
+            [frame.bitmap[i] for i in range(4)]
+            for frame in gif.frames(
+                file, bitmap=displayio.Bitmap, palette=displayio.Palette, crop=(1, 1, 2, 2)
+            )
+        ]
+        self.assertEqual([[1, 1, 1, 1], [2, 2, 2, 0], [3, 3, 3, 3]], canvases)
+
+    def test_load_crop(self):
+        width, height = 13, 11
+        pixels = [(x * y + x // 3) % 4 for y in range(height) for x in range(width)]
+        file = make_gif(width, height, [image_block(width, height, pixels, 2)])
+        bitmap, _ = gif.load(
+            file, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface, crop=(4, 3, 5, None)
+        )
+        self.assertEqual((5, 8), (bitmap.width, bitmap.height))
+        for y in range(8):
+            for x in range(5):
+                self.assertEqual(pixels[(y + 3) * width + x + 4], bitmap[x, y], (x, y))
+
+    def test_frames_scale(self):
+        # a frame cleared to the background, covering only odd columns and rows of the screen
+        file = make_gif(
+            6,
+            4,
+            [
+                control(10, gif.DISPOSAL_BACKGROUND),
+                image_block(6, 4, list(range(4)) * 6, 2),
+                image_block(1, 1, [1], 2, x=1, y=1),
+            ],
+        )
+        canvases = [
+            [frame.bitmap[i] for i in range(6)]
+            for frame in gif.frames(
+                file, bitmap=displayio.Bitmap, palette=displayio.Palette, scale=2
+            )
+        ]
+        self.assertEqual([[0, 2, 0, 0, 2, 0], [0, 0, 0, 0, 0, 0]], canvases)
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import os
+from io import BytesIO
+from unittest import TestCase
+
+from adafruit_imageload import ImageInfo, info
+
+from .test_gif_load import control, image_block, make_gif
+from .test_png_load import make_png
+
+IMAGES = os.path.join(os.path.dirname(__file__), "..", "examples", "images")
+
+
+class TestInfo(TestCase):
+    def test_bmp(self):
+        self.assertEqual(ImageInfo("bmp", 15, 17, 4, 16, 1), info(os.path.join(IMAGES, "4bit.bmp")))
+        self.assertEqual(
+            ImageInfo("bmp", 320, 128, 8, 256, 1), info(os.path.join(IMAGES, "color_wheel_rle.bmp"))
+        )
+
+    def test_pnm(self):
+        self.assertEqual(
+            ImageInfo("pbm", 13, 21, 1, 2, 1),
+            info(os.path.join(IMAGES, "netpbm_p1_mono_ascii.pbm")),
+        )
+        self.assertEqual(
+            ImageInfo("pgm", 8, 8, 8, 256, 1), info(os.path.join(IMAGES, "netpbm_p5_binary.pgm"))
+        )
+        self.assertEqual(
+            ImageInfo("ppm", 16, 16, 24, 0, 1), info(os.path.join(IMAGES, "netpbm_p6_binary.ppm"))
+        )
+
+    def test_pnm_comment(self):
+        self.assertEqual(
+            ImageInfo("pgm", 3, 2, 4, 16, 1), info(BytesIO(b"P2\n# a comment\n3 2\n15\n0 1 2\n"))
+        )
+
+    def test_png(self):
+        self.assertEqual(
+            ImageInfo("png", 100, 69, 32, 0, 1), info(os.path.join(IMAGES, "test_image_rgb.png"))
+        )
+        rows = [bytearray((0x1B,)), bytearray((0xE4,))]
+        palette = b"\x00\x00\x00\x55\x55\x55\xaa\xaa\xaa"
+        self.assertEqual(
+            ImageInfo("png", 4, 2, 2, 3, 1), info(make_png(4, 2, 3, 2, rows, palette=palette))
+        )
+        # grayscale images of less than 8 bits are loaded with a palette
+        self.assertEqual(ImageInfo("png", 4, 2, 2, 4, 1), info(make_png(4, 2, 0, 2, rows)))
+
+    def test_gif_frames(self):
+        pixels = [1, 2, 3, 0]
+        frames = [
+            control(10, 1) + image_block(2, 2, pixels, 2),
+            b"\x21\xfe\x05hello\x00" + image_block(2, 2, pixels, 2),
+            control(10, 2, 0) + image_block(1, 1, [3], 2, x=1, y=1),
+        ]
+        self.assertEqual(ImageInfo("gif", 2, 2, 2, 4, 3), info(make_gif(2, 2, frames)))
+
+    def test_unsupported(self):
+        with self.assertRaises(RuntimeError):
+            info(BytesIO(b"not an image"))
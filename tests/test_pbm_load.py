@@ -32,7 +32,6 @@ from io import BytesIO
 from unittest import TestCase
 
 from adafruit_imageload import pnm
-from adafruit_imageload.pnm.pbm_binary import iterbits, reverse
 
 from .displayio_shared_bindings import Bitmap_C_Interface, Palette_C_Interface
 
@@ -71,6 +70,12 @@ class TestPbmLoad(TestCase):
         self.assertEqual(1, palette.num_colors)
         palette.validate()
 
+    def test_load_p1_packed_with_comments(self):
+        # pixels don't need to be separated, and comments can be anywhere
+        file = BytesIO(b"P1\n# size\n4 2\n1001 # first row\n0\n1 10")
+        bitmap, _ = pnm.load(file, b"P1", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        self.assertEqual([1, 0, 0, 1, 0, 1, 1, 0], [bitmap[i] for i in range(8)])
+
     def test_load_works_p4_in_mem(self):
         file = BytesIO(b"P4\n4 2\n\x5f\x5f")
         bitmap, palette = pnm.load(
@@ -144,17 +149,25 @@ class TestPbmLoad(TestCase):
         self.assertEqual(1, palette.num_colors)
         palette.validate()
 
-    def test_iterbits(self):
-        k = b"k"
-        bits = []
-        for byte in iterbits(k):
-            bits.append(byte)
-        # self.assertEqual([0,1,1,0,1,0,1,1], bits[::-1])
-        self.assertEqual([0, 1, 1, 0, 1, 0, 1, 1], bits)
-
-    def test_reverse(self):
-        # 00110100 to 00101100
-        self.assertEqual(reverse(0x34), 0x2C)
-        self.assertEqual(reverse(0xFF), 0xFF)
-        self.assertEqual(reverse(0x00), 0x00)
-        self.assertEqual(reverse(0x0E), 0x70)
+    def test_load_p4_truncated(self):
+        # the last row is missing, the rows that are there are still loaded
+        file = BytesIO(b"P4\n10 3\n\xa5\x40\xff\xc0")
+        bitmap, _ = pnm.load(file, b"P4", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        self.assertEqual([1, 0, 1, 0, 0, 1, 0, 1, 0, 1], [bitmap[x, 0] for x in range(10)])
+        self.assertEqual([1] * 10, [bitmap[x, 1] for x in range(10)])
+
+    def test_load_p4_crop_and_scale(self):
+        rows = [0xA5C3, 0x0FF0, 0x1234, 0xFFFF]
+        data = b"P4\n16 4\n" + b"".join(row.to_bytes(2, "big") for row in rows)
+        bits = [[(row >> (15 - x)) & 1 for x in range(16)] for row in rows]
+        bitmap, _ = pnm.load(BytesIO(data), b"P4", bitmap=Bitmap_C_Interface, crop=(3, 1, 11, None))
+        self.assertEqual(
+            [bits[y + 1][3:14] for y in range(3)],
+            [[bitmap[x, y] for x in range(11)] for y in range(3)],
+        )
+        bitmap, _ = pnm.load(
+            BytesIO(data), b"P4", bitmap=Bitmap_C_Interface, crop=(5, 0, None, None), scale=2
+        )
+        self.assertEqual(
+            [bits[y][5::2] for y in (0, 2)], [[bitmap[x, y] for x in range(6)] for y in range(2)]
+        )
@@ -28,9 +28,11 @@
 """
 
 import os
-from unittest import TestCase
+from io import BytesIO
+from unittest import TestCase, mock
 
 from adafruit_imageload import pnm
+from adafruit_imageload.pnm.pgm import binary
 
 from .displayio_shared_bindings import Bitmap_C_Interface, Palette_C_Interface
 
@@ -49,12 +51,15 @@ class TestPgmLoad(TestCase):
                 file, b"P2", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface
             )
         self.assertTrue(isinstance(bitmap, Bitmap_C_Interface), bitmap)
-        self.assertEqual(6, bitmap.colors)
+        self.assertEqual(256, bitmap.colors)
         self.assertEqual(8, bitmap.width)
         self.assertEqual(8, bitmap.height)
         bitmap.validate()
-        self.assertEqual(6, palette.num_colors)
+        self.assertEqual(255, bitmap[1, 0])
+        self.assertEqual(203, bitmap[3, 0])
+        self.assertEqual(256, palette.num_colors)
         palette.validate()
+        self.assertEqual(b"\xff\xff\xff", palette[255])
         # self.fail(str(palette))
 
     def test_load_works_p5_binary(self):
@@ -71,10 +76,81 @@ class TestPgmLoad(TestCase):
             )
         self.assertTrue(isinstance(bitmap, Bitmap_C_Interface), bitmap)
 
-        self.assertEqual(8, palette.num_colors)
+        self.assertEqual(256, palette.num_colors)
         palette.validate()
-        self.assertEqual(8, bitmap.colors)
+        self.assertEqual(256, bitmap.colors)
         self.assertEqual(8, bitmap.width)
         self.assertEqual(8, bitmap.height)
         bitmap.validate()
+        self.assertEqual(0xEF, bitmap[1, 0])
         # self.fail(str(bitmap))
+
+    def test_load_p2_comments_across_blocks(self):
+        # the pixel data is read in blocks, numbers and comments can run across them
+        pixels = [(i * 7) % 256 for i in range(150)]
+        data = b" ".join(
+            b"%d # pixel %d\n" % (p, i) if i % 20 == 0 else b"%d" % p for i, p in enumerate(pixels)
+        )
+        file = BytesIO(b"P2\n# a comment\n15 10 255\n" + data)
+        bitmap, _ = pnm.load(file, b"P2", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        self.assertEqual(pixels, [bitmap[i] for i in range(150)])
+
+    def test_load_p5_header_comment(self):
+        # the binary data starts right after the header, even though it is read in blocks
+        file = BytesIO(b"P5 #size\n2 1\n# max\n255\n" + b"\x31\x0a" + bytes(300))
+        bitmap, _ = pnm.load(file, b"P5", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface)
+        self.assertEqual([0x31, 0x0A], [bitmap[0], bitmap[1]])
+
+    def test_load_p5_non_seekable(self):
+        # the size of the file can't be checked, so it is read row by row
+        class NoSeek(BytesIO):
+            def seek(self, *args):
+                raise OSError("not seekable")
+
+        bitmap, _ = binary.load(NoSeek(bytes(range(6))), 3, 2, bitmap=Bitmap_C_Interface)
+        self.assertEqual([0, 1, 2, 3, 4, 5], [bitmap[i] for i in range(6)])
+
+    def test_load_p5_read_ahead(self):
+        # the header is read in a block with the start of the pixels, which are taken from
+        # that block rather than by moving the file back
+        class Seeks(BytesIO):
+            def __init__(self, data):
+                super().__init__(data)
+                self.seeks = []
+
+            def seek(self, *args):
+                self.seeks.append(args)
+                return super().seek(*args)
+
+        pixels = bytes(i % 251 for i in range(400))
+        file = Seeks(b"P5 20 20 255\n" + pixels)
+        with mock.patch.object(binary, "_bitmap_readinto", None):
+            bitmap, _ = pnm.load(file, b"P5", bitmap=Bitmap_C_Interface)
+        self.assertEqual([(2,)], file.seeks)
+        self.assertEqual(list(pixels), [bitmap[i] for i in range(400)])
+
+    def test_load_p5_maxval_scales_palette(self):
+        file = BytesIO(b"P5 2 1 15\n\x00\x0f")
+        bitmap, palette = pnm.load(
+            file, b"P5", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface
+        )
+        self.assertEqual(16, bitmap.colors)
+        self.assertEqual(16, palette.num_colors)
+        palette.validate()
+        self.assertEqual(15, bitmap[1, 0])
+        self.assertEqual(b"\xff\xff\xff", palette[15])
+        self.assertEqual(b"\x88\x88\x88", palette[8])
+
+    def test_load_p5_crop(self):
+        pixels = bytes(range(20))
+        for magic, data in ((b"P5", pixels), (b"P2", b" ".join(b"%d" % p for p in pixels))):
+            file = BytesIO(magic + b" 5 4 19\n" + data)
+            bitmap, _ = pnm.load(
+                file,
+                magic,
+                bitmap=Bitmap_C_Interface,
+                palette=Palette_C_Interface,
+                crop=(1, 2, 3, 2),
+            )
+            self.assertEqual((3, 2), (bitmap.width, bitmap.height))
+            self.assertEqual([11, 12, 13, 16, 17, 18], [bitmap[i] for i in range(6)])
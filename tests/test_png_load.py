@@ -1,9 +1,95 @@
 # SPDX-FileCopyrightText: 2025 Tim Cocks for Adafruit Industries
 # SPDX-License-Identifier: MIT
 
-from unittest import TestCase
+import struct
+import zlib
+from io import BytesIO
+from unittest import TestCase, mock
 
-from adafruit_imageload import load
+import displayio
+
+from adafruit_imageload import load, png
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    if pb <= pc:
+        return b
+    return c
+
+
+def _filter_row(filter_, row, prev, unit):
+    out = bytearray()
+    for i, byte in enumerate(row):
+        a = row[i - unit] if i >= unit else 0
+        b = prev[i]
+        c = prev[i - unit] if i >= unit else 0
+        predictor = (0, a, b, (a + b) // 2, _paeth(a, b, c))[filter_]
+        out.append((byte - predictor) & 0xFF)
+    return out
+
+
+def _chunk(kind, data):
+    return struct.pack(">I4s", len(data), kind) + data + b"\x00\x00\x00\x00"
+
+
+ADAM7 = (
+    (0, 0, 8, 8),
+    (4, 0, 8, 8),
+    (0, 4, 4, 8),
+    (2, 0, 4, 4),
+    (0, 2, 2, 4),
+    (1, 0, 2, 2),
+    (0, 1, 1, 2),
+)
+
+
+def _filter_rows(rows, unit):
+    raw = bytearray()
+    prev = bytearray(len(rows[0]))
+    for y, row in enumerate(rows):
+        raw.append(y % 5)
+        raw.extend(_filter_row(y % 5, row, prev, unit))
+        prev = row
+    return raw
+
+
+def make_png(  # noqa: PLR0913
+    width, height, mode, depth, rows, palette=None, idat_size=None, interlaced=False
+):
+    """Encode ``rows`` of raw scanline bytes, cycling through all five filter types.
+    Interlacing is only supported for 8 bit depths."""
+    unit = max(1, depth * (1, 0, 3, 1, 2, 0, 4)[mode] // 8)
+    if interlaced:
+        raw = bytearray()
+        for x0, y0, dx, dy in ADAM7:
+            sub_rows = [
+                bytearray(
+                    b"".join(rows[y][x * unit : x * unit + unit] for x in range(x0, width, dx))
+                )
+                for y in range(y0, height, dy)
+            ]
+            if sub_rows and sub_rows[0]:
+                raw.extend(_filter_rows(sub_rows, unit))
+    else:
+        raw = _filter_rows(rows, unit)
+    png = b"\x89PNG\r\n\x1a\n"
+    png += _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, depth, mode, 0, 0, interlaced))
+    if palette:
+        png += _chunk(b"PLTE", palette)
+    data = zlib.compress(bytes(raw))
+    idat_size = idat_size or len(data)
+    for start in range(0, len(data), idat_size):
+        png += _chunk(b"IDAT", data[start : start + idat_size])
+    png += _chunk(b"IEND", b"")
+    return BytesIO(png)
+
+
+def rgb565(red, green, blue):
+    return (red & 0xF8) << 8 | (green & 0xFC) << 3 | blue >> 3
 
 
 class TestPngLoad(TestCase):
@@ -22,3 +108,204 @@ class TestPngLoad(TestCase):
         self.assertEqual(img[1, 3], 2)
         self.assertEqual(img[2, 3], 1)
         self.assertEqual(img[3, 3], 0)
+
+    def test_rgb_all_filters(self):
+        width, height = 7, 10
+        pixels = [
+            [
+                ((x * 37 + y * 11) & 0xFF, (x * y * 5) & 0xFF, (200 - x * 9 + y) & 0xFF)
+                for x in range(width)
+            ]
+            for y in range(height)
+        ]
+        rows = [bytearray(b"".join(bytes(p) for p in row)) for row in pixels]
+        img, _ = load(make_png(width, height, 2, 8, rows))
+        for y in range(height):
+            for x in range(width):
+                self.assertEqual(img[x, y], rgb565(*pixels[y][x]), (x, y))
+
+    def test_grayscale_alpha_all_filters(self):
+        width, height = 9, 5
+        grays = [[(x * 29 + y * 53) & 0xFF for x in range(width)] for y in range(height)]
+        rows = [bytearray(b"".join(bytes((g, 0x80)) for g in row)) for row in grays]
+        img, _ = load(make_png(width, height, 4, 8, rows))
+        for y in range(height):
+            for x in range(width):
+                gray = grays[y][x]
+                self.assertEqual(img[x, y], rgb565(gray, gray, gray), (x, y))
+
+    def test_split_idat_chunks(self):
+        width, height = 31, 12
+        pixels = [[(x ^ y) * 7 & 0xFF for x in range(width)] for y in range(height)]
+        rows = [bytearray(b"".join(bytes((p, 255 - p, p >> 1)) for p in row)) for row in pixels]
+        img, _ = load(make_png(width, height, 2, 8, rows, idat_size=7))
+        for y in range(height):
+            for x in range(width):
+                p = pixels[y][x]
+                self.assertEqual(img[x, y], rgb565(p, 255 - p, p >> 1), (x, y))
+
+    def test_without_decompressobj(self):
+        # as on CircuitPython, the whole of the image data is decompressed at once
+        class NoDecompressObj:
+            decompress = staticmethod(zlib.decompress)
+
+        rows = [bytearray((y * 50, 255 - y * 40, 7, y, 9, 100)) for y in range(5)]
+        expected, _ = load(make_png(2, 5, 2, 8, rows, idat_size=3))
+        with mock.patch.object(png, "zlib", NoDecompressObj):
+            img, _ = load(make_png(2, 5, 2, 8, rows, idat_size=3))
+        self.assertEqual([expected[i] for i in range(10)], [img[i] for i in range(10)])
+
+    def test_interlaced(self):
+        for width, height in ((1, 1), (3, 2), (13, 9), (17, 21)):
+            pixels = [[((x * 31) ^ (y * 17)) & 0xFF for x in range(width)] for y in range(height)]
+            rows = [bytearray(b"".join(bytes((p, p, 255 - p)) for p in row)) for row in pixels]
+            img, _ = load(make_png(width, height, 2, 8, rows, interlaced=True))
+            for y in range(height):
+                for x in range(width):
+                    p = pixels[y][x]
+                    self.assertEqual(img[x, y], rgb565(p, p, 255 - p), (width, height, x, y))
+
+    def test_interlaced_pass_callback(self):
+        width, height = 10, 10
+        rows = [bytearray((x + y * width) % 4 for x in range(width)) for y in range(height)]
+        palette = b"\x00\x00\x00\x50\x50\x50\xa0\xa0\xa0\xff\xff\xff"
+        snapshots = []
+
+        def progress(bitmap, pal, number):
+            snapshots.append(
+                (number, pal, [bitmap[x, y] for y in range(height) for x in range(width)])
+            )
+
+        img, pal = png.load(
+            make_png(width, height, 3, 8, rows, palette=palette, interlaced=True),
+            bitmap=displayio.Bitmap,
+            palette=displayio.Palette,
+            pass_callback=progress,
+        )
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7], [number for number, _, _ in snapshots])
+        self.assertIs(pal, snapshots[0][1])
+        # after the first pass the top left pixel stands for its whole 8x8 block
+        first = snapshots[0][2]
+        self.assertEqual([rows[0][0]] * 8, first[7 * width : 7 * width + 8])
+        self.assertEqual(
+            [rows[y][x] for y in range(height) for x in range(width)], snapshots[-1][2]
+        )
+
+    def test_crop(self):
+        width, height = 17, 21
+        pixels = [[((x * 31) ^ (y * 17)) & 0xFF for x in range(width)] for y in range(height)]
+        rows = [bytearray(b"".join(bytes((p, p, 255 - p)) for p in row)) for row in pixels]
+        for interlaced in (False, True):
+            file = make_png(width, height, 2, 8, rows, interlaced=interlaced)
+            img, _ = load(file, x=3, y=5, width=9, height=40)
+            self.assertEqual((9, 16), (img.width, img.height))
+            for y in range(16):
+                for x in range(9):
+                    p = pixels[y + 5][x + 3]
+                    self.assertEqual(img[x, y], rgb565(p, p, 255 - p), (interlaced, x, y))
+
+    def test_crop_outside_image(self):
+        rows = [bytearray(3)]
+        with self.assertRaises(ValueError):
+            load(make_png(1, 1, 2, 8, rows), x=1)
+
+    def test_scale(self):
+        width, height = 13, 10
+        pixels = [[(x * 19 + y * 7) & 0xFF for x in range(width)] for y in range(height)]
+        rows = [bytearray(b"".join(bytes((p, p, 255 - p)) for p in row)) for row in pixels]
+        for interlaced in (False, True):
+            img, _ = load(make_png(width, height, 2, 8, rows, interlaced=interlaced), scale=4)
+            self.assertEqual((4, 3), (img.width, img.height))
+            for y in range(3):
+                for x in range(4):
+                    p = pixels[y * 4][x * 4]
+                    self.assertEqual(img[x, y], rgb565(p, p, 255 - p), (interlaced, x, y))
+
+    def test_indexed_depths(self):
+        width, height = 11, 6
+        for depth in (1, 2, 4, 8):
+            colors = 1 << depth
+            indices = [[(x * 5 + y * 3) % colors for x in range(width)] for y in range(height)]
+            per_byte = 8 // depth
+            rows = []
+            for row in indices:
+                packed = bytearray((width * depth + 7) // 8)
+                for x, index in enumerate(row):
+                    packed[x // per_byte] |= index << (8 - depth - x % per_byte * depth)
+                rows.append(packed)
+            palette = bytes(i & 0xFF for i in range(3 * colors))
+            img, _ = load(make_png(width, height, 3, depth, rows, palette=palette), x=2, scale=2)
+            self.assertEqual((5, 3), (img.width, img.height))
+            for y in range(3):
+                for x in range(5):
+                    self.assertEqual(indices[y * 2][x * 2 + 2], img[x, y], (depth, x, y))
+
+    def test_16bit(self):
+        width, height = 6, 4
+        pixels = [
+            [(x * 40 + y, y * 60 + x, 250 - x * 30) for x in range(width)] for y in range(height)
+        ]
+        for mode, samples in ((2, 3), (6, 4)):
+            # each sample is stored as two bytes, the low one different from the high one
+            rows = [
+                bytearray(
+                    b"".join(bytes((c, c ^ 0x5A)) for p in row for c in (p + (0x80,))[:samples])
+                )
+                for row in pixels
+            ]
+            img, _ = load(make_png(width, height, mode, 16, rows))
+            for y in range(height):
+                for x in range(width):
+                    self.assertEqual(img[x, y], rgb565(*pixels[y][x]), (mode, x, y))
+        for mode, samples in ((0, 1), (4, 2)):
+            rows = [
+                bytearray(b"".join(bytes((p[0], 0x33) * samples) for p in row)) for row in pixels
+            ]
+            img, _ = load(make_png(width, height, mode, 16, rows))
+            for y in range(height):
+                for x in range(width):
+                    gray = pixels[y][x][0]
+                    self.assertEqual(img[x, y], rgb565(gray, gray, gray), (mode, x, y))
+
+    def test_low_bit_grayscale(self):
+        # 2 bit gray levels are loaded with a palette of 4 grays
+        rows = [bytearray((0x1B, 0xC0)), bytearray((0xE4, 0x40))]
+        img, palette = load(make_png(5, 2, 0, 2, rows))
+        self.assertEqual((5, 2, 4), (img.width, img.height, len(palette)))
+        self.assertEqual([0, 1, 2, 3, 3], [img[x, 0] for x in range(5)])
+        self.assertEqual([3, 2, 1, 0, 1], [img[x, 1] for x in range(5)])
+        self.assertEqual([0x000000, 0x555555, 0xAAAAAA, 0xFFFFFF], [palette[i] for i in range(4)])
+
+    def test_unsupported_depth(self):
+        with self.assertRaises(ValueError):
+            load(make_png(1, 1, 2, 4, [bytearray(2)]))
+
+    def test_gray_palette(self):
+        width, height = 7, 5
+        grays = [[(x * 37 + y * 11) & 0xFF for x in range(width)] for y in range(height)]
+        for mode, depth, sample in ((0, 8, 1), (4, 8, 2), (0, 16, 2), (4, 16, 4)):
+            rows = [bytearray(b"".join(bytes((g,) * sample) for g in row)) for row in grays]
+            img, palette = load(make_png(width, height, mode, depth, rows), gray_palette=True)
+            self.assertIsInstance(palette, displayio.Palette)
+            self.assertEqual(256, len(palette))
+            self.assertEqual(0x252525, palette[0x25])
+            self.assertEqual(grays, [[img[x, y] for x in range(width)] for y in range(height)])
+        rows = [bytearray(row) for row in grays]
+        img, _ = load(make_png(width, height, 0, 8, rows), gray_palette=True, scale=2)
+        self.assertEqual((4, 3), (img.width, img.height))
+        self.assertEqual(grays[2][4], img[2, 1])
+
+    def test_transparency(self):
+        # the last pixel is opaque, but has the value transparent ones are loaded as
+        pixels = [(255, 0, 0, 255), (0, 0, 255, 0), (10, 20, 30, 127), (0, 0, 8, 128)]
+        rows = [bytearray(b"".join(bytes(p) for p in pixels))]
+        img, converter = load(make_png(4, 1, 6, 8, rows), transparency=True)
+        self.assertEqual([0xF800, 1, 1, 0], [img[x, 0] for x in range(4)])
+        self.assertEqual(1, converter._transparent_color)
+        img, _ = load(make_png(4, 1, 6, 8, rows))
+        self.assertEqual(rgb565(10, 20, 30), img[2, 0])
+        # gray levels with alpha, loaded into a palette
+        rows = [bytearray((1, 255, 200, 0, 7, 200))]
+        img, palette = load(make_png(3, 1, 4, 8, rows), gray_palette=True, transparency=True)
+        self.assertEqual([0, 1, 7], [img[x, 0] for x in range(3)])
+        self.assertTrue(palette.is_transparent(1))
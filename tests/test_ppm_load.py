@@ -31,7 +31,11 @@ import os
 from io import BytesIO
 from unittest import TestCase
 
+import displayio
+
+import adafruit_imageload
 from adafruit_imageload import pnm
+from adafruit_imageload.pnm import ppm_binary
 from adafruit_imageload.pnm.ppm_ascii import read_three_colors
 
 from .displayio_shared_bindings import Bitmap_C_Interface, Palette_C_Interface
@@ -81,6 +85,72 @@ class TestPpmLoad(TestCase):
         self.assertEqual(16, bitmap.height)
         bitmap.validate()
 
+    def test_load_p6_binary_palette_indices(self):
+        # 3x1 image: red, green, red
+        file = BytesIO(b"P6 3 1 255\n\xff\x00\x00\x00\xff\x00\xff\x00\x00")
+        bitmap, palette = pnm.load(
+            file, b"P6", bitmap=Bitmap_C_Interface, palette=Palette_C_Interface
+        )
+        self.assertEqual(2, palette.num_colors)
+        palette.validate()
+        self.assertEqual(b"\xff\x00\x00", palette[bitmap[0, 0]])
+        self.assertEqual(b"\x00\xff\x00", palette[bitmap[1, 0]])
+        self.assertEqual(bitmap[0, 0], bitmap[2, 0])
+
+    def test_load_p6_binary_too_many_colors(self):
+        width = 300
+        pixels = b"".join(bytes((x & 0xFF, x >> 8, 0x80)) for x in range(width))
+        file = BytesIO(b"P6 %d 1 255\n" % width + pixels)
+        bitmap, converter = pnm.load(
+            file, b"P6", bitmap=displayio.Bitmap, palette=displayio.Palette
+        )
+        self.assertIsInstance(converter, displayio.ColorConverter)
+        self.assertEqual(width, bitmap.width)
+        self.assertEqual(0x0010, bitmap[0, 0])  # 0x000080 as RGB565
+        self.assertEqual(0xF810, bitmap[0xFF, 0])  # 0xFF0080 as RGB565
+
+    def test_load_p6_binary_non_seekable(self):
+        class NoSeek(BytesIO):
+            def seek(self, *args):
+                raise OSError("not seekable")
+
+        file = NoSeek(b"\xff\x00\x00\x00\xff\x00\xff\x00\x00")
+        bitmap, palette = ppm_binary.load(
+            file, 3, 1, bitmap=Bitmap_C_Interface, palette=Palette_C_Interface
+        )
+        self.assertEqual(2, palette.num_colors)
+        self.assertEqual([0, 1, 0], [bitmap[x, 0] for x in range(3)])
+
+    def test_load_stream(self):
+        # netpbm files are loaded from streams that can't seek or tell, through load and bands
+        class Stream(BytesIO):
+            def seek(self, *args):
+                raise OSError("not seekable")
+
+            def tell(self):
+                raise OSError("not seekable")
+
+        images = {
+            b"P1": b"P1\n# comment\n3 2\n1 0 1\n0 1 1\n",
+            b"P2": b"P2 3 2 9\n0 3 9 # comment\n1 2 8\n",
+            b"P3": b"P3 2 2 255\n255 0 0 0 255 0\n0 0 255 255 0 0\n",
+            b"P4": b"P4 10 2\n\xa5\x40\xff\xc0",
+            b"P5": b"P5 3 2 255\n\x00\x40\xff\x10\x20\x30",
+            b"P6": b"P6 2 1 255\n\xff\x00\x00\x00\x00\xff",
+        }
+        for magic, data in images.items():
+            expected, _ = adafruit_imageload.load(BytesIO(data))
+            size = expected.width * expected.height
+            bitmap, _ = adafruit_imageload.load(Stream(data))
+            self.assertEqual([expected[i] for i in range(size)], [bitmap[i] for i in range(size)])
+            # color images are loaded in bands as RGB565
+            expected = next(adafruit_imageload.bands(BytesIO(data), expected.height)).bitmap
+            band = next(adafruit_imageload.bands(Stream(data), expected.height))
+            self.assertEqual(
+                [expected[i] for i in range(size)], [band.bitmap[i] for i in range(size)]
+            )
+            self.assertEqual(expected.width, adafruit_imageload.info(Stream(data)).width, magic)
+
     def test_load_three_colors_tail(self):
         buffer = BytesIO(b"211 222 233")
         for i in read_three_colors(buffer):
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+from array import array
+from unittest import TestCase, mock
+
+import displayio
+
+from adafruit_imageload import row_writer
+from adafruit_imageload.row_writer import RowWriter
+
+from .displayio_shared_bindings import Bitmap_C_Interface
+
+
+class TestRowWriter(TestCase):
+    def test_per_pixel(self):
+        # Blinka's bitmaps are written a pixel at a time, arrayblit is only used on CircuitPython
+        bitmap = displayio.Bitmap(5, 2, 16)
+        writer = RowWriter(bitmap, 16)
+        self.assertFalse(writer._blit)
+        self.assertIsInstance(writer.row, bytearray)
+        writer.row[0:5] = b"\x01\x02\x03\x04\x05"
+        writer.flush(0)
+        writer.flush(1, 1, 2)
+        self.assertEqual([1, 2, 3, 4, 5], [bitmap[x, 0] for x in range(5)])
+        self.assertEqual([0, 1, 2, 0, 0], [bitmap[x, 1] for x in range(5)])
+
+    def test_per_pixel_16bit(self):
+        bitmap = displayio.Bitmap(3, 1, 65536)
+        writer = RowWriter(bitmap, 65536)
+        self.assertIsInstance(writer.row, array)
+        writer.row[0:3] = array("H", (0x1234, 0xFFFF, 0x0001))
+        writer.flush(0)
+        self.assertEqual([0x1234, 0xFFFF, 0x0001], [bitmap[x, 0] for x in range(3)])
+
+    def test_step_and_skip(self):
+        bitmap = displayio.Bitmap(6, 1, 16)
+        writer = RowWriter(bitmap, 16)
+        writer.flush(0, 1, data=b"\x07\x03\x07", step=2, skip=3)
+        self.assertEqual([0, 7, 0, 0, 0, 7], [bitmap[x, 0] for x in range(6)])
+
+    def test_arrayblit(self):
+        bitmap = Bitmap_C_Interface(4, 2, 16)
+        calls = []
+        with mock.patch.object(row_writer, "_Bitmap", Bitmap_C_Interface, create=True):
+            with mock.patch.object(
+                row_writer, "_arrayblit", lambda *args, **kwargs: calls.append((args, kwargs))
+            ):
+                writer = RowWriter(bitmap, 16)
+                writer.flush(1, 1, 2, skip=0)
+        self.assertEqual([((bitmap, writer.row, 1, 1, 3, 2), {"skip_index": 0})], calls)
+
+    def test_window(self):
+        # the bitmap shows columns 2 to 4 and row 1 of the image
+        bitmap = displayio.Bitmap(3, 1, 16)
+        writer = RowWriter(bitmap, 16, 2, 1, 6)
+        writer.row[0:6] = b"\x01\x02\x03\x04\x05\x06"
+        writer.flush(0)
+        writer.flush(2)
+        self.assertEqual([0, 0, 0], [bitmap[x, 0] for x in range(3)])
+        writer.flush(1)
+        self.assertEqual([3, 4, 5], [bitmap[x, 0] for x in range(3)])
+        # image columns 1, 3, 5 and 7, of which only 3 is in the bitmap
+        writer.flush(1, 1, data=b"\x07\x08\x09\x0a", step=2)
+        self.assertEqual([3, 8, 5], [bitmap[x, 0] for x in range(3)])
+
+    def test_crop_window(self):
+        self.assertEqual((0, 0, 10, 5), row_writer.crop_window(None, 10, 5))
+        self.assertEqual((2, 1, 8, 3), row_writer.crop_window((2, 1, None, 3), 10, 5))
+        self.assertEqual((9, 4, 1, 1), row_writer.crop_window((9, 4, 100, 100), 10, 5))
+        with self.assertRaises(ValueError):
+            row_writer.crop_window((-1, 0, 1, 1), 10, 5)
+        with self.assertRaises(ValueError):
+            row_writer.crop_window((10, 0, None, None), 10, 5)
+        with self.assertRaises(ValueError):
+            row_writer.crop_window((0, 0, 0, 5), 10, 5)
+
+    def test_scale(self):
+        bitmap = displayio.Bitmap(3, 2, 16)
+        writer = RowWriter(bitmap, 16, 1, 0, 6, scale=2)
+        writer.row[0:6] = b"\x01\x02\x03\x04\x05\x06"
+        writer.flush(0)
+        writer.flush(1)  # dropped by the scale
+        writer.flush(2, 1, 3, data=b"\x07\x08\x09", step=2)
+        self.assertEqual([2, 4, 6], [bitmap[x, 0] for x in range(3)])
+        self.assertEqual([7, 8, 9], [bitmap[x, 1] for x in range(3)])
+        self.assertTrue(writer.keeps(2))
+        self.assertFalse(writer.keeps(3))
+        self.assertFalse(writer.keeps(4))
+
+    def test_scale_area(self):
+        writer = RowWriter(displayio.Bitmap(5, 5, 2), 2, 2, 2, scale=4)
+        # image columns 2, 6, 10, 14 and 18 are in the bitmap
+        self.assertEqual((1, 0, 3, 1), writer.area(5, 0, 7, 3))
+        self.assertEqual((0, 0, 5, 5), writer.area(0, 0, 100, 100))
+
+    def test_scaled_size(self):
+        self.assertEqual(3, row_writer.scaled_size(9, 4))
+        self.assertEqual(9, row_writer.scaled_size(9, 1))
+        with self.assertRaises(ValueError):
+            row_writer.scaled_size(9, 3)
+
+    def test_kept_rows(self):
+        self.assertEqual([3, 5, 7], list(row_writer.kept_rows(3, 6, 2)))
+        self.assertEqual([7, 5, 3], list(row_writer.kept_rows(3, 6, 2, bottom_up=True)))
+        self.assertEqual([2, 1], list(row_writer.kept_rows(1, 2, 1, bottom_up=True)))
+
+    def test_unpack(self):
+        table = row_writer.unpack_table(2)
+        self.assertEqual(b"\x00\x01\x02\x03", table[0x1B])
+        values = bytearray(8)
+        row_writer.unpack(b"\x1b\xe4\xff", values, 6, table)
+        self.assertEqual(b"\x00\x01\x02\x03\x03\x02\x00\x00", values)
+        values = bytearray(8)
+        row_writer.unpack(b"\xa5", values, 8, row_writer.unpack_table(1))
+        self.assertEqual(b"\x01\x00\x01\x00\x00\x01\x00\x01", values)
+
+    def test_write_bands(self):
+        writer = RowWriter(displayio.Bitmap(2, 2, 4), 4)
+
+        def decoder():
+            # rows 2 to 5 are skipped over, as by a delta in an RLE bitmap
+            for y in (0, 1, 6):
+                yield y
+                writer.row[0:2] = bytes((y % 4, 3))
+                writer.flush(y)
+
+        bands = [
+            (band.y, band.height, [band.bitmap[i] for i in range(4)])
+            for band in row_writer.write_bands(decoder(), writer, 9, None)
+        ]
+        self.assertEqual(
+            [
+                (0, 2, [0, 3, 1, 3]),
+                (2, 2, [0, 0, 0, 0]),
+                (4, 2, [0, 0, 0, 0]),
+                (6, 2, [2, 3, 0, 0]),
+                (8, 1, [0, 0, 0, 0]),
+            ],
+            bands,
+        )